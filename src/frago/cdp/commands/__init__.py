@@ -14,6 +14,11 @@ from .wait import WaitCommands
 from .zoom import ZoomCommands
 from .status import StatusCommands
 from .visual_effects import VisualEffectsCommands
+from .state import StateCommands
+from .emulation import EmulationCommands
+from .download import DownloadCommands
+from .prefetch import PrefetchCommands
+from .performance import PerformanceCommands
 
 __all__ = [
     "PageCommands",
@@ -26,4 +31,9 @@ __all__ = [
     "ZoomCommands",
     "StatusCommands",
     "VisualEffectsCommands",
+    "StateCommands",
+    "EmulationCommands",
+    "DownloadCommands",
+    "PrefetchCommands",
+    "PerformanceCommands",
 ]
\ No newline at end of file
@@ -12,13 +12,40 @@ import time
 import signal
 import platform
 import shutil
+import tempfile
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 import psutil
 import requests
 
 
+# Profile modes
+PROFILE_PERSISTENT = "persistent"
+PROFILE_EPHEMERAL = "ephemeral"
+
+# Prefix of ephemeral profile directories, used to recognize them on cleanup
+EPHEMERAL_PROFILE_PREFIX = "frago_chrome_ephemeral_"
+
+# Minimal flag set for unattended headless runs: skip everything that costs
+# startup time or memory without contributing to page automation
+LIGHTWEIGHT_FLAGS = [
+    "--disable-extensions",
+    "--disable-component-extensions-with-background-pages",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-breakpad",
+    "--disable-domain-reliability",
+    "--metrics-recording-only",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--no-pings",
+    "--mute-audio",
+]
+
+
 class ChromeLauncher:
     """Chrome CDP launcher"""
 
@@ -31,6 +58,7 @@ class ChromeLauncher:
         height: int = 960,
         profile_dir: Optional[Path] = None,
         use_port_suffix: bool = False,
+        profile: str = PROFILE_PERSISTENT,
     ):
         self.system = platform.system()
         self.chrome_path = self._find_chrome()
@@ -40,9 +68,13 @@ class ChromeLauncher:
         self.headless = headless
         self.void = void
         self.chrome_process: Optional[subprocess.Popen] = None
+        self.profile = profile
 
-        # Profile directory: use specified one first, otherwise use default location
-        if profile_dir:
+        # Profile directory: ephemeral profiles are created under the tmpfs root at
+        # launch time, otherwise use specified one first, then default location
+        if profile == PROFILE_EPHEMERAL:
+            self.profile_dir = self._get_ephemeral_root()
+        elif profile_dir:
             self.profile_dir = Path(profile_dir)
         elif use_port_suffix:
             # For non-default ports, use directory name with port number to avoid conflicts
@@ -139,8 +171,35 @@ class ChromeLauncher:
 
         return None
 
+    def _get_ephemeral_root(self) -> Path:
+        """Get parent directory for ephemeral profiles, preferring tmpfs (/dev/shm)"""
+        shm = Path("/dev/shm")
+        if self.system == "Linux" and shm.is_dir() and os.access(shm, os.W_OK):
+            return shm
+        return Path(tempfile.gettempdir())
+
+    def _create_ephemeral_profile_dir(self) -> Path:
+        """Create a fresh, empty profile directory for a single browser lifetime"""
+        return Path(
+            tempfile.mkdtemp(
+                prefix=f"{EPHEMERAL_PROFILE_PREFIX}{self.debugging_port}_",
+                dir=str(self._get_ephemeral_root()),
+            )
+        )
+
+    @staticmethod
+    def _remove_ephemeral_profile_dir(profile_dir: Optional[Path]) -> None:
+        """Delete an ephemeral profile directory (never touches persistent profiles)"""
+        if profile_dir and profile_dir.name.startswith(EPHEMERAL_PROFILE_PREFIX):
+            shutil.rmtree(profile_dir, ignore_errors=True)
+
     def _init_profile_dir(self) -> None:
         """Initialize Chrome profile directory"""
+        if self.profile == PROFILE_EPHEMERAL:
+            # Ephemeral profiles start empty: no copied cookies, extensions or history
+            self.profile_dir = self._create_ephemeral_profile_dir()
+            return
+
         if self.profile_dir.exists():
             return
 
@@ -180,6 +239,7 @@ class ChromeLauncher:
     def kill_existing_chrome(self) -> int:
         """Close existing Chrome CDP instances, return number of processes closed"""
         killed_count = 0
+        ephemeral_dirs = set()
         for proc in psutil.process_iter(["pid", "name", "cmdline"]):
             try:
                 cmdline = proc.info.get("cmdline", [])
@@ -193,6 +253,9 @@ class ChromeLauncher:
                 )
 
                 if is_chrome and has_cdp_port:
+                    for arg in cmdline:
+                        if arg.startswith("--user-data-dir="):
+                            ephemeral_dirs.add(Path(arg.split("=", 1)[1]))
                     proc.terminate()
                     proc.wait(timeout=3)
                     killed_count += 1
@@ -202,6 +265,10 @@ class ChromeLauncher:
         if killed_count > 0:
             time.sleep(1)  # Wait for processes to fully exit
 
+        # Ephemeral profiles live only as long as the browser that used them
+        for profile_dir in ephemeral_dirs:
+            self._remove_ephemeral_profile_dir(profile_dir)
+
         return killed_count
 
     def wait_for_cdp(self, timeout: int = 10) -> bool:
@@ -219,50 +286,6 @@ class ChromeLauncher:
             time.sleep(0.5)
         return False
 
-    def inject_stealth_scripts(self) -> bool:
-        """Inject anti-detection scripts to all new pages"""
-        try:
-            # Find stealth.js file
-            stealth_js_path = (
-                Path(__file__).parent.parent / "stealth.js"
-            )  # src/frago/cdp/stealth.js
-            if not stealth_js_path.exists():
-                return False
-
-            with open(stealth_js_path, "r", encoding="utf-8") as f:
-                stealth_script = f.read()
-
-            # Get first tab
-            response = requests.get(
-                f"http://localhost:{self.debugging_port}/json", timeout=2
-            )
-            targets = response.json()
-
-            if not targets:
-                return False
-
-            ws_url = targets[0]["webSocketDebuggerUrl"]
-
-            import websocket
-            import json
-
-            ws = websocket.create_connection(ws_url)
-
-            message = {
-                "id": 1,
-                "method": "Page.addScriptToEvaluateOnNewDocument",
-                "params": {"source": stealth_script},
-            }
-
-            ws.send(json.dumps(message))
-            ws.recv()
-            ws.close()
-
-            return True
-
-        except Exception:
-            return False
-
     def launch(self, kill_existing: bool = True) -> bool:
         """
         Launch Chrome browser
@@ -304,15 +327,9 @@ class ChromeLauncher:
 
         cmd.append(f"--user-agent={user_agent}")
 
-        # Headless mode
+        # Headless mode: lightweight launch profile for unattended runs
         if self.headless:
-            cmd.extend(
-                [
-                    "--headless=new",
-                    "--disable-gpu",
-                    f"--window-size={self.width},{self.height}",
-                ]
-            )
+            cmd.extend(self.get_headless_flags())
         # Void mode: move window off screen
         elif self.void:
             # Wayland doesn't support window position control, force use XWayland
@@ -332,13 +349,17 @@ class ChromeLauncher:
         # Wait for launch
         time.sleep(2)
 
-        # Wait for CDP ready
-        if self.wait_for_cdp():
-            # Inject stealth scripts
-            self.inject_stealth_scripts()
-            return True
+        # Wait for CDP ready (stealth.js is installed by each CDPSession, see cdp/scripts.py)
+        return self.wait_for_cdp()
 
-        return False
+    def get_headless_flags(self) -> List[str]:
+        """Get headless launch arguments (new headless mode plus minimal flag set)"""
+        return [
+            "--headless=new",
+            "--disable-gpu",
+            f"--window-size={self.width},{self.height}",
+            *LIGHTWEIGHT_FLAGS,
+        ]
 
     def stop(self) -> None:
         """Stop Chrome process"""
@@ -350,6 +371,9 @@ class ChromeLauncher:
                 self.chrome_process.kill()
             self.chrome_process = None
 
+        if self.profile == PROFILE_EPHEMERAL:
+            self._remove_ephemeral_profile_dir(self.profile_dir)
+
     def get_status(self) -> dict:
         """Get Chrome status information"""
         try:
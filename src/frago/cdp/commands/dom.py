@@ -1,13 +1,24 @@
 """
 DOM-related CDP commands
 
-Encapsulates CDP commands for the DOM domain.
+Encapsulates CDP commands for the DOM domain, including a per-session
+node cache that resolves repeated selector queries without fetching the
+document again.
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
 from ..session import CDPSession
 from ..logger import get_logger
+from ..exceptions import CDPError
+
+
+# Cache key of the main frame
+MAIN_FRAME = ""
+
+# DOM events that may leave cached node IDs pointing at detached or
+# different nodes
+_ATTRIBUTE_EVENTS = ("DOM.attributeModified", "DOM.attributeRemoved")
 
 
 class DOMCommands:
@@ -22,11 +33,23 @@ class DOMCommands:
         """
         self.session = session
         self.logger = get_logger()
+        # frame ID -> document node ID
+        self._roots: Dict[str, int] = {}
+        # (frame ID, selector) -> node ID
+        self._nodes: Dict[Tuple[str, str], int] = {}
+        # node ID -> parent node ID, for nodes pushed to this client
+        self._parents: Dict[int, int] = {}
+        self._listening = False
+        self.hits = 0
+        self.misses = 0
 
     def get_document(self) -> Dict[str, Any]:
         """
         Get document root node
 
+        Node IDs from earlier calls become invalid, so the node cache is
+        reset and seeded with the new root.
+
         Returns:
             Dict[str, Any]: Document information
         """
@@ -34,8 +57,184 @@ class DOMCommands:
         
         result = self.session.send_command("DOM.getDocument")
         
+        self.invalidate()
+        root_id = result.get("result", {}).get("root", {}).get("nodeId")
+        if root_id:
+            self._roots[MAIN_FRAME] = root_id
         self.logger.debug("Document retrieved")
         return result
+
+    def _listen(self) -> None:
+        """Register invalidation handlers once per session"""
+        if self._listening:
+            return
+        on = self.session.on_event
+        on("DOM.documentUpdated")(lambda params: self.invalidate())
+        on("DOM.setChildNodes")(self._on_set_child_nodes)
+        on("DOM.childNodeInserted")(self._on_child_inserted)
+        on("DOM.childNodeRemoved")(self._on_child_removed)
+        on("Page.frameNavigated")(self._on_frame_navigated)
+        for event in _ATTRIBUTE_EVENTS:
+            on(event)(self._on_attribute_changed)
+        self._listening = True
+
+    def _track_nodes(self, parent_id: int, nodes: List[Dict[str, Any]]) -> None:
+        for node in nodes:
+            self._parents[node["nodeId"]] = parent_id
+            self._track_nodes(node["nodeId"], node.get("children", []))
+            if "contentDocument" in node:
+                self._track_nodes(node["nodeId"], [node["contentDocument"]])
+
+    def _on_set_child_nodes(self, params: Dict[str, Any]) -> None:
+        self._track_nodes(params.get("parentId"), params.get("nodes", []))
+
+    def _on_child_inserted(self, params: Dict[str, Any]) -> None:
+        self._track_nodes(params.get("parentNodeId"), [params.get("node", {})])
+
+    def _on_child_removed(self, params: Dict[str, Any]) -> None:
+        removed = params.get("nodeId")
+        self._parents.pop(removed, None)
+        for key, node_id in list(self._nodes.items()):
+            if self._is_within(node_id, removed):
+                del self._nodes[key]
+        for frame_id, root_id in list(self._roots.items()):
+            if frame_id != MAIN_FRAME and self._is_within(root_id, removed):
+                self._drop_frame(frame_id)
+
+    def _on_attribute_changed(self, params: Dict[str, Any]) -> None:
+        # The element may no longer match its selector
+        node_id = params.get("nodeId")
+        for key, cached_id in list(self._nodes.items()):
+            if cached_id == node_id:
+                del self._nodes[key]
+
+    def _on_frame_navigated(self, params: Dict[str, Any]) -> None:
+        frame = params.get("frame", {})
+        if not frame.get("parentId"):
+            self.invalidate()
+        else:
+            self._drop_frame(frame.get("id"))
+
+    def _is_within(self, node_id: int, ancestor_id: int) -> bool:
+        """Whether node_id is ancestor_id or one of its descendants"""
+        seen = 0
+        while node_id is not None and seen < 10000:
+            if node_id == ancestor_id:
+                return True
+            node_id = self._parents.get(node_id)
+            seen += 1
+        return False
+
+    def _drop_frame(self, frame_id: Optional[str]) -> None:
+        self._roots.pop(frame_id, None)
+        for key in [k for k in self._nodes if k[0] == frame_id]:
+            del self._nodes[key]
+
+    def invalidate(self, selector: Optional[str] = None, frame_id: Optional[str] = None) -> None:
+        """
+        Drop cached nodes
+
+        Args:
+            selector: Only drop this selector, None to drop everything
+            frame_id: Frame of the selector, None for the main frame
+        """
+        if selector is not None:
+            self._nodes.pop((frame_id or MAIN_FRAME, selector), None)
+            return
+        self._roots.clear()
+        self._nodes.clear()
+        self._parents.clear()
+
+    def _get_root(self, frame_id: str) -> int:
+        """Get (and cache) the document node ID of a frame"""
+        root_id = self._roots.get(frame_id)
+        if root_id:
+            return root_id
+
+        if frame_id == MAIN_FRAME:
+            result = self.get_document()
+            root_id = result.get("result", {}).get("root", {}).get("nodeId")
+            if not root_id:
+                raise CDPError("Unable to get document node")
+            return root_id
+
+        # Same-process iframe: owner element -> content document -> node ID
+        owner = self.session.send_command("DOM.getFrameOwner", {"frameId": frame_id}).get("result", {})
+        described = self.session.send_command("DOM.describeNode", {
+            "backendNodeId": owner.get("backendNodeId"),
+            "depth": 0,
+            "pierce": True
+        }).get("result", {}).get("node", {})
+        document = described.get("contentDocument")
+        if not document:
+            raise CDPError(f"Frame {frame_id} has no accessible document (cross-origin frames need their own session)")
+        pushed = self.session.send_command("DOM.pushNodesByBackendIdsToFrontend", {
+            "backendNodeIds": [document["backendNodeId"]]
+        }).get("result", {}).get("nodeIds", [])
+        if not pushed or not pushed[0]:
+            raise CDPError(f"Unable to get document node of frame {frame_id}")
+        self._roots[frame_id] = pushed[0]
+        return pushed[0]
+
+    def is_cached(self, selector: str, frame_id: Optional[str] = None) -> bool:
+        """
+        Whether a selector currently resolves from the node cache
+
+        Args:
+            selector: CSS selector
+            frame_id: Frame of the selector, None for the main frame
+
+        Returns:
+            bool: True if find() would not query the page
+        """
+        self._listen()
+        self.session.process_events()
+        return (frame_id or MAIN_FRAME, selector) in self._nodes
+
+    def find(self, selector: str, frame_id: Optional[str] = None) -> Optional[int]:
+        """
+        Resolve a selector to a node ID, using the node cache
+
+        Cached nodes are dropped when the document is replaced, the node
+        (or an ancestor) is removed, its attributes change or its frame
+        navigates. A node inserted before a cached match is not detected,
+        so call invalidate() when the page re-renders without removing
+        the cached element.
+
+        Args:
+            selector: CSS selector
+            frame_id: Same-origin iframe to search, None for the main frame
+
+        Returns:
+            Optional[int]: Node ID, None if no element matches
+        """
+        self._listen()
+        # Apply invalidations that arrived since the last command
+        self.session.process_events()
+
+        key = (frame_id or MAIN_FRAME, selector)
+        node_id = self._nodes.get(key)
+        if node_id:
+            self.hits += 1
+            return node_id
+
+        self.misses += 1
+        root_id = self._get_root(key[0])
+        try:
+            node_id = self.query_selector(root_id, selector).get("result", {}).get("nodeId")
+        except CDPError:
+            # Root went stale without an event reaching us, retry once from a fresh document
+            if key[0] == MAIN_FRAME:
+                self.invalidate()
+            else:
+                self._drop_frame(key[0])
+            root_id = self._get_root(key[0])
+            node_id = self.query_selector(root_id, selector).get("result", {}).get("nodeId")
+
+        if not node_id:
+            return None
+        self._nodes[key] = node_id
+        return node_id
     
     def query_selector(self, node_id: int, selector: str) -> Dict[str, Any]:
         """
@@ -99,4 +298,28 @@ class DOMCommands:
         )
         
         self.logger.debug(f"Box model result: {result}")
-        return result
\ No newline at end of file
+        return result
+
+    def get_element_box(self, selector: str, frame_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get the box model of the element matching selector
+
+        A cached node that went stale is re-resolved once.
+
+        Args:
+            selector: CSS selector
+            frame_id: Same-origin iframe to search, None for the main frame
+
+        Returns:
+            Optional[Dict[str, Any]]: Box model ("content", "border", ... quads),
+                None if no element matches or it is not rendered
+        """
+        for _ in range(2):
+            node_id = self.find(selector, frame_id)
+            if not node_id:
+                return None
+            try:
+                return self.get_box_model(node_id).get("result", {}).get("model")
+            except CDPError:
+                self.invalidate(selector, frame_id)
+        return None
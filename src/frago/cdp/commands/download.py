@@ -0,0 +1,431 @@
+"""
+Download-related CDP commands
+
+Routes browser downloads straight into a directory via
+Browser.setDownloadBehavior and tracks them through download events, so
+files never need to be re-fetched or copied out of Chrome's default
+download folder.
+"""
+
+import base64
+import time
+import uuid
+from email.message import Message
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+from urllib.parse import unquote, urlparse
+
+from ..logger import get_logger
+from ..exceptions import CDPError, TimeoutError
+
+
+# Download states reported by downloadProgress
+DOWNLOAD_IN_PROGRESS = "inProgress"
+DOWNLOAD_COMPLETED = "completed"
+DOWNLOAD_CANCELED = "canceled"
+
+# Browser.* events, with the deprecated Page.* equivalents as fallback
+_BEGIN_EVENTS = ("Browser.downloadWillBegin", "Page.downloadWillBegin")
+_PROGRESS_EVENTS = ("Browser.downloadProgress", "Page.downloadProgress")
+
+# Page.navigate reports a navigation that turned into a download as aborted
+_DOWNLOAD_NAVIGATION_ERROR = "net::ERR_ABORTED"
+
+# Seconds to wait for downloadWillBegin after the helper tab's navigation
+_BEGIN_TIMEOUT = 5.0
+_BEGIN_TIMEOUT_DOCUMENT = 1.0
+
+ProgressCallback = Callable[[Dict[str, Any]], None]
+
+
+class DownloadCommands:
+    """Download commands class"""
+
+    def __init__(self, session):
+        """
+        Initialize download commands
+
+        Args:
+            session: CDP session instance
+        """
+        self.session = session
+        self.logger = get_logger()
+        self.download_dir: Optional[Path] = None
+        # guid -> download info (url, filename, state, bytes, path)
+        self.downloads: Dict[str, Dict[str, Any]] = {}
+        self._callbacks: List[ProgressCallback] = []
+        self._listening = False
+        # Browser.setDownloadBehavior saves files under their GUID, renamed on completion
+        self._named_by_guid = False
+
+    def _listen(self) -> None:
+        """Register download event handlers once per session"""
+        if self._listening:
+            return
+        for event in _BEGIN_EVENTS:
+            self.session.on_event(event)(self._on_will_begin)
+        for event in _PROGRESS_EVENTS:
+            self.session.on_event(event)(self._on_progress)
+        self._listening = True
+
+    def _on_will_begin(self, params: Dict[str, Any]) -> None:
+        guid = params.get("guid")
+        filename = params.get("suggestedFilename", "")
+        self.downloads[guid] = {
+            "guid": guid,
+            "url": params.get("url"),
+            "filename": filename,
+            "path": None,
+            "state": DOWNLOAD_IN_PROGRESS,
+            "received_bytes": 0,
+            "total_bytes": 0,
+            "started_at": time.time(),
+        }
+        self.logger.info(f"Download started: {filename} ({params.get('url')})")
+
+    def _on_progress(self, params: Dict[str, Any]) -> None:
+        info = self.downloads.setdefault(params.get("guid"), {
+            "guid": params.get("guid"),
+            "started_at": time.time(),
+        })
+        info["state"] = params.get("state", DOWNLOAD_IN_PROGRESS)
+        info["received_bytes"] = params.get("receivedBytes", 0)
+        info["total_bytes"] = params.get("totalBytes", 0)
+        if info["state"] != DOWNLOAD_IN_PROGRESS:
+            info["finished_at"] = time.time()
+            if info["state"] == DOWNLOAD_COMPLETED:
+                info["path"] = self._finalize_file(info)
+            self.logger.info(f"Download {info['state']}: {info.get('filename') or info['guid']}")
+
+        self._notify(info)
+
+    def _notify(self, info: Dict[str, Any]) -> None:
+        for callback in list(self._callbacks):
+            try:
+                callback(info)
+            except Exception as e:
+                self.logger.error(f"Error in download progress callback: {e}")
+
+    def _finalize_file(self, info: Dict[str, Any]) -> Optional[str]:
+        """Give a completed download its suggested filename (a rename, not a copy)"""
+        if self.download_dir is None:
+            return None
+        filename = Path(info.get("filename") or info["guid"]).name
+        if not self._named_by_guid:
+            return str(self.download_dir / filename)
+
+        source = self.download_dir / info["guid"]
+        target = self._unique_path(filename)
+        try:
+            source.rename(target)
+        except OSError as e:
+            self.logger.warning(f"Could not rename download {source} -> {target}: {e}")
+            return str(source)
+        return str(target)
+
+    def _unique_path(self, filename: str) -> Path:
+        """Path for filename in the download directory, numbered if it is taken"""
+        target = self.download_dir / filename
+        stem, suffix = target.stem, target.suffix
+        counter = 1
+        while target.exists():
+            target = self.download_dir / f"{stem} ({counter}){suffix}"
+            counter += 1
+        return target
+
+    def on_progress(self, callback: ProgressCallback) -> ProgressCallback:
+        """
+        Register a download progress callback
+
+        Called with the download info dict (guid, filename, state,
+        received_bytes, total_bytes, path) on every progress event.
+
+        Args:
+            callback: Progress callback
+
+        Returns:
+            ProgressCallback: The callback, so this can be used as a decorator
+        """
+        self._callbacks.append(callback)
+        return callback
+
+    def set_download_dir(self, directory: Union[str, Path]) -> Path:
+        """
+        Save downloads of this browser directly into a directory
+
+        Args:
+            directory: Download directory (created if missing)
+
+        Returns:
+            Path: Absolute download directory
+        """
+        path = Path(directory).expanduser().resolve()
+        path.mkdir(parents=True, exist_ok=True)
+        self._listen()
+
+        try:
+            self.session.send_command("Browser.setDownloadBehavior", {
+                "behavior": "allowAndName",
+                "downloadPath": str(path),
+                "eventsEnabled": True
+            })
+            self._named_by_guid = True
+        except CDPError:
+            # Older Chrome versions only support the Page-level variant
+            self.session.send_command("Page.setDownloadBehavior", {
+                "behavior": "allow",
+                "downloadPath": str(path)
+            })
+            self._named_by_guid = False
+        self.session.send_command("Page.enable")
+
+        self.download_dir = path
+        self.logger.info(f"Downloads will be saved to: {path}")
+        return path
+
+    def wait_for_download(
+        self,
+        timeout: float = 300,
+        guid: Optional[str] = None,
+        url: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Wait until a download finishes
+
+        Args:
+            timeout: Timeout (seconds)
+            guid: Wait for this download, None for the next download to finish
+            url: Wait for the download of this URL
+
+        Returns:
+            Dict[str, Any]: Download info, "path" set when completed
+
+        Raises:
+            TimeoutError: Download did not finish in time
+            CDPError: Download was canceled
+        """
+        def matches(info: Dict[str, Any]) -> bool:
+            if guid is not None:
+                return info.get("guid") == guid
+            if url is not None:
+                return info.get("url") == url
+            return True
+
+        return self._wait(matches, timeout)
+
+    def _wait(self, matches: Callable[[Dict[str, Any]], bool], timeout: float) -> Dict[str, Any]:
+        """Wait for the first finished download accepted by matches"""
+        finished: List[Dict[str, Any]] = []
+
+        def on_finish(info: Dict[str, Any]) -> None:
+            if info["state"] != DOWNLOAD_IN_PROGRESS and matches(info):
+                finished.append(info)
+
+        # Downloads that already finished while other commands were running
+        for info in self.downloads.values():
+            if info.get("state") not in (None, DOWNLOAD_IN_PROGRESS) and matches(info) \
+                    and not info.get("_reported"):
+                finished.append(info)
+                break
+
+        self._listen()
+        self.on_progress(on_finish)
+        deadline = time.time() + timeout
+        try:
+            while not finished:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    raise TimeoutError(f"Download did not finish within {timeout} seconds")
+                self.session.wait_for_event(
+                    _PROGRESS_EVENTS[0],
+                    timeout=min(remaining, 1.0),
+                    predicate=lambda params: params.get("state") != DOWNLOAD_IN_PROGRESS
+                )
+        finally:
+            self._callbacks.remove(on_finish)
+
+        info = finished[0]
+        info["_reported"] = True
+        if info["state"] == DOWNLOAD_CANCELED:
+            raise CDPError(f"Download canceled: {info.get('filename') or info.get('url')}")
+        return {k: v for k, v in info.items() if not k.startswith("_")}
+
+    def download(
+        self,
+        url: str,
+        directory: Optional[Union[str, Path]] = None,
+        timeout: float = 300
+    ) -> Dict[str, Any]:
+        """
+        Download a URL through the browser (with its cookies and session)
+
+        The URL is opened in a background helper tab, so the current page is
+        left alone whatever the response is. When the browser displays the
+        response instead of downloading it (PDF viewer, inline reports), the
+        file is fetched with Network.loadNetworkResource from the helper tab.
+
+        Args:
+            url: File URL
+            directory: Download directory, defaults to the current one
+            timeout: Timeout (seconds)
+
+        Returns:
+            Dict[str, Any]: Download info
+
+        Raises:
+            CDPError: No download directory set or download failed
+        """
+        if directory is not None:
+            self.set_download_dir(directory)
+        if self.download_dir is None:
+            raise CDPError("No download directory set (call set_download_dir first)")
+
+        self.logger.info(f"Downloading: {url}")
+        known = set(self.downloads)
+
+        # Match any new download: redirects may change the reported URL
+        def is_new(info: Dict[str, Any]) -> bool:
+            return info.get("guid") not in known
+
+        target_id = self.session.target.create_target("about:blank", background=True, owner="download")
+        if not target_id:
+            raise CDPError("Could not open a tab for the download")
+        session_id = None
+        try:
+            session_id = self.session.target.attach(target_id)
+            if not self._named_by_guid:
+                # The Page-level behaviour only covers the tab it is sent to,
+                # whose download events arrive on its child session
+                self.session.forward_events(session_id, *_BEGIN_EVENTS, *_PROGRESS_EVENTS)
+                self.session.send_command("Page.enable", session_id=session_id)
+                self.session.send_command("Page.setDownloadBehavior", {
+                    "behavior": "allow",
+                    "downloadPath": str(self.download_dir)
+                }, session_id=session_id)
+
+            result = self.session.send_command(
+                "Page.navigate", {"url": url}, session_id=session_id
+            ).get("result", {})
+            error = result.get("errorText")
+            if error and error != _DOWNLOAD_NAVIGATION_ERROR:
+                raise CDPError(f"Download failed: {url}: {error}")
+
+            grace = _BEGIN_TIMEOUT if error else _BEGIN_TIMEOUT_DOCUMENT
+            if self._wait_for_begin(is_new, grace):
+                return self._wait(is_new, timeout)
+            if error:
+                raise CDPError(f"Download failed: {url}: navigation aborted without a download")
+
+            # The response was displayed as a document
+            self.logger.info(f"{url} opened as a page, fetching it instead")
+            return self._fetch(url, result.get("frameId") or target_id, session_id, timeout)
+        finally:
+            if session_id:
+                self.session.stop_forwarding(session_id)
+            try:
+                self.session.target.close_target(target_id)
+            except CDPError as e:
+                self.logger.debug(f"Failed to close download tab {target_id}: {e}")
+
+    def _wait_for_begin(self, matches: Callable[[Dict[str, Any]], bool], timeout: float) -> bool:
+        """Wait until a download accepted by matches has begun"""
+        deadline = time.time() + timeout
+        self.session.process_events()
+        while not any(matches(info) for info in self.downloads.values()):
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return False
+            self.session.wait_for_event(_BEGIN_EVENTS[0], timeout=min(remaining, 0.5))
+        return True
+
+    def _fetch(self, url: str, frame_id: str, session_id: str, timeout: float) -> Dict[str, Any]:
+        """
+        Save a URL into the download directory with Network.loadNetworkResource
+
+        Args:
+            url: File URL
+            frame_id: Frame whose cookies and origin the request uses
+            session_id: Child session of the frame's tab
+            timeout: Timeout (seconds)
+
+        Returns:
+            Dict[str, Any]: Download info, like a browser download's
+
+        Raises:
+            CDPError: Request failed
+            TimeoutError: Transfer did not finish in time
+        """
+        result = self.session.send_command("Network.loadNetworkResource", {
+            "frameId": frame_id,
+            "url": url,
+            "options": {"disableCache": False, "includeCredentials": True}
+        }, session_id=session_id)
+        resource = result.get("result", {}).get("resource", {})
+        status = resource.get("httpStatusCode")
+        if not resource.get("success") or not resource.get("stream") or (status or 0) >= 400:
+            reason = resource.get("netErrorName") or (f"HTTP {status}" if status else "request failed")
+            raise CDPError(f"Download failed: {url}: {reason}")
+
+        headers = {k.lower(): v for k, v in (resource.get("headers") or {}).items()}
+        length = headers.get("content-length", "")
+        info: Dict[str, Any] = {
+            "guid": uuid.uuid4().hex,
+            "url": url,
+            "filename": self._response_filename(url, headers),
+            "path": None,
+            "state": DOWNLOAD_IN_PROGRESS,
+            "received_bytes": 0,
+            "total_bytes": int(length) if length.isdigit() else 0,
+            "started_at": time.time(),
+        }
+        self.downloads[info["guid"]] = info
+
+        stream = resource["stream"]
+        temp_path = self.download_dir / f"{info['guid']}.part"
+        deadline = time.time() + timeout
+        try:
+            with open(temp_path, "wb") as f:
+                while True:
+                    if time.time() > deadline:
+                        raise TimeoutError(f"Download did not finish within {timeout} seconds")
+                    chunk = self.session.send_command(
+                        "IO.read", {"handle": stream, "size": 1 << 20}, session_id=session_id
+                    ).get("result", {})
+                    data = chunk.get("data", "")
+                    data = base64.b64decode(data) if chunk.get("base64Encoded") else data.encode("utf-8")
+                    f.write(data)
+                    info["received_bytes"] += len(data)
+                    if chunk.get("eof"):
+                        break
+                    self._notify(info)
+            info["path"] = str(self._unique_path(info["filename"]))
+            temp_path.rename(info["path"])
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            info["state"] = DOWNLOAD_CANCELED
+            raise
+        finally:
+            try:
+                self.session.send_command("IO.close", {"handle": stream}, session_id=session_id)
+            except CDPError:
+                pass
+
+        info["state"] = DOWNLOAD_COMPLETED
+        info["total_bytes"] = info["received_bytes"]
+        info["finished_at"] = time.time()
+        info["_reported"] = True
+        self.logger.info(f"Download {info['state']}: {info['filename']}")
+        self._notify(info)
+        return {k: v for k, v in info.items() if not k.startswith("_")}
+
+    @staticmethod
+    def _response_filename(url: str, headers: Dict[str, str]) -> str:
+        """Filename from Content-Disposition, else the last URL path segment"""
+        disposition = headers.get("content-disposition")
+        if disposition:
+            message = Message()
+            message["content-disposition"] = disposition
+            filename = message.get_filename()
+            if filename:
+                return Path(filename).name
+        return Path(unquote(urlparse(url).path)).name or "download"
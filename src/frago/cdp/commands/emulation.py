@@ -0,0 +1,128 @@
+"""
+Emulation-related CDP commands
+
+Encapsulates CDP commands for animation speed, virtual time and scrolling
+behavior, used by fast settle mode.
+"""
+
+import threading
+from typing import Any, Dict, Optional
+
+from ..logger import get_logger
+
+
+# Injected into every document in fast settle mode
+NO_SMOOTH_SCROLL_SCRIPT = """
+(function() {
+    const apply = () => {
+        if (document.getElementById('frago-no-smooth-scroll')) return;
+        const style = document.createElement('style');
+        style.id = 'frago-no-smooth-scroll';
+        style.textContent = 'html, body, * { scroll-behavior: auto !important; }';
+        (document.head || document.documentElement).appendChild(style);
+    };
+    if (document.documentElement) {
+        apply();
+    } else {
+        document.addEventListener('DOMContentLoaded', apply, { once: true });
+    }
+})();
+"""
+
+
+class EmulationCommands:
+    """Emulation commands class"""
+
+    def __init__(self, session):
+        """
+        Initialize emulation commands
+
+        Args:
+            session: CDP session instance
+        """
+        self.session = session
+        self.logger = get_logger()
+
+    def set_animation_playback_rate(self, rate: float) -> Dict[str, Any]:
+        """
+        Set playback rate of CSS/Web animations on the document timeline
+
+        Args:
+            rate: Playback rate (1.0 = normal speed, 10.0 = ten times faster)
+
+        Returns:
+            Dict[str, Any]: Command result
+        """
+        self.logger.info(f"Setting animation playback rate to {rate}")
+
+        return self.session.send_command("Animation.setPlaybackRate", {
+            "playbackRate": rate
+        })
+
+    def disable_smooth_scrolling(self) -> None:
+        """Force instant scrolling in the current and all future documents"""
+        self.logger.info("Disabling smooth scrolling")
+
+        self.session.send_command("Page.addScriptToEvaluateOnNewDocument", {
+            "source": NO_SMOOTH_SCROLL_SCRIPT
+        })
+        self.session.send_command("Runtime.evaluate", {
+            "expression": NO_SMOOTH_SCROLL_SCRIPT
+        })
+
+    def advance_virtual_time(self, budget_ms: int, timeout: Optional[float] = None) -> bool:
+        """
+        Let page timers run for a virtual time budget without wall-clock waiting
+
+        Virtual time pauses while network fetches are pending, so the budget
+        only elapses once the page is idle. Afterwards the policy is left on
+        "advance" so idle periods keep being fast-forwarded.
+
+        Args:
+            budget_ms: Virtual time budget (milliseconds)
+            timeout: Wall-clock limit (seconds) for the budget to expire
+
+        Returns:
+            bool: Whether the budget expired within timeout
+        """
+        self.logger.info(f"Advancing virtual time by {budget_ms}ms")
+
+        expired = threading.Event()
+
+        def on_expired(_params: Dict[str, Any]) -> None:
+            expired.set()
+
+        event_name = "Emulation.virtualTimeBudgetExpired"
+        self.session.on_event(event_name)(on_expired)
+        try:
+            self.session.send_command("Emulation.setVirtualTimePolicy", {
+                "policy": "pauseIfNetworkFetchesPending",
+                "budget": budget_ms
+            })
+            if not expired.is_set():
+                self.session.wait_for_event(
+                    event_name,
+                    timeout=timeout if timeout is not None else budget_ms / 1000
+                )
+        finally:
+            self.session.off_event(event_name, on_expired)
+
+        self.session.send_command("Emulation.setVirtualTimePolicy", {
+            "policy": "advance"
+        })
+
+        if not expired.is_set():
+            self.logger.debug("Virtual time budget did not expire before timeout")
+        return expired.is_set()
+
+    def enable_fast_settle(self, playback_rate: float = 10.0, disable_smooth_scroll: bool = True) -> None:
+        """
+        Enable fast settle mode for this session
+
+        Args:
+            playback_rate: Animation playback rate
+            disable_smooth_scroll: Whether to force instant scrolling
+        """
+        self.set_animation_playback_rate(playback_rate)
+        if disable_smooth_scroll:
+            self.disable_smooth_scrolling()
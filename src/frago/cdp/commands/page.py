@@ -4,10 +4,27 @@ Page-related CDP commands
 Encapsulates CDP commands for the Page domain.
 """
 
-from typing import Dict, Any, Optional
+import json
+from pathlib import Path
+from typing import Dict, Any, Iterator, Optional
 
 from ..session import CDPSession
 from ..logger import get_logger
+from ..exceptions import CDPError
+
+
+# Characters transferred per evaluation when streaming readable content
+READABLE_CHUNK_SIZE = 256 * 1024
+
+_readable_script: Optional[str] = None
+
+
+def _get_readable_script() -> str:
+    """Load the main-content extraction script (src/frago/cdp/readable.js)"""
+    global _readable_script
+    if _readable_script is None:
+        _readable_script = (Path(__file__).parent.parent / "readable.js").read_text(encoding="utf-8")
+    return _readable_script
 
 
 class PageCommands:
@@ -39,6 +56,8 @@ class PageCommands:
             "Page.navigate",
             {"url": url}
         )
+        # DOM.documentUpdated may arrive after the next lookup
+        self.session.dom.invalidate()
         
         self.logger.debug(f"Navigation result: {result}")
         return result
@@ -182,6 +201,88 @@ class PageCommands:
         self.logger.debug(f"Content length: {len(content)} characters")
         return content
 
+    def get_readable_content(
+        self,
+        selector: Optional[str] = None,
+        offset: int = 0,
+        limit: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Extract the main content of the page as Markdown
+
+        Navigation, footers, sidebars, scripts and link-heavy boilerplate
+        are dropped by a readability-style scorer running in the page; only
+        the requested slice of the resulting Markdown is transferred.
+
+        Args:
+            selector: Convert this element instead of the detected main content
+            offset: First character to return
+            limit: Maximum number of characters to return, None for all
+
+        Returns:
+            Dict[str, Any]: source_url, title, content, offset, total_length,
+                next_offset (None on the last slice) and links_count
+
+        Raises:
+            CDPError: Element not found or extraction failed
+        """
+        self.logger.info(f"Extracting readable content (selector={selector}, offset={offset}, limit={limit})")
+
+        options = {"selector": selector, "offset": offset, "limit": limit or 0}
+        result = self.session.evaluate(f"({_get_readable_script()})({json.dumps(options)})")
+        if not isinstance(result, dict):
+            raise CDPError("Readable content extraction returned no result")
+        if result.get("error"):
+            raise CDPError(f"{result['error']}: {selector}")
+
+        self.logger.debug(
+            f"Readable content: {len(result['content'])} of {result['total_length']} characters"
+        )
+        return result
+
+    def iter_readable_content(
+        self,
+        selector: Optional[str] = None,
+        offset: int = 0,
+        chunk_size: int = READABLE_CHUNK_SIZE
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the readable Markdown of the page in slices
+
+        The extraction runs once in the page; each slice is one evaluation,
+        so arbitrarily large pages never sit in a single CDP message.
+
+        Args:
+            selector: Convert this element instead of the detected main content
+            offset: First character to return
+            chunk_size: Characters per slice
+
+        Yields:
+            Dict[str, Any]: Slices as returned by get_readable_content
+        """
+        while offset is not None:
+            chunk = self.get_readable_content(selector, offset=offset, limit=chunk_size)
+            yield chunk
+            offset = chunk["next_offset"]
+
+    def capture_snapshot(self) -> str:
+        """
+        Capture the page as a single-file MHTML archive
+
+        Returns:
+            str: MHTML document (page plus subresources)
+        """
+        self.logger.info("Capturing MHTML snapshot")
+
+        result = self.session.send_command(
+            "Page.captureSnapshot",
+            {"format": "mhtml"}
+        )
+
+        data = result.get("result", {}).get("data", "")
+        self.logger.debug(f"Snapshot size: {len(data)} characters")
+        return data
+
     def wait_for_load(self, timeout: float = 30) -> bool:
         """
         Wait for page load to complete
@@ -0,0 +1,166 @@
+"""
+Performance-related CDP commands
+
+Samples Performance.getMetrics and navigation timing of the current page,
+after navigations and on an interval, so heavy sites and degrading tabs
+can be spotted and tabs recycled before they slow a run down.
+"""
+
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from ..logger import get_logger
+from ..exceptions import CDPError
+
+
+# Performance.getMetrics values kept in samples
+TRACKED_METRICS = (
+    "JSHeapUsedSize",
+    "JSHeapTotalSize",
+    "Nodes",
+    "Documents",
+    "JSEventListeners",
+    "LayoutCount",
+    "LayoutDuration",
+    "RecalcStyleDuration",
+    "ScriptDuration",
+    "TaskDuration",
+)
+
+NAVIGATION_TIMING_SCRIPT = """
+(() => {
+    const n = performance.getEntriesByType('navigation')[0];
+    if (!n) return null;
+    return {
+        type: n.type,
+        ttfb_ms: Math.round(n.responseStart - n.requestStart),
+        dom_content_loaded_ms: Math.round(n.domContentLoadedEventEnd),
+        load_ms: Math.round(n.loadEventEnd),
+        transfer_size: n.transferSize,
+        resources: performance.getEntriesByType('resource').length
+    };
+})()
+"""
+
+# Samples kept in memory per session
+MAX_SAMPLES = 200
+
+SampleCallback = Callable[[Dict[str, Any]], None]
+
+
+class PerformanceCommands:
+    """Performance metrics commands class"""
+
+    def __init__(self, session):
+        """
+        Initialize performance commands
+
+        Args:
+            session: CDP session instance
+        """
+        self.session = session
+        self.logger = get_logger()
+        self.samples: Deque[Dict[str, Any]] = deque(maxlen=MAX_SAMPLES)
+        self.last_sample_time = time.time()
+        self._callbacks: List[SampleCallback] = []
+        self._enabled = False
+
+    @property
+    def latest(self) -> Optional[Dict[str, Any]]:
+        """Most recent sample, None if nothing was sampled yet"""
+        return self.samples[-1] if self.samples else None
+
+    def enable(self) -> None:
+        """Enable metrics collection in the page"""
+        if not self._enabled:
+            self.session.send_command("Performance.enable", {"timeDomain": "timeTicks"})
+            self._enabled = True
+
+    def on_sample(self, callback: SampleCallback) -> SampleCallback:
+        """
+        Register a callback invoked with every new sample
+
+        Args:
+            callback: Sample callback
+
+        Returns:
+            SampleCallback: The callback, so this can be used as a decorator
+        """
+        self._callbacks.append(callback)
+        return callback
+
+    def get_metrics(self) -> Dict[str, float]:
+        """
+        Get current page metrics
+
+        Returns:
+            Dict[str, float]: Metric name -> value (sizes in bytes, durations in seconds)
+        """
+        self.enable()
+        result = self.session.send_command("Performance.getMetrics")
+        metrics = result.get("result", {}).get("metrics", [])
+        return {m["name"]: m["value"] for m in metrics if "name" in m}
+
+    def get_navigation_timing(self) -> Optional[Dict[str, Any]]:
+        """
+        Get navigation timing of the current document
+
+        Returns:
+            Optional[Dict[str, Any]]: TTFB, DOMContentLoaded and load times (ms),
+                transfer size and resource count; None if unavailable
+        """
+        try:
+            return self.session.evaluate(NAVIGATION_TIMING_SCRIPT)
+        except CDPError as e:
+            self.logger.debug(f"Navigation timing unavailable: {e}")
+            return None
+
+    def sample(self, reason: str = "interval") -> Dict[str, Any]:
+        """
+        Take a performance sample of the current page
+
+        Args:
+            reason: Why the sample was taken ("navigation", "interval", ...)
+
+        Returns:
+            Dict[str, Any]: Sample with url, metrics and navigation timing
+        """
+        metrics = self.get_metrics()
+        sample = {
+            "ts": time.time(),
+            "reason": reason,
+            "target_id": self.session.config.target_id,
+            "url": self.session.evaluate("window.location.href"),
+            "metrics": {name: metrics[name] for name in TRACKED_METRICS if name in metrics},
+        }
+        if reason == "navigation":
+            sample["navigation"] = self.get_navigation_timing()
+
+        self.samples.append(sample)
+        self.last_sample_time = sample["ts"]
+
+        for callback in list(self._callbacks):
+            try:
+                callback(sample)
+            except Exception as e:
+                self.logger.error(f"Error in performance sample callback: {e}")
+        return sample
+
+    def should_recycle(self, max_heap_mb: float, max_nodes: int) -> bool:
+        """
+        Whether the current tab has grown past recycling thresholds
+
+        Args:
+            max_heap_mb: JS heap limit (MB)
+            max_nodes: DOM node limit
+
+        Returns:
+            bool: True if the latest sample exceeds either limit
+        """
+        latest = self.latest
+        if not latest:
+            return False
+        metrics = latest["metrics"]
+        heap_mb = metrics.get("JSHeapUsedSize", 0) / (1024 * 1024)
+        return heap_mb > max_heap_mb or metrics.get("Nodes", 0) > max_nodes
@@ -0,0 +1,160 @@
+"""
+Prefetch queue on top of Target commands
+
+Loads upcoming URLs in spare background tabs so that crawl-style workflows
+can process one page while the next ones load. navigate() then swaps the
+session to the already-loaded tab instead of loading from scratch.
+"""
+
+from collections import OrderedDict, deque
+from typing import Deque, Dict, List, Optional
+
+from ..logger import get_logger
+from ..exceptions import CDPError
+
+
+class PrefetchCommands:
+    """Prefetch queue commands class"""
+
+    def __init__(self, session, concurrency: int = 2):
+        """
+        Initialize prefetch queue
+
+        Args:
+            session: CDP session instance
+            concurrency: Maximum number of background tabs loading at once
+        """
+        self.session = session
+        self.logger = get_logger()
+        self.concurrency = max(1, concurrency)
+        self._pending: Deque[str] = deque()
+        # url -> target ID of the background tab loading it
+        self._tabs: "OrderedDict[str, str]" = OrderedDict()
+        # Tabs opened by the queue, closed when navigated away from
+        self._owned: set = set()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def pending(self) -> List[str]:
+        """URLs waiting for a free tab"""
+        return list(self._pending)
+
+    @property
+    def prefetched(self) -> Dict[str, str]:
+        """URLs loading or loaded in background tabs (url -> target ID)"""
+        return dict(self._tabs)
+
+    def enqueue(self, *urls: str) -> None:
+        """
+        Queue URLs for background loading
+
+        Args:
+            *urls: URLs in the order they will be visited
+        """
+        for url in urls:
+            if url not in self._tabs and url not in self._pending:
+                self._pending.append(url)
+        self._fill()
+
+    def _fill(self) -> None:
+        """Start loading pending URLs while tabs are free"""
+        while self._pending and len(self._tabs) < self.concurrency:
+            url = self._pending.popleft()
+            try:
+                target_id = self.session.target.create_target(url, background=True)
+            except CDPError as e:
+                self.logger.warning(f"Failed to prefetch {url}: {e}")
+                continue
+            if not target_id:
+                continue
+            self._tabs[url] = target_id
+            self._owned.add(target_id)
+            self.logger.debug(f"Prefetching {url} in tab {target_id}")
+
+    def navigate(self, url: str, close_previous: bool = True) -> bool:
+        """
+        Navigate to a URL, using its prefetched tab if there is one
+
+        A URL that was not prefetched is loaded in the current tab, or in a
+        fresh tab when performance samples show the current one has grown
+        past the recycle_heap_mb/recycle_nodes limits.
+
+        Args:
+            url: URL to visit
+            close_previous: Close the current tab if the queue opened it
+
+        Returns:
+            bool: Whether a prefetched tab was used
+        """
+        previous_target = self.session.config.target_id
+        target_id = self._tabs.pop(url, None)
+
+        if target_id is None:
+            self.misses += 1
+            if url in self._pending:
+                self._pending.remove(url)
+            if self._should_recycle():
+                self._recycle(url, close_previous and previous_target in self._owned)
+            else:
+                self.session.navigate(url)
+            self._fill()
+            return False
+
+        self.hits += 1
+        self.logger.info(f"Using prefetched tab for {url}")
+        # The working tab must outlive the TTL of an idle prefetch tab
+        self.session.target.set_ttl(target_id, 0)
+        self.session.target.activate_target(target_id)
+        self.session.switch_target(target_id)
+
+        if close_previous and previous_target in self._owned:
+            self._close(previous_target)
+        self._fill()
+        return True
+
+    def _should_recycle(self) -> bool:
+        """Whether performance samples show the current tab has bloated"""
+        config = self.session.config
+        if not config.collect_performance:
+            return False
+        return self.session.performance.should_recycle(config.recycle_heap_mb, config.recycle_nodes)
+
+    def _recycle(self, url: str, close_previous: bool) -> None:
+        """Load url in a fresh tab instead of the current, bloated one"""
+        previous_target = self.session.config.target_id
+        self.logger.info(f"Recycling tab {previous_target or '(current)'} for {url}")
+        # No TTL: the crawl drives this tab for as long as it runs
+        target_id = self.session.target.create_target(url, ttl=0)
+        self._owned.add(target_id)
+        self.session.target.activate_target(target_id)
+        self.session.switch_target(target_id)
+        if close_previous:
+            self._close(previous_target)
+
+    def _close(self, target_id: str) -> None:
+        self._owned.discard(target_id)
+        try:
+            self.session.target.close_target(target_id)
+        except CDPError as e:
+            self.logger.debug(f"Failed to close tab {target_id}: {e}")
+
+    def cancel(self, url: Optional[str] = None) -> None:
+        """
+        Drop queued URLs and close their background tabs
+
+        Args:
+            url: Only cancel this URL, None to cancel everything
+        """
+        if url is not None:
+            if url in self._pending:
+                self._pending.remove(url)
+            target_id = self._tabs.pop(url, None)
+            if target_id:
+                self._close(target_id)
+            return
+
+        self._pending.clear()
+        for target_id in list(self._tabs.values()):
+            self._close(target_id)
+        self._tabs.clear()
@@ -1,14 +1,59 @@
 """
 Screenshot-related CDP commands
 
-Encapsulates CDP commands for screenshot functionality.
+Encapsulates CDP commands for screenshot functionality: viewport, clip,
+element and tiled full-page captures in PNG/JPEG/WebP, with decoding and
+file writes done off-thread.
 """
 
+from pathlib import Path
 from typing import Dict, Any, Optional
 import base64
-import os
+import math
 
 from ..logger import get_logger
+from ..exceptions import CDPError
+from ..imaging import PNGStitcher, write_image, write_image_async
+
+
+SUPPORTED_FORMATS = ("png", "jpeg", "webp")
+
+# Named format/quality combinations
+QUALITY_PRESETS: Dict[str, Dict[str, Any]] = {
+    "lossless": {"format": "png", "quality": None},
+    "high": {"format": "webp", "quality": 90},
+    "balanced": {"format": "webp", "quality": 75},
+    "draft": {"format": "jpeg", "quality": 50},
+}
+
+# Tile height (CSS pixels) for full-page captures; pages taller than this
+# are captured in tiles and stitched instead of in one huge capture
+DEFAULT_TILE_HEIGHT = 4096
+
+
+def resolve_format(format: str = "png", quality: Optional[int] = 80,
+                   preset: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Resolve image format and quality, applying a preset if given
+
+    Args:
+        format: Image format ("png", "jpeg" or "webp")
+        quality: Compression quality (0-100), ignored for PNG
+        preset: Preset name from QUALITY_PRESETS, overrides format and quality
+
+    Returns:
+        Dict[str, Any]: {"format": ..., "quality": ...}
+
+    Raises:
+        ValueError: Unknown format or preset
+    """
+    if preset:
+        if preset not in QUALITY_PRESETS:
+            raise ValueError(f"Unknown screenshot preset: {preset} (choose from {', '.join(QUALITY_PRESETS)})")
+        return dict(QUALITY_PRESETS[preset])
+    if format not in SUPPORTED_FORMATS:
+        raise ValueError(f"Unsupported screenshot format: {format}")
+    return {"format": format, "quality": None if format == "png" else quality}
 
 
 class ScreenshotCommands:
@@ -24,48 +69,225 @@ class ScreenshotCommands:
         self.session = session
         self.logger = get_logger()
 
+    def _capture_data(
+        self,
+        format: str,
+        quality: Optional[int],
+        clip: Optional[Dict[str, float]] = None,
+        beyond_viewport: bool = False
+    ) -> str:
+        """Run Page.captureScreenshot and return base64 image data"""
+        params: Dict[str, Any] = {
+            "format": format,
+            "captureBeyondViewport": beyond_viewport,
+            "optimizeForSpeed": True
+        }
+        if quality is not None and format != "png":
+            params["quality"] = quality
+        if clip:
+            params["clip"] = {"scale": 1, **clip}
+
+        response = self.session.send_command("Page.captureScreenshot", params)
+
+        # CDP return format: {'id': ..., 'result': {'data': ...}}
+        result = response.get('result', {}) if isinstance(response, dict) else {}
+        if "data" not in result:
+            raise CDPError("Screenshot returned no image data")
+        return result["data"]
+
+    def _save(self, data: str, output_file: str, background: bool, result: Dict[str, Any]) -> None:
+        """Write image data (optionally on the writer pool) and record it in result"""
+        if background:
+            result["future"] = write_image_async(data, output_file)
+        else:
+            write_image(data, output_file)
+            self.logger.info(f"Screenshot saved to: {output_file}")
+        result["file"] = output_file
+
+    def get_content_size(self) -> Dict[str, float]:
+        """
+        Get full page content size
+
+        Returns:
+            Dict[str, float]: {"width": ..., "height": ...} in CSS pixels
+        """
+        metrics = self.session.send_command("Page.getLayoutMetrics").get("result", {})
+        size = metrics.get("cssContentSize") or metrics.get("contentSize") or {}
+        return {"width": size.get("width", 0), "height": size.get("height", 0)}
+
     def capture(
         self,
         output_file: Optional[str] = None,
         full_page: bool = False,
         format: str = "png",
-        quality: int = 80
+        quality: int = 80,
+        clip: Optional[Dict[str, float]] = None,
+        preset: Optional[str] = None,
+        background: bool = False,
+        tile_height: int = DEFAULT_TILE_HEIGHT
     ) -> Dict[str, Any]:
         """
         Capture page screenshot
 
+        Full-page captures taller than tile_height are written as stitched
+        tiles (see capture_tiled) when output_file is given.
+
         Args:
             output_file: Output file path, if None returns base64 data
             full_page: Whether to capture full page
-            format: Image format ("png" or "jpeg")
-            quality: JPEG quality (0-100), only valid for JPEG format
+            format: Image format ("png", "jpeg" or "webp")
+            quality: JPEG/WebP quality (0-100)
+            clip: Page region {"x", "y", "width", "height"} in CSS pixels
+            preset: Quality preset name (see QUALITY_PRESETS)
+            background: Decode and write on the writer pool, result["future"]
+                resolves once the file is written
+            tile_height: Tile height (CSS pixels) for full-page captures
 
         Returns:
-            Dict[str, Any]: Screenshot result
+            Dict[str, Any]: Screenshot result ("data" and/or "file")
         """
+        image_format = resolve_format(format, quality, preset)
+        format, quality = image_format["format"], image_format["quality"]
+
         self.logger.info(f"Taking screenshot (full_page={full_page}, format={format}, quality={quality})")
-        
-        params = {
-            "format": format,
-            "captureBeyondViewport": full_page
+
+        if full_page and output_file and not clip:
+            size = self.get_content_size()
+            if size["height"] > tile_height:
+                return self.capture_tiled(output_file, format=format, quality=quality,
+                                          tile_height=tile_height, size=size)
+
+        data = self._capture_data(format, quality, clip=clip, beyond_viewport=full_page or bool(clip))
+        result: Dict[str, Any] = {"data": data, "format": format}
+        if output_file:
+            self._save(data, output_file, background, result)
+        return result
+
+    def capture_element(
+        self,
+        selector: str,
+        output_file: Optional[str] = None,
+        padding: int = 0,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Capture screenshot of a single element
+
+        Args:
+            selector: CSS selector of the element
+            output_file: Output file path
+            padding: Extra margin around the element (CSS pixels)
+            **kwargs: Passed to capture (format, quality, preset, background)
+
+        Returns:
+            Dict[str, Any]: Screenshot result
+
+        Raises:
+            CDPError: Element not found or not rendered
+        """
+        model = self.session.dom.get_element_box(selector)
+        if model is None:
+            raise CDPError(f"Element not found or not rendered: {selector}")
+
+        quad = model.get("border") or model.get("content")
+        if not quad:
+            raise CDPError(f"Element is not rendered: {selector}")
+
+        # Box model quads are viewport-relative, clips are page-relative
+        metrics = self.session.send_command("Page.getLayoutMetrics").get("result", {})
+        viewport = metrics.get("cssVisualViewport") or metrics.get("visualViewport") or {}
+        xs, ys = quad[0::2], quad[1::2]
+        clip = {
+            "x": max(0, min(xs) + viewport.get("pageX", 0) - padding),
+            "y": max(0, min(ys) + viewport.get("pageY", 0) - padding),
+            "width": max(xs) - min(xs) + 2 * padding,
+            "height": max(ys) - min(ys) + 2 * padding,
         }
-        
-        if format == "jpeg":
-            params["quality"] = quality
-        
-        response = self.session.send_command("Page.captureScreenshot", params)
+        if clip["width"] <= 0 or clip["height"] <= 0:
+            raise CDPError(f"Element has no visible area: {selector}")
 
-        # CDP return format: {'id': ..., 'result': {'data': ...}}
-        result = response.get('result', {}) if isinstance(response, dict) else {}
+        return self.capture(output_file, clip=clip, **kwargs)
 
-        if output_file and "data" in result:
-            image_data = base64.b64decode(result["data"])
-            output_dir = os.path.dirname(output_file)
-            if output_dir:
-                os.makedirs(output_dir, exist_ok=True)
-            with open(output_file, "wb") as f:
-                f.write(image_data)
-            self.logger.info(f"Screenshot saved to: {output_file}")
-            result["file"] = output_file
+    def capture_tiled(
+        self,
+        output_file: str,
+        format: str = "png",
+        quality: Optional[int] = None,
+        tile_height: int = DEFAULT_TILE_HEIGHT,
+        size: Optional[Dict[str, float]] = None
+    ) -> Dict[str, Any]:
+        """
+        Capture the full page in horizontal tiles and stitch them
 
-        return result
+        PNG tiles are streamed into the output file so memory stays bounded
+        by one tile. JPEG/WebP output is composed with Pillow when it is
+        installed.
+
+        Args:
+            output_file: Output file path
+            format: Image format
+            quality: JPEG/WebP quality
+            tile_height: Tile height (CSS pixels)
+            size: Page content size, queried if None
+
+        Returns:
+            Dict[str, Any]: {"file", "format", "tiles", "width", "height"}
+
+        Raises:
+            CDPError: Capture or stitching failed
+        """
+        size = size or self.get_content_size()
+        width = math.ceil(size["width"])
+        height = math.ceil(size["height"])
+        tile_count = max(1, math.ceil(height / tile_height))
+        self.logger.info(f"Capturing full page {width}x{height} in {tile_count} tiles")
+
+        def tiles(tile_format: str, tile_quality: Optional[int]):
+            for i in range(tile_count):
+                y = i * tile_height
+                clip = {"x": 0, "y": y, "width": width, "height": min(tile_height, height - y)}
+                yield base64.b64decode(
+                    self._capture_data(tile_format, tile_quality, clip=clip, beyond_viewport=True)
+                )
+
+        if format == "png":
+            with PNGStitcher(output_file) as stitcher:
+                for tile in tiles("png", None):
+                    stitcher.add_tile(tile)
+            pixel_width, pixel_height = stitcher.width, stitcher.height
+        else:
+            pixel_width, pixel_height = self._stitch_with_pillow(
+                tiles(format, quality), output_file, format, quality
+            )
+
+        self.logger.info(f"Screenshot saved to: {output_file}")
+        return {
+            "file": output_file,
+            "format": format,
+            "tiles": tile_count,
+            "width": pixel_width,
+            "height": pixel_height,
+        }
+
+    @staticmethod
+    def _stitch_with_pillow(tiles, output_file: str, format: str, quality: Optional[int]):
+        """Compose lossy tiles into one image with Pillow"""
+        try:
+            from io import BytesIO
+            from PIL import Image
+        except ImportError:
+            raise CDPError(
+                f"Tiled full-page {format} screenshots require Pillow (pip install pillow); "
+                f"use --format png for a streamed full-page capture"
+            )
+
+        Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+        images = [Image.open(BytesIO(tile)) for tile in tiles]
+        canvas = Image.new("RGB", (images[0].width, sum(img.height for img in images)))
+        y = 0
+        for img in images:
+            canvas.paste(img, (0, y))
+            y += img.height
+            img.close()
+        canvas.save(output_file, format.upper(), quality=quality or 80)
+        return canvas.width, canvas.height
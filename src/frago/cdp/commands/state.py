@@ -0,0 +1,425 @@
+"""
+Browser state CDP commands
+
+Captures and restores authentication-relevant browser state (cookies,
+localStorage/sessionStorage, IndexedDB database names) so that workflows
+can skip repeated login flows.
+"""
+
+import json
+import re
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
+
+from ..logger import get_logger
+from ..exceptions import CDPError
+
+
+# Default state storage directory
+STATE_DIR = Path.home() / ".frago" / "browser_states"
+
+# State file format version
+STATE_VERSION = 1
+
+# Seconds to wait for the helper tab to load an origin
+ORIGIN_LOAD_TIMEOUT = 15
+
+_STATE_NAME_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]*$")
+
+
+def get_state_path(name: str, state_dir: Optional[Path] = None) -> Path:
+    """
+    Get state file path for a state name
+
+    Args:
+        name: State name (letters, digits, '_', '.', '-')
+        state_dir: State storage directory, defaults to ~/.frago/browser_states
+
+    Returns:
+        Path: State file path
+
+    Raises:
+        ValueError: Invalid state name
+    """
+    if not _STATE_NAME_PATTERN.match(name):
+        raise ValueError(
+            f"Invalid state name: '{name}' (use letters, digits, '_', '.', '-')"
+        )
+    return (state_dir or STATE_DIR) / f"{name}.json"
+
+
+def list_states(state_dir: Optional[Path] = None) -> List[str]:
+    """
+    List saved state names
+
+    Args:
+        state_dir: State storage directory
+
+    Returns:
+        List[str]: Saved state names, sorted
+    """
+    directory = state_dir or STATE_DIR
+    if not directory.exists():
+        return []
+    return sorted(p.stem for p in directory.glob("*.json"))
+
+
+class StateCommands:
+    """Browser state snapshot/restore commands class"""
+
+    def __init__(self, session):
+        """
+        Initialize state commands
+
+        Args:
+            session: CDP session instance
+        """
+        self.session = session
+        self.logger = get_logger()
+
+    def _current_origin(self) -> Optional[str]:
+        """Get origin of the current page, None for non-http(s) pages"""
+        url = self.session.evaluate("window.location.href") or ""
+        parsed = urlparse(url)
+        if parsed.scheme not in ("http", "https") or not parsed.netloc:
+            return None
+        return f"{parsed.scheme}://{parsed.netloc}"
+
+    def get_cookies(self) -> List[Dict[str, Any]]:
+        """
+        Get all browser cookies
+
+        Returns:
+            List[Dict[str, Any]]: Cookie list
+        """
+        try:
+            result = self.session.send_command("Storage.getCookies")
+        except CDPError:
+            # Storage.getCookies is not available on every target type
+            result = self.session.send_command("Network.getAllCookies")
+        return result.get("result", {}).get("cookies", [])
+
+    def set_cookies(self, cookies: List[Dict[str, Any]]) -> None:
+        """
+        Set browser cookies
+
+        Args:
+            cookies: Cookie list as returned by get_cookies
+        """
+        if not cookies:
+            return
+        params = [self._to_cookie_param(c) for c in cookies]
+        try:
+            self.session.send_command("Storage.setCookies", {"cookies": params})
+        except CDPError:
+            self.session.send_command("Network.setCookies", {"cookies": params})
+
+    @staticmethod
+    def _to_cookie_param(cookie: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a Network.Cookie into a Network.CookieParam"""
+        param = {
+            key: cookie[key]
+            for key in ("name", "value", "domain", "path", "secure", "httpOnly",
+                        "sameSite", "priority", "sameParty", "sourceScheme",
+                        "sourcePort", "partitionKey")
+            if key in cookie
+        }
+        # Session cookies report expires=-1, which must not be sent back
+        if not cookie.get("session") and cookie.get("expires", -1) > 0:
+            param["expires"] = cookie["expires"]
+        return param
+
+    def get_storage_items(self, local: bool = True, session_id: Optional[str] = None) -> List[List[str]]:
+        """
+        Get DOM storage items of a page
+
+        Args:
+            local: True for localStorage, False for sessionStorage
+            session_id: Child session of the page, None for the current page
+
+        Returns:
+            List[List[str]]: [key, value] pairs
+        """
+        storage = "localStorage" if local else "sessionStorage"
+        return json.loads(self._evaluate(f"JSON.stringify(Object.entries({storage}))", session_id))
+
+    def set_storage_items(self, items: List[List[str]], local: bool = True,
+                          session_id: Optional[str] = None) -> None:
+        """
+        Set DOM storage items of a page
+
+        Args:
+            items: [key, value] pairs
+            local: True for localStorage, False for sessionStorage
+            session_id: Child session of the page, None for the current page
+        """
+        if not items:
+            return
+        storage = "localStorage" if local else "sessionStorage"
+        self._evaluate(
+            f"(items => {{ for (const [k, v] of items) {storage}.setItem(k, v); }})"
+            f"({json.dumps(items, ensure_ascii=False)})",
+            session_id
+        )
+
+    def _evaluate(self, expression: str, session_id: Optional[str] = None) -> Any:
+        """Evaluate an expression in a page, raising CDPError on page exceptions"""
+        result = self.session.send_command(
+            "Runtime.evaluate",
+            {"expression": expression, "returnByValue": True},
+            session_id=session_id
+        ).get("result", {})
+        if "exceptionDetails" in result:
+            details = result["exceptionDetails"]
+            message = details.get("exception", {}).get("description") or details.get("text")
+            raise CDPError(f"Page script failed: {message}")
+        return result.get("result", {}).get("value")
+
+    def _open_origin(self, origin: str, helper: Dict[str, str]) -> str:
+        """
+        Show an origin in the helper tab
+
+        DOM storage can only be read or written by a document of its origin,
+        so origins other than the current page's are visited in one
+        background tab, opened on first use and closed by _close_helper.
+
+        Args:
+            origin: Security origin
+            helper: Helper tab state (target_id, session_id, origin), updated in place
+
+        Returns:
+            str: Child session ID of the helper tab
+
+        Raises:
+            CDPError: The origin could not be loaded
+        """
+        if not helper:
+            target_id = self.session.target.create_target(
+                "about:blank", background=True, owner="state"
+            )
+            if not target_id:
+                raise CDPError("Could not open helper tab")
+            helper["target_id"] = target_id
+            helper["origin"] = "null"
+            helper["session_id"] = self.session.target.attach(target_id)
+        session_id = helper["session_id"]
+
+        result = self.session.send_command(
+            "Page.navigate", {"url": f"{origin}/"}, session_id=session_id
+        ).get("result", {})
+        if result.get("errorText"):
+            raise CDPError(f"Could not load {origin}: {result['errorText']}")
+
+        # The previous document answers until the new one commits
+        previous = helper["origin"]
+        deadline = time.time() + ORIGIN_LOAD_TIMEOUT
+        while time.time() < deadline:
+            try:
+                current = self._evaluate("location.origin", session_id)
+            except CDPError:
+                # Execution context replaced mid-evaluation
+                current = None
+            if current == origin:
+                helper["origin"] = origin
+                return session_id
+            if current not in (None, "null", previous):
+                helper["origin"] = current
+                raise CDPError(f"Could not load {origin}: redirected to {current}")
+            time.sleep(0.1)
+        raise CDPError(f"Could not load {origin} within {ORIGIN_LOAD_TIMEOUT} seconds")
+
+    def _close_helper(self, helper: Dict[str, str]) -> None:
+        if not helper:
+            return
+        try:
+            self.session.target.close_target(helper["target_id"])
+        except CDPError as e:
+            self.logger.debug(f"Failed to close helper tab: {e}")
+
+    def get_indexeddb_names(self, origin: str) -> List[str]:
+        """
+        Get IndexedDB database names for an origin
+
+        Args:
+            origin: Security origin
+
+        Returns:
+            List[str]: Database names
+        """
+        try:
+            result = self.session.send_command(
+                "IndexedDB.requestDatabaseNames",
+                {"securityOrigin": origin}
+            )
+        except CDPError as e:
+            self.logger.debug(f"IndexedDB names unavailable for {origin}: {e}")
+            return []
+        return result.get("result", {}).get("databaseNames", [])
+
+    def capture(self, origins: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Capture browser state snapshot
+
+        Storage of the current page's origin is read from the page itself,
+        including sessionStorage; other origins are loaded in a background
+        helper tab and only their localStorage is captured. Origins that
+        cannot be loaded are left out and listed under "skipped_origins".
+
+        Args:
+            origins: Origins whose storage to capture, defaults to current page origin
+
+        Returns:
+            Dict[str, Any]: State snapshot
+        """
+        current = self._current_origin()
+        if not origins:
+            origins = [current] if current else []
+
+        self.logger.info(f"Capturing browser state (origins: {origins})")
+
+        storage = {}
+        skipped = []
+        helper: Dict[str, str] = {}
+        try:
+            for origin in origins:
+                try:
+                    if origin == current:
+                        session_items = self.get_storage_items(local=False)
+                        session_id = None
+                    else:
+                        # sessionStorage belongs to another tab's session
+                        session_items = []
+                        session_id = self._open_origin(origin, helper)
+                    storage[origin] = {
+                        "local": self.get_storage_items(local=True, session_id=session_id),
+                        "session": session_items,
+                        "indexeddb": self.get_indexeddb_names(origin),
+                    }
+                except CDPError as e:
+                    self.logger.warning(f"Skipping storage of {origin}: {e}")
+                    skipped.append(origin)
+        finally:
+            self._close_helper(helper)
+
+        return {
+            "version": STATE_VERSION,
+            "created_at": time.time(),
+            "cookies": self.get_cookies(),
+            "origins": storage,
+            "skipped_origins": skipped,
+        }
+
+    def restore(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Restore browser state snapshot into the current browser
+
+        Cookies are set browser-wide first. Storage items are written by a
+        page of their origin: the current page for its own origin, a
+        background helper tab for the others. sessionStorage only lives as
+        long as its tab, so it is restored for the current page's origin
+        only. Origins that cannot be loaded are skipped, not fatal.
+        IndexedDB names are informational only and are not recreated.
+
+        Args:
+            state: State snapshot as returned by capture
+
+        Returns:
+            Dict[str, Any]: Restored counts (cookies, storage_items,
+                skipped_session_items) and skipped_origins
+        """
+        if state.get("version") != STATE_VERSION:
+            raise CDPError(f"Unsupported browser state version: {state.get('version')}")
+
+        cookies = state.get("cookies", [])
+        self.set_cookies(cookies)
+
+        item_count = 0
+        skipped_session_items = 0
+        skipped = []
+        origins = state.get("origins", {})
+        current = self._current_origin() if origins else None
+        helper: Dict[str, str] = {}
+        try:
+            for origin, data in origins.items():
+                local_items = data.get("local", [])
+                session_items = data.get("session", [])
+                if not local_items and not session_items:
+                    continue
+                try:
+                    if origin == current:
+                        self.set_storage_items(local_items, local=True)
+                        self.set_storage_items(session_items, local=False)
+                        item_count += len(local_items) + len(session_items)
+                    else:
+                        if local_items:
+                            session_id = self._open_origin(origin, helper)
+                            self.set_storage_items(local_items, local=True, session_id=session_id)
+                            item_count += len(local_items)
+                        skipped_session_items += len(session_items)
+                except CDPError as e:
+                    self.logger.warning(f"Skipping storage of {origin}: {e}")
+                    skipped.append(origin)
+        finally:
+            self._close_helper(helper)
+
+        self.logger.info(f"Restored {len(cookies)} cookies, {item_count} storage items")
+        return {
+            "cookies": len(cookies),
+            "storage_items": item_count,
+            "skipped_session_items": skipped_session_items,
+            "skipped_origins": skipped,
+        }
+
+    def save(self, name: str, origins: Optional[List[str]] = None,
+             state_dir: Optional[Path] = None) -> Path:
+        """
+        Capture browser state and save it under a name
+
+        Args:
+            name: State name
+            origins: Origins whose storage to capture
+            state_dir: State storage directory
+
+        Returns:
+            Path: Saved state file path
+        """
+        path = get_state_path(name, state_dir)
+        state = self.capture(origins)
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_suffix(".json.tmp")
+        temp_path.write_text(
+            json.dumps(state, ensure_ascii=False, separators=(",", ":")),
+            encoding="utf-8"
+        )
+        temp_path.replace(path)
+
+        self.logger.info(f"Browser state saved to: {path}")
+        return path
+
+    def load(self, name: str, state_dir: Optional[Path] = None) -> Dict[str, Any]:
+        """
+        Load a saved browser state and restore it
+
+        Args:
+            name: State name
+            state_dir: State storage directory
+
+        Returns:
+            Dict[str, Any]: Restored counts, see restore
+
+        Raises:
+            CDPError: State not found or invalid
+        """
+        path = get_state_path(name, state_dir)
+        if not path.exists():
+            raise CDPError(f"Browser state not found: {name}")
+
+        try:
+            state = json.loads(path.read_text(encoding="utf-8"))
+        except json.JSONDecodeError as e:
+            raise CDPError(f"Invalid browser state file {path}: {e}") from e
+
+        return self.restore(state)
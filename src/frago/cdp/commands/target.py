@@ -5,9 +5,12 @@ Encapsulates CDP commands for the Target domain.
 Used for managing browser tabs/targets.
 """
 
+import os
 from typing import Dict, Any, List, Optional
 
 from ..logger import get_logger
+from ..exceptions import CDPError
+from ..gc import TargetRegistry
 
 
 class TargetCommands:
@@ -22,15 +25,32 @@ class TargetCommands:
         """
         self.session = session
         self.logger = get_logger()
+        self.registry = TargetRegistry()
 
-    def create_target(self, url: str, width: Optional[int] = None, height: Optional[int] = None) -> str:
+    def create_target(self, url: str, width: Optional[int] = None, height: Optional[int] = None,
+                      browser_context_id: Optional[str] = None, background: bool = False,
+                      owner: Optional[str] = None, ttl: Optional[float] = None,
+                      detached: bool = False) -> str:
         """
         Create a new browser tab and navigate to URL
 
+        The tab is recorded for `frago chrome gc`, which closes it once it
+        has gone unused for ttl seconds or, unless detached, once this
+        process has exited.
+
+        When the session has init scripts (e.g. stealth), the tab is opened
+        blank, attached to this session, given the scripts and only then
+        navigated, so the scripts run in its first document too.
+
         Args:
             url: URL to open in new tab
             width: Optional viewport width
             height: Optional viewport height
+            browser_context_id: Optional browser context to create the tab in
+            background: Open the tab without focusing it
+            owner: Owner label, defaults to the current run or process name
+            ttl: Seconds of disuse before the tab expires, defaults to config.target_ttl (0: never)
+            detached: Keep the tab after this process exits
 
         Returns:
             str: Target ID of the new tab
@@ -42,13 +62,110 @@ class TargetCommands:
             params["width"] = width
         if height is not None:
             params["height"] = height
+        if browser_context_id:
+            params["browserContextId"] = browser_context_id
+        if background:
+            params["background"] = True
 
-        result = self.session.send_command("Target.createTarget", params)
+        if self.session.init_scripts and url != "about:blank":
+            target_id = self._create_prepared(params)
+        else:
+            result = self.session.send_command("Target.createTarget", params)
+            target_id = result.get("result", {}).get("targetId", "")
 
-        target_id = result.get("result", {}).get("targetId", "")
         self.logger.debug(f"Created target: {target_id}")
+        if target_id:
+            self._track(target_id, url, owner, ttl, detached, browser_context_id)
         return target_id
 
+    def _create_prepared(self, params: Dict[str, Any]) -> str:
+        """Create a blank tab, attach it so init scripts go in, then navigate it"""
+        result = self.session.send_command("Target.createTarget", {**params, "url": "about:blank"})
+        target_id = result.get("result", {}).get("targetId", "")
+        if not target_id:
+            return target_id
+        try:
+            # The listener pushes init scripts as soon as the attach event
+            # arrives, so they reach the tab before this navigation
+            session_id = self.attach(target_id)
+            self.session.send_command("Page.navigate", {"url": params["url"]}, session_id=session_id)
+            return target_id
+        except CDPError as e:
+            self.logger.warning(f"Could not prepare new tab, opening it without init scripts: {e}")
+        self.session.send_command("Target.closeTarget", {"targetId": target_id})
+        result = self.session.send_command("Target.createTarget", params)
+        return result.get("result", {}).get("targetId", "")
+
+    def attach(self, target_id: str) -> str:
+        """
+        Attach a target to this session (flat mode)
+
+        The session's init scripts are pushed into it on attach. The
+        attachment lasts until this session disconnects.
+
+        Args:
+            target_id: Target ID
+
+        Returns:
+            str: Session ID for send_command(..., session_id=...)
+
+        Raises:
+            CDPError: Target could not be attached
+        """
+        session_id = self.session.child_sessions.get(target_id)
+        if session_id:
+            return session_id
+
+        result = self.session.send_command(
+            "Target.attachToTarget",
+            {"targetId": target_id, "flatten": True}
+        )
+        session_id = result.get("result", {}).get("sessionId", "")
+        if not session_id:
+            raise CDPError(f"Could not attach to target {target_id}")
+        self.session.child_sessions[target_id] = session_id
+        return session_id
+
+    def _track(self, target_id: str, url: str, owner: Optional[str], ttl: Optional[float],
+               detached: bool, browser_context_id: Optional[str]) -> None:
+        """Record a created target in the GC registry, never failing the caller"""
+        config = self.session.config
+        try:
+            self.registry.register(
+                target_id,
+                endpoint=f"{config.host}:{config.port}",
+                url=url,
+                owner=owner,
+                ttl=config.target_ttl if ttl is None else ttl,
+                pid=None if detached else os.getpid(),
+                browser_context_id=browser_context_id
+            )
+        except OSError as e:
+            self.logger.debug(f"Could not record target {target_id}: {e}")
+
+    def set_ttl(self, target_id: str, ttl: float) -> None:
+        """
+        Change the TTL of a tab opened by create_target
+
+        Args:
+            target_id: Target ID
+            ttl: Seconds of disuse before the tab expires (0: never, it
+                still goes once its owning process exits)
+        """
+        try:
+            self.registry.update(target_id, ttl=ttl)
+        except OSError as e:
+            self.logger.debug(f"Could not update target {target_id}: {e}")
+
+    def _untrack(self, target_id: Optional[str] = None, browser_context_id: Optional[str] = None) -> None:
+        try:
+            if target_id:
+                self.registry.unregister(target_id)
+            if browser_context_id:
+                self.registry.unregister_context(browser_context_id)
+        except OSError as e:
+            self.logger.debug(f"Could not update target registry: {e}")
+
     def close_target(self, target_id: str) -> bool:
         """
         Close a browser tab
@@ -68,6 +185,7 @@ class TargetCommands:
 
         success = result.get("result", {}).get("success", False)
         self.logger.debug(f"Close target result: {success}")
+        self._untrack(target_id=target_id)
         return success
 
     def get_targets(self) -> List[Dict[str, Any]]:
@@ -100,3 +218,36 @@ class TargetCommands:
         )
 
         self.logger.debug("Target activated")
+
+    def create_browser_context(self) -> str:
+        """
+        Create an isolated browser context (separate cookies, storage and cache)
+
+        Returns:
+            str: Browser context ID
+        """
+        self.logger.info("Creating browser context")
+
+        result = self.session.send_command(
+            "Target.createBrowserContext",
+            {"disposeOnDetach": False}
+        )
+
+        context_id = result.get("result", {}).get("browserContextId", "")
+        self.logger.debug(f"Created browser context: {context_id}")
+        return context_id
+
+    def dispose_browser_context(self, browser_context_id: str) -> None:
+        """
+        Dispose a browser context, closing all its tabs
+
+        Args:
+            browser_context_id: Browser context ID
+        """
+        self.logger.info(f"Disposing browser context: {browser_context_id}")
+
+        self.session.send_command(
+            "Target.disposeBrowserContext",
+            {"browserContextId": browser_context_id}
+        )
+        self._untrack(browser_context_id=browser_context_id)
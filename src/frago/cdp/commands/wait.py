@@ -64,8 +64,11 @@ class WaitCommands:
         """
         Wait for specified seconds
 
+        In fast settle mode the page advances by virtual time instead of
+        waiting on the wall clock.
+
         Args:
             seconds: Wait time (seconds)
         """
         self.logger.info(f"Waiting for {seconds} seconds")
-        time.sleep(seconds)
+        self.session.settle(seconds)
@@ -23,6 +23,10 @@ class CDPConfig(BaseModel):
     max_retries: int = Field(default=3, description="Maximum retry attempts")
     retry_delay: float = Field(default=1.0, description="Retry delay time (seconds)")
 
+    auto_reconnect: bool = Field(default=True, description="Reconnect automatically when the WebSocket connection drops")
+    circuit_failure_threshold: int = Field(default=3, description="Consecutive reconnect failures before failing fast")
+    circuit_reset_timeout: float = Field(default=30.0, description="Time (seconds) to fail fast before trying to reconnect again")
+
     log_level: str = Field(default="INFO", description="Log level")
     debug: bool = Field(default=False, description="Whether to enable debug mode")
     timeout: int = Field(default=30, description="Operation timeout (seconds)")
@@ -34,6 +38,21 @@ class CDPConfig(BaseModel):
     no_proxy: bool = Field(default=False, description="Whether to bypass proxy")
 
     target_id: Optional[str] = Field(default=None, description="Specified target tab ID, auto-select first page if not specified")
+
+    fast_settle: bool = Field(default=False, description="Fast settle mode: speed up animations and advance timers with virtual time instead of waiting")
+    animation_playback_rate: float = Field(default=10.0, description="Animation playback rate in fast settle mode")
+    disable_smooth_scroll: bool = Field(default=True, description="Disable smooth scrolling in fast settle mode")
+
+    stealth: bool = Field(default=True, description="Install the stealth script (stealth.js) in every page and frame the session attaches to")
+    trace_file: Optional[str] = Field(default=None, description="Record all CDP traffic to this JSONL trace file")
+    prefetch_concurrency: int = Field(default=2, description="Maximum number of background tabs loading prefetched URLs")
+    collect_performance: bool = Field(default=False, description="Sample Performance.getMetrics and navigation timing after each page load and on an interval")
+    performance_sample_interval: float = Field(default=30.0, description="Minimum seconds between interval performance samples")
+    recycle_heap_mb: float = Field(default=512.0, description="JS heap size (MB) above which a tab is recycled instead of reused")
+    recycle_nodes: int = Field(default=50000, description="DOM node count above which a tab is recycled instead of reused")
+    target_ttl: float = Field(default=3600.0, description="Seconds a tab opened by frago may go unused before `frago chrome gc` closes it, 0 for no limit")
+    touch_target: bool = Field(default=True, description="Mark the tab this session drives as in use, restarting its `frago chrome gc` TTL (off for GC's own sessions)")
+    collect_metrics: bool = Field(default=False, description="Collect per-method latency and traffic metrics, merged into ~/.frago/cdp_stats.json on disconnect")
     
     @model_validator(mode='after')
     def load_proxy_from_env(self):
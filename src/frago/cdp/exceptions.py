@@ -40,6 +40,11 @@ class InvalidResponseError(CDPError):
     pass
 
 
+class CircuitOpenError(ConnectionError):
+    """Circuit breaker open exception (endpoint considered down, failing fast)"""
+    pass
+
+
 class ProxyConnectionError(ConnectionError):
     """Proxy connection exception"""
     pass
@@ -0,0 +1,324 @@
+"""
+Fake CDP server
+
+Local stand-in for Chrome's remote debugging endpoint: serves the HTTP
+/json/* endpoints and a WebSocket per target, answering commands from a
+recorded trace (see trace.py) or from scripted responses, with configurable
+latency. Used to benchmark and regression-test the CDP layer, CLI commands
+and recipes on machines without Chrome.
+"""
+
+import asyncio
+import json
+import random
+import threading
+import time
+import uuid
+from collections import Counter, defaultdict, deque
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional, Union
+
+from .trace import load_trace
+
+
+# 1x1 transparent PNG, returned for screenshots when nothing else is scripted
+_BLANK_PNG = (
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAAC0lEQVR4nGNgAAIAAAUAAXpeqz8AAAAASUVORK5CYII="
+)
+
+# Default answers so CLI commands work against an unscripted server
+DEFAULT_RESPONSES: Dict[str, Dict[str, Any]] = {
+    "Browser.getVersion": {
+        "protocolVersion": "1.3",
+        "product": "FakeChrome/1.0",
+        "revision": "fake",
+        "userAgent": "FakeChrome",
+        "jsVersion": "0",
+    },
+    "Runtime.evaluate": {"result": {"type": "undefined"}},
+    "Page.navigate": {"frameId": "FAKEFRAME", "loaderId": "FAKELOADER"},
+    "Page.captureScreenshot": {"data": _BLANK_PNG},
+    "DOM.getDocument": {"root": {"nodeId": 1, "backendNodeId": 1, "nodeName": "#document"}},
+    "DOM.querySelector": {"nodeId": 2},
+    "DOM.getBoxModel": {
+        "model": {"content": [0, 0, 10, 0, 10, 10, 0, 10], "width": 10, "height": 10}
+    },
+    "Target.getTargets": {"targetInfos": []},
+    "Target.attachToTarget": {"sessionId": "FAKE-SESSION"},
+}
+
+ScriptedResponse = Union[Dict[str, Any], Callable[[Dict[str, Any]], Dict[str, Any]]]
+
+
+class _ReplayEntry:
+    """One recorded command response plus the events that followed it"""
+
+    __slots__ = ("response", "events", "latency")
+
+    def __init__(self, response: Dict[str, Any], latency: float):
+        self.response = response
+        self.events: List[Dict[str, Any]] = []
+        self.latency = latency
+
+
+def _build_replay_table(entries: List[Dict[str, Any]]) -> Dict[str, Deque[_ReplayEntry]]:
+    """Pair recorded commands with their responses and trailing events, per method"""
+    sent: Dict[int, Dict[str, Any]] = {}
+    table: Dict[str, Deque[_ReplayEntry]] = defaultdict(deque)
+    last_entry: Optional[_ReplayEntry] = None
+
+    for entry in entries:
+        data = entry.get("data", {})
+        if entry.get("dir") == "send" and "id" in data:
+            sent[data["id"]] = {"method": data.get("method"), "ts": entry.get("ts", 0)}
+        elif entry.get("dir") == "recv":
+            if "id" in data and data["id"] in sent:
+                request = sent.pop(data["id"])
+                response = {k: v for k, v in data.items() if k != "id"}
+                latency = max(0.0, entry.get("ts", 0) - request["ts"])
+                last_entry = _ReplayEntry(response, latency)
+                table[request["method"]].append(last_entry)
+            elif "method" in data and last_entry is not None:
+                last_entry.events.append(data)
+
+    return table
+
+
+class FakeCDPServer:
+    """Fake CDP server (HTTP /json endpoints + WebSocket)"""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 9333,
+        trace: Optional[Union[str, Path]] = None,
+        responses: Optional[Dict[str, ScriptedResponse]] = None,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        replay_timing: bool = False,
+    ):
+        """
+        Initialize fake CDP server
+
+        Args:
+            host: Listen host
+            port: Listen port
+            trace: Trace file to replay responses and events from
+            responses: Scripted responses per method (dict result or callable(params) -> result),
+                take precedence over the trace
+            latency: Fixed response latency (seconds)
+            jitter: Random extra latency up to this many seconds
+            replay_timing: Use latencies recorded in the trace instead of `latency`
+        """
+        self.host = host
+        self.port = port
+        self.responses: Dict[str, ScriptedResponse] = dict(responses or {})
+        self.latency = latency
+        self.jitter = jitter
+        self.replay_timing = replay_timing
+        self._replay = _build_replay_table(load_trace(trace)) if trace else {}
+
+        self.targets: Dict[str, Dict[str, Any]] = {}
+        self.command_counts: Counter = Counter()
+        self._server = None
+        self._thread: Optional[threading.Thread] = None
+
+        self._add_target("about:blank")
+
+    # ------------------------------------------------------------------
+    # Targets
+    # ------------------------------------------------------------------
+
+    def _add_target(self, url: str) -> Dict[str, Any]:
+        target_id = uuid.uuid4().hex[:32].upper()
+        target = {
+            "id": target_id,
+            "type": "page",
+            "title": url,
+            "url": url,
+            "description": "",
+            "devtoolsFrontendUrl": "",
+            "webSocketDebuggerUrl": f"ws://{self.host}:{self.port}/devtools/page/{target_id}",
+        }
+        self.targets[target_id] = target
+        return target
+
+    # ------------------------------------------------------------------
+    # Command handling
+    # ------------------------------------------------------------------
+
+    def _resolve(self, method: str, params: Dict[str, Any]):
+        """Get (response, events, latency) for a command"""
+        latency = self.latency
+        scripted = self.responses.get(method)
+        if scripted is not None:
+            result = scripted(params) if callable(scripted) else scripted
+            response, events = {"result": result}, []
+        elif self._replay.get(method):
+            queue = self._replay[method]
+            # Keep the last recorded response for repeated calls
+            entry = queue.popleft() if len(queue) > 1 else queue[0]
+            response, events = entry.response, entry.events
+            if self.replay_timing:
+                latency = entry.latency
+        elif method == "Target.createTarget":
+            target = self._add_target(params.get("url", "about:blank"))
+            response, events = {"result": {"targetId": target["id"]}}, []
+        elif method == "Target.closeTarget":
+            closed = self.targets.pop(params.get("targetId"), None) is not None
+            response, events = {"result": {"success": closed}}, []
+        else:
+            response, events = {"result": DEFAULT_RESPONSES.get(method, {})}, []
+
+        if self.jitter:
+            latency += random.uniform(0, self.jitter)
+        return response, events, latency
+
+    async def _handle_websocket(self, websocket) -> None:
+        await websocket.accept()
+        send_lock = asyncio.Lock()
+
+        async def answer(request: Dict[str, Any]) -> None:
+            method = request.get("method", "")
+            self.command_counts[method] += 1
+            response, events, latency = self._resolve(method, request.get("params") or {})
+            if latency:
+                await asyncio.sleep(latency)
+            async with send_lock:
+                await websocket.send_text(json.dumps({"id": request.get("id"), **response}))
+                for event in events:
+                    await websocket.send_text(json.dumps(event))
+
+        pending = set()
+        try:
+            while True:
+                message = await websocket.receive_text()
+                try:
+                    request = json.loads(message)
+                except json.JSONDecodeError:
+                    continue
+                # Answer concurrently so latency does not serialize commands
+                task = asyncio.ensure_future(answer(request))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+        except Exception:
+            for task in pending:
+                task.cancel()
+
+    def create_app(self):
+        """
+        Create the ASGI application
+
+        Returns:
+            FastAPI: Application serving /json/* and /devtools/* endpoints
+        """
+        from fastapi import FastAPI, WebSocket
+        from fastapi.responses import JSONResponse
+
+        app = FastAPI(title="Fake CDP Server", docs_url=None, redoc_url=None)
+
+        @app.get("/json/version")
+        async def version():
+            return {
+                "Browser": "FakeChrome/1.0",
+                "Protocol-Version": "1.3",
+                "User-Agent": "FakeChrome",
+                "V8-Version": "0",
+                "WebKit-Version": "0",
+                "webSocketDebuggerUrl": f"ws://{self.host}:{self.port}/devtools/browser/fake",
+            }
+
+        @app.get("/json")
+        @app.get("/json/list")
+        async def list_targets():
+            return list(self.targets.values())
+
+        @app.api_route("/json/new", methods=["GET", "PUT"])
+        async def new_target(url: str = "about:blank"):
+            return self._add_target(url)
+
+        @app.get("/json/close/{target_id}")
+        async def close_target(target_id: str):
+            if self.targets.pop(target_id, None) is None:
+                return JSONResponse({"error": "No such target"}, status_code=404)
+            return "Target is closing"
+
+        @app.get("/json/activate/{target_id}")
+        async def activate_target(target_id: str):
+            return "Target activated"
+
+        @app.websocket("/devtools/browser")
+        @app.websocket("/devtools/browser/{browser_id}")
+        async def browser_ws(websocket: WebSocket, browser_id: str = ""):
+            await self._handle_websocket(websocket)
+
+        @app.websocket("/devtools/page/{target_id}")
+        async def page_ws(websocket: WebSocket, target_id: str):
+            await self._handle_websocket(websocket)
+
+        return app
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def _create_server(self):
+        import uvicorn
+
+        config = uvicorn.Config(
+            app=self.create_app(),
+            host=self.host,
+            port=self.port,
+            log_level="warning",
+            access_log=False,
+            ws_ping_interval=None,
+        )
+        return uvicorn.Server(config)
+
+    def start(self, timeout: float = 10.0) -> "FakeCDPServer":
+        """
+        Start the server in a background thread
+
+        Args:
+            timeout: Time (seconds) to wait for the server to accept connections
+
+        Returns:
+            FakeCDPServer: self
+
+        Raises:
+            RuntimeError: Server failed to start
+        """
+        self._server = self._create_server()
+        self._thread = threading.Thread(
+            target=self._server.run,
+            daemon=True,
+            name="FakeCDPServer"
+        )
+        self._thread.start()
+
+        deadline = time.time() + timeout
+        while not self._server.started:
+            if not self._thread.is_alive() or time.time() > deadline:
+                raise RuntimeError(f"Fake CDP server failed to start on {self.host}:{self.port}")
+            time.sleep(0.02)
+        return self
+
+    def serve_forever(self) -> None:
+        """Run the server in the current thread until interrupted"""
+        self._server = self._create_server()
+        self._server.run()
+
+    def stop(self) -> None:
+        """Stop the server"""
+        if self._server:
+            self._server.should_exit = True
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=5.0)
+        self._server = None
+        self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
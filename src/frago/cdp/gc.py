@@ -0,0 +1,448 @@
+"""
+Browser garbage collection
+
+Tabs opened through TargetCommands.create_target are recorded in
+~/.frago/chrome_targets.json with their owner, owning process and TTL.
+Sessions driving a recorded tab refresh its last-use time every
+TOUCH_INTERVAL seconds. BrowserGC closes recorded tabs left unused for
+longer than their TTL or whose owning process has exited, clears
+leftover frago overlays (highlights, annotations, underlines, pointers)
+from the recorded tabs that remain and reports the memory used by the
+Chrome process tree, so long-lived shared browsers do not accumulate
+tabs and RSS. Used by `frago chrome gc` and the server's
+periodic BrowserGCService.
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import psutil
+
+from ..compat import file_lock
+from .config import CDPConfig
+from .exceptions import CDPError
+from .logger import get_logger
+
+
+# Tracked targets file
+TARGETS_FILE = Path.home() / ".frago" / "chrome_targets.json"
+
+# Targets file format version
+TARGETS_VERSION = 1
+
+# Seconds between last-use updates of the tab a session is driving
+TOUCH_INTERVAL = 60
+
+# Pages never touched when clearing overlays
+_INTERNAL_URL_PREFIXES = ("chrome://", "chrome-extension://", "devtools://", "about:")
+
+
+def default_owner() -> str:
+    """Owner label for targets created by this process (current run ID or process name)"""
+    run_id = os.getenv("FRAGO_CURRENT_RUN")
+    if run_id:
+        return f"run:{run_id}"
+    try:
+        return psutil.Process().name()
+    except psutil.Error:
+        return "unknown"
+
+
+def _pid_alive(pid: Optional[int]) -> bool:
+    """Whether a process is still running (zombies count as exited)"""
+    if not pid:
+        return False
+    try:
+        return psutil.Process(pid).status() != psutil.STATUS_ZOMBIE
+    except psutil.Error:
+        return False
+
+
+class TargetRegistry:
+    """Record of frago-created browser targets, shared by all frago processes"""
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Initialize target registry
+
+        Changes are read-modify-write cycles under a lock on
+        <registry file>.lock, as every frago process shares the file.
+
+        Args:
+            path: Registry file, defaults to ~/.frago/chrome_targets.json
+        """
+        self.path = path or TARGETS_FILE
+        self._lock_path = self.path.with_name(f"{self.path.name}.lock")
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Load tracked targets
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Target ID -> record
+        """
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != TARGETS_VERSION:
+            return {}
+        return data.get("targets", {})
+
+    def save(self, targets: Dict[str, Dict[str, Any]]) -> None:
+        """Write tracked targets atomically (callers hold the registry lock)"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_suffix(self.path.suffix + f".{os.getpid()}.tmp")
+        try:
+            temp_path.write_text(
+                json.dumps({"version": TARGETS_VERSION, "targets": targets}, indent=2),
+                encoding="utf-8"
+            )
+            os.replace(temp_path, self.path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+    def register(
+        self,
+        target_id: str,
+        endpoint: str,
+        url: str = "",
+        owner: Optional[str] = None,
+        ttl: float = 0,
+        pid: Optional[int] = None,
+        browser_context_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Record a newly created target
+
+        Args:
+            target_id: Target ID
+            endpoint: Browser endpoint ("host:port")
+            url: Initial URL
+            owner: Owner label, defaults to the current run or process name
+            ttl: Seconds the target may go unused before it expires, 0 for no limit
+            pid: Owning process, the target is orphaned once it exits;
+                None keeps the target after its creator exits
+            browser_context_id: Browser context the target belongs to
+
+        Returns:
+            Dict[str, Any]: Stored record
+        """
+        now = time.time()
+        record = {
+            "target_id": target_id,
+            "endpoint": endpoint,
+            "url": url,
+            "owner": owner or default_owner(),
+            "pid": pid,
+            "ttl": ttl,
+            "browser_context_id": browser_context_id,
+            "created_at": now,
+            "last_used_at": now,
+        }
+        with file_lock(self._lock_path):
+            targets = self.load()
+            targets[target_id] = record
+            self.save(targets)
+        return record
+
+    def update(self, target_id: str, **fields: Any) -> bool:
+        """
+        Change fields of a tracked target's record
+
+        Args:
+            target_id: Target ID
+            **fields: Record fields to set (e.g. ttl=0)
+
+        Returns:
+            bool: Whether the target is tracked
+        """
+        with file_lock(self._lock_path):
+            targets = self.load()
+            record = targets.get(target_id)
+            if record is None:
+                return False
+            record.update(fields)
+            self.save(targets)
+        return True
+
+    def touch(self, *target_ids: str) -> None:
+        """Record that targets are in use, restarting their TTL"""
+        now = time.time()
+        with file_lock(self._lock_path):
+            targets = self.load()
+            touched = [t for t in target_ids if t in targets]
+            for target_id in touched:
+                targets[target_id]["last_used_at"] = now
+            if touched:
+                self.save(targets)
+
+    def unregister(self, *target_ids: str) -> None:
+        """Forget targets (closed or no longer present)"""
+        if not target_ids:
+            return
+        with file_lock(self._lock_path):
+            targets = self.load()
+            removed = [t for t in target_ids if targets.pop(t, None) is not None]
+            if removed:
+                self.save(targets)
+
+    def unregister_context(self, browser_context_id: str) -> None:
+        """Forget all targets of a disposed browser context"""
+        with file_lock(self._lock_path):
+            targets = self.load()
+            remaining = {
+                tid: rec for tid, rec in targets.items()
+                if rec.get("browser_context_id") != browser_context_id
+            }
+            if len(remaining) != len(targets):
+                self.save(remaining)
+
+
+def expiry_reason(record: Dict[str, Any], now: Optional[float] = None) -> Optional[str]:
+    """
+    Why a tracked target should be closed
+
+    A target expires once it has gone unused for longer than its TTL;
+    sessions driving it keep it alive (see TargetRegistry.touch). Records
+    written before last-use tracking count from their creation.
+
+    Args:
+        record: Target record
+        now: Current time, defaults to time.time()
+
+    Returns:
+        Optional[str]: "expired", "orphaned" or None if the target is still wanted
+    """
+    now = now if now is not None else time.time()
+    ttl = record.get("ttl") or 0
+    last_used = record.get("last_used_at", record.get("created_at", now))
+    if ttl > 0 and now - last_used > ttl:
+        return "expired"
+    if record.get("pid") and not _pid_alive(record["pid"]):
+        return "orphaned"
+    return None
+
+
+def chrome_memory(port: int) -> Optional[Dict[str, Any]]:
+    """
+    Memory used by the local Chrome process tree listening on a debugging port
+
+    Args:
+        port: Remote debugging port
+
+    Returns:
+        Optional[Dict[str, Any]]: Browser PID, process count, total RSS and
+            RSS per process type; None if no matching process was found
+    """
+    flag = f"--remote-debugging-port={port}"
+    browser = None
+    for proc in psutil.process_iter(["cmdline"]):
+        cmdline = proc.info.get("cmdline") or []
+        if flag in cmdline and not any(arg.startswith("--type=") for arg in cmdline):
+            browser = proc
+            break
+    if browser is None:
+        return None
+
+    try:
+        processes = [browser] + browser.children(recursive=True)
+    except psutil.Error:
+        processes = [browser]
+
+    total = 0
+    by_type: Dict[str, int] = {}
+    counted = 0
+    for proc in processes:
+        try:
+            rss = proc.memory_info().rss
+            cmdline = proc.cmdline()
+        except psutil.Error:
+            continue
+        proc_type = next(
+            (arg.split("=", 1)[1] for arg in cmdline if arg.startswith("--type=")),
+            "browser"
+        )
+        by_type[proc_type] = by_type.get(proc_type, 0) + rss
+        total += rss
+        counted += 1
+
+    return {
+        "browser_pid": browser.pid,
+        "processes": counted,
+        "rss_bytes": total,
+        "rss_by_type": by_type,
+    }
+
+
+class BrowserGC:
+    """Garbage collector for tabs and overlays left behind in a shared browser"""
+
+    def __init__(self, config: Optional[CDPConfig] = None, registry: Optional[TargetRegistry] = None):
+        """
+        Initialize browser GC
+
+        Args:
+            config: CDP configuration of the browser
+            registry: Target registry, defaults to ~/.frago/chrome_targets.json
+        """
+        self.config = config or CDPConfig()
+        self.registry = registry or TargetRegistry()
+        self.logger = get_logger()
+
+    @property
+    def endpoint(self) -> str:
+        return f"{self.config.host}:{self.config.port}"
+
+    def _get(self, path: str) -> Any:
+        import requests
+
+        response = requests.get(f"{self.config.http_url}{path}", timeout=self.config.connect_timeout)
+        response.raise_for_status()
+        return response
+
+    def list_targets(self) -> List[Dict[str, Any]]:
+        """
+        List the browser's targets
+
+        Returns:
+            List[Dict[str, Any]]: /json/list entries
+
+        Raises:
+            CDPError: Browser not reachable
+        """
+        try:
+            return self._get("/json/list").json()
+        except Exception as e:
+            raise CDPError(f"Cannot list targets at {self.endpoint}: {e}")
+
+    def close_target(self, target_id: str) -> bool:
+        """Close a target over HTTP, no DevTools connection needed"""
+        try:
+            self._get(f"/json/close/{target_id}")
+            return True
+        except Exception as e:
+            self.logger.warning(f"Failed to close target {target_id}: {e}")
+            return False
+
+    def clear_overlays(self, target: Dict[str, Any]) -> bool:
+        """
+        Remove frago overlays from a page
+
+        Args:
+            target: /json/list entry of the page
+
+        Returns:
+            bool: Whether the page was cleaned
+        """
+        from .session import CDPSession
+
+        session = CDPSession(self.config.model_copy(update={
+            "target_id": target["id"],
+            "auto_reconnect": False,
+            "fast_settle": False,
+            "collect_performance": False,
+            # Visiting a tab to clean it is not using it
+            "touch_target": False,
+        }))
+        # Nothing of the cleanup session may stay behind in the page
+        session.init_scripts = {}
+        try:
+            session.connect()
+            session.clear_effects()
+            return True
+        except CDPError as e:
+            self.logger.debug(f"Could not clear overlays in {target['id']}: {e}")
+            return False
+        finally:
+            session.disconnect()
+
+    def collect(self, dry_run: bool = False, clear_overlays: bool = True) -> Dict[str, Any]:
+        """
+        Run one collection pass
+
+        Closes tracked targets that expired or were orphaned, forgets
+        tracked targets that no longer exist, optionally clears overlays
+        from the remaining tracked pages and reports Chrome memory.
+
+        Args:
+            dry_run: Only report what would be done
+            clear_overlays: Clear frago overlays from open tracked pages
+
+        Returns:
+            Dict[str, Any]: Report (closed, overlays_cleared, tracked, pages, memory)
+
+        Raises:
+            CDPError: Browser not reachable
+        """
+        started = time.time()
+        live = self.list_targets()
+        live_ids = {t.get("id") for t in live}
+
+        tracked = {
+            tid: rec for tid, rec in self.registry.load().items()
+            if rec.get("endpoint") == self.endpoint
+        }
+        gone = [tid for tid in tracked if tid not in live_ids]
+
+        closed: List[Dict[str, Any]] = []
+        now = time.time()
+        for target in live:
+            record = tracked.get(target.get("id"))
+            reason = expiry_reason(record, now) if record else None
+            if not reason:
+                continue
+            entry = {
+                "target_id": target["id"],
+                "url": target.get("url", ""),
+                "owner": record.get("owner"),
+                "age": round(now - record.get("created_at", now), 1),
+                "idle": round(now - record.get("last_used_at", record.get("created_at", now)), 1),
+                "reason": reason,
+            }
+            if dry_run or self.close_target(target["id"]):
+                closed.append(entry)
+                self.logger.info(f"GC: closed {reason} tab {target['id']} ({entry['owner']})")
+
+        if not dry_run:
+            self.registry.unregister(*gone, *(c["target_id"] for c in closed))
+
+        closed_ids = {c["target_id"] for c in closed}
+        pages = [
+            t for t in live
+            if t.get("type") == "page" and t.get("id") not in closed_ids
+        ]
+
+        cleared: List[str] = []
+        if clear_overlays and not dry_run:
+            for target in pages:
+                # Only frago's own tabs, the user's pages are not touched
+                if target.get("id") not in tracked:
+                    continue
+                if target.get("url", "").startswith(_INTERNAL_URL_PREFIXES):
+                    continue
+                if self.clear_overlays(target):
+                    cleared.append(target["id"])
+
+        memory = None
+        if self.config.host in ("127.0.0.1", "localhost", "::1"):
+            try:
+                memory = chrome_memory(self.config.port)
+            except psutil.Error as e:
+                self.logger.debug(f"Chrome memory unavailable: {e}")
+
+        return {
+            "endpoint": self.endpoint,
+            "dry_run": dry_run,
+            "closed": closed,
+            "forgotten": len(gone),
+            "overlays_cleared": cleared,
+            "tracked": len(tracked) - len(gone) - (0 if dry_run else len(closed)),
+            "pages": len(pages),
+            "memory": memory,
+            "duration": round(time.time() - started, 3),
+        }
@@ -0,0 +1,266 @@
+"""
+Screenshot image helpers
+
+- Off-thread base64 decode and atomic file write through a small shared
+  worker pool, so capturing does not block on disk I/O
+- Streaming PNG tile stitcher: concatenates same-width PNG tiles into one
+  PNG row by row, holding only one tile's data in memory at a time
+  (standard library only, no image library required)
+"""
+
+import base64
+import os
+import struct
+import threading
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import BinaryIO, Optional, Union
+
+from .exceptions import CDPError
+
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# Channels per PNG color type (8-bit depth only, palette images unsupported)
+_PNG_CHANNELS = {0: 1, 2: 3, 4: 2, 6: 4}
+
+# Compressed bytes buffered before an IDAT chunk is written
+_IDAT_CHUNK_SIZE = 256 * 1024
+
+# Screenshot writer pool size
+WRITER_WORKERS = 2
+
+_writer_pool: Optional[ThreadPoolExecutor] = None
+_writer_pool_lock = threading.Lock()
+
+
+# ----------------------------------------------------------------------
+# Off-thread writing
+# ----------------------------------------------------------------------
+
+
+def write_image(data: str, path: Union[str, Path]) -> Path:
+    """
+    Decode base64 image data and write it atomically
+
+    Args:
+        data: Base64 image data as returned by Page.captureScreenshot
+        path: Output file path
+
+    Returns:
+        Path: Written file path
+    """
+    path = Path(path)
+    if path.parent and not path.parent.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.parent / f".tmp_{path.name}"
+    try:
+        temp_path.write_bytes(base64.b64decode(data))
+        os.replace(temp_path, path)
+    except Exception:
+        if temp_path.exists():
+            temp_path.unlink()
+        raise
+    return path
+
+
+def _get_writer_pool() -> ThreadPoolExecutor:
+    global _writer_pool
+    with _writer_pool_lock:
+        if _writer_pool is None:
+            _writer_pool = ThreadPoolExecutor(
+                max_workers=WRITER_WORKERS,
+                thread_name_prefix="ScreenshotWriter"
+            )
+        return _writer_pool
+
+
+def write_image_async(data: str, path: Union[str, Path]) -> "Future[Path]":
+    """
+    Decode and write image data on the screenshot writer pool
+
+    Pending writes are completed before the interpreter exits.
+
+    Args:
+        data: Base64 image data
+        path: Output file path
+
+    Returns:
+        Future[Path]: Resolves to the written file path
+    """
+    return _get_writer_pool().submit(write_image, data, path)
+
+
+# ----------------------------------------------------------------------
+# PNG tile stitching
+# ----------------------------------------------------------------------
+
+
+def _read_chunks(png: bytes):
+    """Yield (type, data) for each chunk of a PNG file"""
+    if not png.startswith(PNG_SIGNATURE):
+        raise CDPError("Screenshot tile is not a PNG image")
+    offset = len(PNG_SIGNATURE)
+    while offset + 8 <= len(png):
+        length, chunk_type = struct.unpack(">I4s", png[offset:offset + 8])
+        start = offset + 8
+        yield chunk_type, png[start:start + length]
+        offset = start + length + 4  # skip CRC
+
+
+def _write_chunk(f: BinaryIO, chunk_type: bytes, data: bytes) -> None:
+    f.write(struct.pack(">I", len(data)))
+    f.write(chunk_type)
+    f.write(data)
+    f.write(struct.pack(">I", zlib.crc32(chunk_type + data) & 0xFFFFFFFF))
+
+
+def _unfilter_first_row(row: bytearray, bpp: int) -> bytearray:
+    """
+    Undo the filter of a tile's first scanline (previous row is all zeros)
+
+    Up/Average/Paeth reference the previous row, which changes once tiles
+    are concatenated, so the first row of each tile is re-emitted unfiltered.
+    """
+    filter_type = row[0]
+    raw = row[1:]
+    if filter_type in (1, 4):  # Sub, Paeth (Paeth degenerates to Sub here)
+        for i in range(bpp, len(raw)):
+            raw[i] = (raw[i] + raw[i - bpp]) & 0xFF
+    elif filter_type == 3:  # Average
+        for i in range(bpp, len(raw)):
+            raw[i] = (raw[i] + (raw[i - bpp] >> 1)) & 0xFF
+    return bytearray(b"\x00") + raw
+
+
+class PNGStitcher:
+    """
+    Stream same-width PNG tiles into a single PNG file
+
+    Usage:
+        with PNGStitcher(path) as stitcher:
+            for tile in tiles:
+                stitcher.add_tile(tile_bytes)
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.width: Optional[int] = None
+        self.height = 0
+        self.tiles = 0
+        self._header: Optional[tuple] = None
+        self._bpp = 0
+        self._file: Optional[BinaryIO] = None
+        self._compressor = zlib.compressobj(6)
+        self._pending = bytearray()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def _start(self, header: tuple) -> None:
+        width, _height, bit_depth, color_type, _comp, _filter, interlace = header
+        if bit_depth != 8 or color_type not in _PNG_CHANNELS or interlace != 0:
+            raise CDPError(
+                f"Unsupported PNG tile format (bit depth {bit_depth}, color type {color_type}, "
+                f"interlace {interlace})"
+            )
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path.parent / f".tmp_{self.path.name}", "wb")
+        self._file.write(PNG_SIGNATURE)
+        # Height is patched in close() once all tiles are known
+        _write_chunk(self._file, b"IHDR", struct.pack(">IIBBBBB", *header))
+        self._header = header
+        self.width = width
+        self._bpp = _PNG_CHANNELS[color_type]
+
+    def _emit(self, data: bytes) -> None:
+        self._pending += self._compressor.compress(data)
+        if len(self._pending) >= _IDAT_CHUNK_SIZE:
+            _write_chunk(self._file, b"IDAT", bytes(self._pending))
+            self._pending.clear()
+
+    def add_tile(self, png: bytes) -> None:
+        """
+        Append a PNG tile below the previous ones
+
+        Args:
+            png: PNG file bytes (same width and pixel format as the first tile)
+
+        Raises:
+            CDPError: Tile is not a compatible PNG
+        """
+        decompressor = zlib.decompressobj()
+        buffer = bytearray()
+        row_length = None
+        rows = 0
+        first_row = True
+        tile_height = 0
+
+        for chunk_type, data in _read_chunks(png):
+            if chunk_type == b"IHDR":
+                header = struct.unpack(">IIBBBBB", data)
+                if self._header is None:
+                    self._start(header)
+                elif header[0] != self._header[0] or header[2:] != self._header[2:]:
+                    raise CDPError("Screenshot tiles differ in width or pixel format")
+                tile_height = header[1]
+                row_length = 1 + self.width * self._bpp
+            elif chunk_type == b"IDAT":
+                if row_length is None:
+                    raise CDPError("PNG tile has image data before its header")
+                buffer += decompressor.decompress(data)
+                while len(buffer) >= row_length:
+                    row = buffer[:row_length]
+                    del buffer[:row_length]
+                    if first_row and self.tiles > 0:
+                        row = _unfilter_first_row(row, self._bpp)
+                    first_row = False
+                    self._emit(bytes(row))
+                    rows += 1
+            elif chunk_type == b"IEND":
+                break
+
+        if rows != tile_height:
+            raise CDPError(f"Truncated PNG tile ({rows} of {tile_height} rows)")
+        self.height += tile_height
+        self.tiles += 1
+
+    def close(self) -> Path:
+        """
+        Finish the output file
+
+        Returns:
+            Path: Output file path
+        """
+        if self._file is None:
+            raise CDPError("No tiles were added")
+        self._pending += self._compressor.flush()
+        if self._pending:
+            _write_chunk(self._file, b"IDAT", bytes(self._pending))
+        _write_chunk(self._file, b"IEND", b"")
+
+        # Patch IHDR with the final height
+        header = (self._header[0], self.height) + self._header[2:]
+        self._file.seek(len(PNG_SIGNATURE))
+        _write_chunk(self._file, b"IHDR", struct.pack(">IIBBBBB", *header))
+        temp_path = Path(self._file.name)
+        self._file.close()
+        self._file = None
+        os.replace(temp_path, self.path)
+        return self.path
+
+    def abort(self) -> None:
+        """Discard the partially written output"""
+        if self._file is not None:
+            temp_path = Path(self._file.name)
+            self._file.close()
+            self._file = None
+            if temp_path.exists():
+                temp_path.unlink()
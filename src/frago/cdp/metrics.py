@@ -0,0 +1,415 @@
+"""
+CDP session metrics
+
+Opt-in instrumentation for CDPSession: per-method latency histograms,
+bytes sent/received, dispatched events per domain, message queue depth and
+reconnects. Sessions merge their snapshot into ~/.frago/cdp_stats.json on
+disconnect so that short-lived CLI invocations accumulate into one view
+(`frago chrome stats`, GET /api/cdp/stats).
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ..compat import file_lock
+
+
+# Accumulated stats file
+STATS_FILE = Path.home() / ".frago" / "cdp_stats.json"
+
+# Stats file format version
+STATS_VERSION = 1
+
+# Linear sub-buckets per power of two (16 -> ~6% relative precision)
+_SUB_BUCKET_BITS = 4
+_SUB_BUCKETS = 1 << _SUB_BUCKET_BITS
+
+
+def _bucket_index(value: int) -> int:
+    """Map a non-negative integer to its log-linear bucket index"""
+    if value < _SUB_BUCKETS:
+        return value
+    exponent = value.bit_length() - 1
+    shift = exponent - _SUB_BUCKET_BITS
+    sub = (value >> shift) & (_SUB_BUCKETS - 1)
+    return (shift + 1) * _SUB_BUCKETS + sub
+
+
+def _bucket_value(index: int) -> float:
+    """Representative (midpoint) value of a bucket"""
+    if index < _SUB_BUCKETS:
+        return float(index)
+    shift = index // _SUB_BUCKETS - 1
+    sub = index % _SUB_BUCKETS
+    lower = (_SUB_BUCKETS + sub) << shift
+    return lower + ((1 << shift) - 1) / 2
+
+
+class LatencyHistogram:
+    """
+    HDR-style latency histogram
+
+    Values are recorded in microseconds into log-linear buckets, giving
+    bounded relative error at any magnitude with a small, mergeable
+    bucket map.
+    """
+
+    def __init__(self):
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total_us = 0
+        self.min_us: Optional[int] = None
+        self.max_us = 0
+
+    def record(self, seconds: float) -> None:
+        """
+        Record a latency sample
+
+        Args:
+            seconds: Latency (seconds)
+        """
+        value = max(0, int(seconds * 1_000_000))
+        index = _bucket_index(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total_us += value
+        if self.min_us is None or value < self.min_us:
+            self.min_us = value
+        if value > self.max_us:
+            self.max_us = value
+
+    def percentile(self, percent: float) -> float:
+        """
+        Get latency at a percentile
+
+        Args:
+            percent: Percentile (0-100)
+
+        Returns:
+            float: Latency in milliseconds, 0 if empty
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, int(round(percent / 100 * self.count)))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                value = min(max(_bucket_value(index), self.min_us or 0), self.max_us)
+                return value / 1000
+        return self.max_us / 1000
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add another histogram's samples into this one"""
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+        self.total_us += other.total_us
+        if other.min_us is not None and (self.min_us is None or other.min_us < self.min_us):
+            self.min_us = other.min_us
+        self.max_us = max(self.max_us, other.max_us)
+
+    def summary(self) -> Dict[str, float]:
+        """
+        Get summary statistics
+
+        Returns:
+            Dict[str, float]: count, mean/min/max and p50/p95/p99 (milliseconds)
+        """
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total_us / self.count / 1000, 3) if self.count else 0.0,
+            "min_ms": round((self.min_us or 0) / 1000, 3),
+            "p50_ms": round(self.percentile(50), 3),
+            "p95_ms": round(self.percentile(95), 3),
+            "p99_ms": round(self.percentile(99), 3),
+            "max_ms": round(self.max_us / 1000, 3),
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "counts": {str(k): v for k, v in self.counts.items()},
+            "count": self.count,
+            "total_us": self.total_us,
+            "min_us": self.min_us,
+            "max_us": self.max_us,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencyHistogram":
+        histogram = cls()
+        histogram.counts = {int(k): v for k, v in data.get("counts", {}).items()}
+        histogram.count = data.get("count", 0)
+        histogram.total_us = data.get("total_us", 0)
+        histogram.min_us = data.get("min_us")
+        histogram.max_us = data.get("max_us", 0)
+        return histogram
+
+
+class CDPMetrics:
+    """Metrics collector for one CDP session (thread-safe)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started_at = time.time()
+        self.latency: Dict[str, LatencyHistogram] = {}
+        self.errors: Dict[str, int] = {}
+        self.events: Dict[str, int] = {}
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.messages_received = 0
+        self.max_queue_depth = 0
+        self._queue_depth_total = 0
+        self.reconnects = 0
+        self.sessions = 1
+
+    def record_command(self, method: str, seconds: float, error: bool = False) -> None:
+        """
+        Record a completed command
+
+        Args:
+            method: CDP method name
+            seconds: Time from send to response (seconds)
+            error: Whether the command failed
+        """
+        with self._lock:
+            histogram = self.latency.get(method)
+            if histogram is None:
+                histogram = self.latency[method] = LatencyHistogram()
+            histogram.record(seconds)
+            if error:
+                self.errors[method] = self.errors.get(method, 0) + 1
+
+    def record_sent(self, size: int) -> None:
+        """Record an outgoing message of size bytes"""
+        with self._lock:
+            self.bytes_sent += size
+
+    def record_received(self, size: int, queue_depth: int) -> None:
+        """
+        Record an incoming message
+
+        Args:
+            size: Message size (bytes)
+            queue_depth: Message queue depth after enqueueing
+        """
+        with self._lock:
+            self.bytes_received += size
+            self.messages_received += 1
+            self._queue_depth_total += queue_depth
+            if queue_depth > self.max_queue_depth:
+                self.max_queue_depth = queue_depth
+
+    def record_event(self, method: str) -> None:
+        """Record a dispatched event, counted per domain"""
+        domain = method.split(".", 1)[0]
+        with self._lock:
+            self.events[domain] = self.events.get(domain, 0) + 1
+
+    def merge(self, other: "CDPMetrics") -> None:
+        """Add another collector's metrics into this one"""
+        with self._lock:
+            for method, histogram in other.latency.items():
+                self.latency.setdefault(method, LatencyHistogram()).merge(histogram)
+            for method, count in other.errors.items():
+                self.errors[method] = self.errors.get(method, 0) + count
+            for domain, count in other.events.items():
+                self.events[domain] = self.events.get(domain, 0) + count
+            self.bytes_sent += other.bytes_sent
+            self.bytes_received += other.bytes_received
+            self.messages_received += other.messages_received
+            self._queue_depth_total += other._queue_depth_total
+            self.max_queue_depth = max(self.max_queue_depth, other.max_queue_depth)
+            self.reconnects += other.reconnects
+            self.sessions += other.sessions
+            self.started_at = min(self.started_at, other.started_at)
+
+    @property
+    def empty(self) -> bool:
+        return not self.latency and not self.messages_received
+
+    def summary(self, top: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Get human-oriented summary
+
+        Args:
+            top: Only include the N methods with the highest total time
+
+        Returns:
+            Dict[str, Any]: Summary with per-method latency percentiles
+        """
+        with self._lock:
+            methods = sorted(
+                self.latency.items(),
+                key=lambda item: item[1].total_us,
+                reverse=True
+            )
+            if top:
+                methods = methods[:top]
+            return {
+                "since": self.started_at,
+                "sessions": self.sessions,
+                "commands": sum(h.count for h in self.latency.values()),
+                "bytes_sent": self.bytes_sent,
+                "bytes_received": self.bytes_received,
+                "messages_received": self.messages_received,
+                "max_queue_depth": self.max_queue_depth,
+                "mean_queue_depth": round(
+                    self._queue_depth_total / self.messages_received, 2
+                ) if self.messages_received else 0.0,
+                "reconnects": self.reconnects,
+                "events": dict(sorted(self.events.items(), key=lambda i: -i[1])),
+                "methods": {
+                    method: {**histogram.summary(), "errors": self.errors.get(method, 0)}
+                    for method, histogram in methods
+                },
+            }
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "version": STATS_VERSION,
+                "started_at": self.started_at,
+                "sessions": self.sessions,
+                "latency": {m: h.to_dict() for m, h in self.latency.items()},
+                "errors": dict(self.errors),
+                "events": dict(self.events),
+                "bytes_sent": self.bytes_sent,
+                "bytes_received": self.bytes_received,
+                "messages_received": self.messages_received,
+                "max_queue_depth": self.max_queue_depth,
+                "queue_depth_total": self._queue_depth_total,
+                "reconnects": self.reconnects,
+            }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CDPMetrics":
+        metrics = cls()
+        metrics.started_at = data.get("started_at", metrics.started_at)
+        metrics.sessions = data.get("sessions", 0)
+        metrics.latency = {
+            m: LatencyHistogram.from_dict(h) for m, h in data.get("latency", {}).items()
+        }
+        metrics.errors = dict(data.get("errors", {}))
+        metrics.events = dict(data.get("events", {}))
+        metrics.bytes_sent = data.get("bytes_sent", 0)
+        metrics.bytes_received = data.get("bytes_received", 0)
+        metrics.messages_received = data.get("messages_received", 0)
+        metrics.max_queue_depth = data.get("max_queue_depth", 0)
+        metrics._queue_depth_total = data.get("queue_depth_total", 0)
+        metrics.reconnects = data.get("reconnects", 0)
+        return metrics
+
+
+def load_stats(path: Optional[Path] = None) -> CDPMetrics:
+    """
+    Load accumulated stats
+
+    Args:
+        path: Stats file, defaults to ~/.frago/cdp_stats.json
+
+    Returns:
+        CDPMetrics: Accumulated metrics (empty if none recorded)
+    """
+    stats_file = path or STATS_FILE
+    try:
+        data = json.loads(stats_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        data = None
+    if not data or data.get("version") != STATS_VERSION:
+        metrics = CDPMetrics()
+        metrics.sessions = 0
+        return metrics
+    return CDPMetrics.from_dict(data)
+
+
+def save_stats(metrics: CDPMetrics, path: Optional[Path] = None) -> Path:
+    """
+    Merge a session's metrics into the accumulated stats file
+
+    The merge holds a lock on <stats file>.lock, so sessions finishing at
+    the same time do not drop each other's metrics.
+
+    Args:
+        metrics: Session metrics
+        path: Stats file, defaults to ~/.frago/cdp_stats.json
+
+    Returns:
+        Path: Stats file path
+    """
+    stats_file = path or STATS_FILE
+    with file_lock(_lock_path(stats_file)):
+        accumulated = load_stats(stats_file)
+        accumulated.merge(metrics)
+        write_stats(accumulated, stats_file)
+    return stats_file
+
+
+def write_stats(metrics: CDPMetrics, path: Path) -> None:
+    """Write metrics to path atomically"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        temp_path.write_text(json.dumps(metrics.to_dict()), encoding="utf-8")
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def _lock_path(path: Path) -> Path:
+    return path.with_name(f"{path.name}.lock")
+
+
+def reset_stats(path: Optional[Path] = None) -> None:
+    """Delete accumulated stats"""
+    stats_file = path or STATS_FILE
+    with file_lock(_lock_path(stats_file)):
+        stats_file.unlink(missing_ok=True)
+
+
+def format_stats(summary: Dict[str, Any]) -> List[str]:
+    """
+    Format a stats summary as text table lines
+
+    Args:
+        summary: Summary as returned by CDPMetrics.summary
+
+    Returns:
+        List[str]: Output lines
+    """
+    lines = [
+        f"Sessions: {summary['sessions']}  Commands: {summary['commands']}  "
+        f"Reconnects: {summary['reconnects']}",
+        f"Sent: {format_bytes(summary['bytes_sent'])}  "
+        f"Received: {format_bytes(summary['bytes_received'])} "
+        f"({summary['messages_received']} messages)",
+        f"Queue depth: max {summary['max_queue_depth']}, mean {summary['mean_queue_depth']}",
+    ]
+    if summary["events"]:
+        lines.append("Events: " + ", ".join(f"{d}={n}" for d, n in summary["events"].items()))
+
+    if summary["methods"]:
+        lines.append("")
+        lines.append(
+            f"{'Method':<40} {'count':>7} {'p50':>9} {'p95':>9} {'p99':>9} {'max':>9} {'err':>5}"
+        )
+        for method, s in summary["methods"].items():
+            lines.append(
+                f"{method:<40} {s['count']:>7} {s['p50_ms']:>8.1f}ms {s['p95_ms']:>7.1f}ms "
+                f"{s['p99_ms']:>7.1f}ms {s['max_ms']:>7.1f}ms {s['errors']:>5}"
+            )
+    return lines
+
+
+def format_bytes(size: int) -> str:
+    """Format a byte count for display (e.g. "1.5MB")"""
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f}{unit}" if unit == "B" else f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.1f}GB"
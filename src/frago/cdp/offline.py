@@ -0,0 +1,166 @@
+"""
+Offline page snapshots
+
+Saves pages as MHTML archives (with a small JSON sidecar recording the
+original URL) and reopens them in an isolated tab with network access
+disabled, so extraction scripts can be developed and benchmarked against
+a fixed copy of a page instead of the live site.
+"""
+
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from .config import CDPConfig
+from .exceptions import CDPError
+from .logger import get_logger
+from .session import CDPSession
+
+
+def get_snapshot_meta_path(snapshot_path: Union[str, Path]) -> Path:
+    """Get sidecar metadata path of a snapshot (archive.mhtml -> archive.json)"""
+    return Path(snapshot_path).with_suffix(".json")
+
+
+def save_snapshot(session: CDPSession, output_file: Union[str, Path]) -> Dict[str, Any]:
+    """
+    Capture the current page as MHTML and save it with its metadata
+
+    Args:
+        session: Connected CDP session
+        output_file: Output .mhtml path
+
+    Returns:
+        Dict[str, Any]: Snapshot metadata (file, url, title, size, captured_at)
+    """
+    output_path = Path(output_file)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    data = session.page.capture_snapshot()
+    if not data:
+        raise CDPError("Page snapshot returned no data")
+
+    # MHTML is ASCII-safe (parts are quoted-printable/base64 encoded)
+    output_path.write_text(data, encoding="utf-8", newline="")
+
+    meta = {
+        "file": str(output_path),
+        "url": session.evaluate("window.location.href"),
+        "title": session.page.get_title(),
+        "size": len(data),
+        "captured_at": time.time(),
+    }
+    get_snapshot_meta_path(output_path).write_text(
+        json.dumps(meta, ensure_ascii=False, indent=2), encoding="utf-8"
+    )
+    return meta
+
+
+class OfflineSnapshotTab:
+    """
+    Isolated, network-disabled tab showing an MHTML snapshot
+
+    The tab lives in its own browser context when the browser allows it.
+    Network emulation is bound to the DevTools session, so the tab stays
+    offline only while this object is open; other clients (e.g. recipe
+    subprocesses) attach to it via target_id / FRAGO_TARGET_ID.
+
+    Usage:
+        with OfflineSnapshotTab("page.mhtml") as tab:
+            run_recipe(env={**os.environ, **tab.env})
+    """
+
+    def __init__(self, snapshot_path: Union[str, Path], config: Optional[CDPConfig] = None,
+                 load_timeout: float = 30):
+        """
+        Initialize offline snapshot tab
+
+        Args:
+            snapshot_path: MHTML snapshot path
+            config: CDP configuration of the browser to open the tab in
+            load_timeout: Time (seconds) to wait for the snapshot to load
+        """
+        self.snapshot_path = Path(snapshot_path).expanduser().resolve()
+        self.config = config or CDPConfig()
+        self.load_timeout = load_timeout
+        self.logger = get_logger()
+        self.target_id: Optional[str] = None
+        self.browser_context_id: Optional[str] = None
+        self._browser: Optional[CDPSession] = None
+        self._tab: Optional[CDPSession] = None
+
+    @property
+    def env(self) -> Dict[str, str]:
+        """Environment variables that point frago commands at this tab"""
+        return {
+            "FRAGO_CDP_HOST": self.config.host,
+            "FRAGO_CDP_PORT": str(self.config.port),
+            "FRAGO_TARGET_ID": self.target_id or "",
+        }
+
+    def open(self) -> "OfflineSnapshotTab":
+        """
+        Open the snapshot in a new offline tab
+
+        Returns:
+            OfflineSnapshotTab: self
+
+        Raises:
+            CDPError: Snapshot missing or tab could not be opened
+        """
+        if not self.snapshot_path.is_file():
+            raise CDPError(f"Snapshot not found: {self.snapshot_path}")
+
+        self._browser = CDPSession(self.config.model_copy(update={"target_id": None}))
+        self._browser.connect()
+        try:
+            try:
+                self.browser_context_id = self._browser.target.create_browser_context()
+            except CDPError as e:
+                self.logger.debug(f"Isolated browser context unavailable, using default: {e}")
+                self.browser_context_id = None
+            self.target_id = self._browser.target.create_target(
+                "about:blank", browser_context_id=self.browser_context_id
+            )
+
+            self._tab = CDPSession(self.config.model_copy(update={"target_id": self.target_id}))
+            self._tab.connect()
+            self._tab.send_command("Network.enable")
+            self._tab.send_command("Network.emulateNetworkConditions", {
+                "offline": True,
+                "latency": 0,
+                "downloadThroughput": -1,
+                "uploadThroughput": -1
+            })
+            self._tab.navigate(self.snapshot_path.as_uri())
+            self._tab.wait_for_load(timeout=self.load_timeout)
+        except Exception:
+            self.close()
+            raise
+
+        self.logger.info(f"Opened offline snapshot {self.snapshot_path.name} in tab {self.target_id}")
+        return self
+
+    def close(self) -> None:
+        """Close the tab and its browser context"""
+        if self._tab:
+            self._tab.disconnect()
+            self._tab = None
+        if self._browser:
+            try:
+                if self.browser_context_id:
+                    self._browser.target.dispose_browser_context(self.browser_context_id)
+                elif self.target_id:
+                    self._browser.target.close_target(self.target_id)
+            except CDPError as e:
+                self.logger.warning(f"Failed to close offline snapshot tab: {e}")
+            finally:
+                self._browser.disconnect()
+                self._browser = None
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,215 @@
+/**
+ * Frago Readable - main content extraction
+ *
+ * Scores block containers readability-style (text length, commas,
+ * link density, class/id hints), converts the best candidate to Markdown
+ * with links and returns one slice of it. The Markdown is cached on the
+ * window so paging through it with increasing offsets does not re-run
+ * the extraction.
+ *
+ * Usage: evaluate "(<this file>)({selector, offset, limit})"
+ */
+(function (options) {
+    options = options || {};
+    var offset = Math.max(0, options.offset || 0);
+    var limit = options.limit || 0;
+
+    var POSITIVE = /article|body|content|entry|hentry|main|page|post|text|blog|story|prose/i;
+    var NEGATIVE = /comment|meta|footer|footnote|foot|nav|menu|sidebar|side|widget|share|social|related|promo|sponsor|advert|\bad-|banner|breadcrumb|cookie|consent|popup|modal|masthead|header|subscribe|newsletter/i;
+    var SKIP_TAGS = {
+        SCRIPT: 1, STYLE: 1, NOSCRIPT: 1, TEMPLATE: 1, SVG: 1, CANVAS: 1, IFRAME: 1,
+        FORM: 1, BUTTON: 1, INPUT: 1, SELECT: 1, TEXTAREA: 1, NAV: 1, FOOTER: 1, ASIDE: 1
+    };
+
+    function hidden(el) {
+        if (el.hidden || el.getAttribute('aria-hidden') === 'true') return true;
+        if (el.checkVisibility) return !el.checkVisibility();
+        var style = el.ownerDocument.defaultView.getComputedStyle(el);
+        return style.display === 'none' || style.visibility === 'hidden';
+    }
+
+    function classWeight(el) {
+        var hint = (el.className && el.className.baseVal === undefined ? el.className : '') + ' ' + (el.id || '');
+        var weight = 0;
+        if (NEGATIVE.test(hint)) weight -= 25;
+        if (POSITIVE.test(hint)) weight += 25;
+        if (el.tagName === 'ARTICLE' || el.tagName === 'MAIN' || el.getAttribute('role') === 'main') weight += 30;
+        return weight;
+    }
+
+    function linkDensity(el, textLength) {
+        if (!textLength) return 0;
+        var linkLength = 0;
+        var anchors = el.getElementsByTagName('a');
+        for (var i = 0; i < anchors.length; i++) {
+            linkLength += (anchors[i].textContent || '').length;
+        }
+        return linkLength / textLength;
+    }
+
+    function findMainContent(root) {
+        var scores = new Map();
+        var paragraphs = root.querySelectorAll('p, pre, td, blockquote, li, h2, h3');
+        for (var i = 0; i < paragraphs.length; i++) {
+            var p = paragraphs[i];
+            var text = (p.textContent || '').trim();
+            if (text.length < 25) continue;
+            var score = 1 + text.split(/[,，、]/).length + Math.min(Math.floor(text.length / 100), 3);
+            // Credit the parent fully and the grandparent half, as readability does
+            var ancestor = p.parentElement;
+            for (var level = 0; ancestor && level < 3; level++) {
+                if (!scores.has(ancestor)) scores.set(ancestor, classWeight(ancestor));
+                scores.set(ancestor, scores.get(ancestor) + score / (level === 0 ? 1 : level * 2));
+                ancestor = ancestor.parentElement;
+            }
+        }
+
+        var best = null;
+        var bestScore = 0;
+        scores.forEach(function (score, el) {
+            var adjusted = score * (1 - linkDensity(el, (el.textContent || '').length));
+            if (adjusted > bestScore) {
+                best = el;
+                bestScore = adjusted;
+            }
+        });
+        return best || root;
+    }
+
+    function collapse(text) {
+        return text.replace(/\s+/g, ' ');
+    }
+
+    function escapeLinkText(text) {
+        return text.replace(/([\[\]])/g, '\\$1');
+    }
+
+    function emphasis(text, marker) {
+        // Markers must hug the text: "a **b** c", not "a ** b ** c"
+        var body = text.trim();
+        if (!body) return text;
+        return (/^\s/.test(text) ? ' ' : '') + marker + body + marker + (/\s$/.test(text) ? ' ' : '');
+    }
+
+    function toMarkdown(node, ctx) {
+        if (node.nodeType === 3) return collapse(node.nodeValue);
+        if (node.nodeType !== 1) return '';
+        var el = node;
+        var tag = el.tagName;
+        if (SKIP_TAGS[tag]) return '';
+        if (el !== ctx.root && (NEGATIVE.test((typeof el.className === 'string' ? el.className : '') + ' ' + (el.id || '')) &&
+            linkDensity(el, (el.textContent || '').length) > 0.5)) return '';
+        if (hidden(el)) return '';
+
+        function inner() {
+            var out = '';
+            for (var child = el.firstChild; child; child = child.nextSibling) {
+                out += toMarkdown(child, ctx);
+            }
+            return out;
+        }
+
+        switch (tag) {
+            case 'H1': case 'H2': case 'H3': case 'H4': case 'H5': case 'H6':
+                var heading = inner().trim();
+                return heading ? '\n\n' + '######'.slice(0, +tag[1]) + ' ' + heading + '\n\n' : '';
+            case 'P': case 'DIV': case 'SECTION': case 'ARTICLE': case 'MAIN': case 'FIGURE': case 'HEADER':
+                return '\n\n' + inner().trim() + '\n\n';
+            case 'BR':
+                return '\n';
+            case 'HR':
+                return '\n\n---\n\n';
+            case 'A':
+                var label = inner().trim();
+                var href = el.href || '';
+                if (!href || href.indexOf('javascript:') === 0) return label;
+                if (!label) return '';
+                ctx.links++;
+                return '[' + escapeLinkText(label) + '](' + href + ')';
+            case 'IMG':
+                var alt = (el.getAttribute('alt') || '').trim();
+                return alt && el.src ? '![' + escapeLinkText(alt) + '](' + el.src + ')' : '';
+            case 'STRONG': case 'B':
+                return emphasis(inner(), '**');
+            case 'EM': case 'I':
+                return emphasis(inner(), '*');
+            case 'CODE':
+                if (el.parentElement && el.parentElement.tagName === 'PRE') return el.textContent;
+                return '`' + el.textContent + '`';
+            case 'PRE':
+                return '\n\n```\n' + el.textContent.replace(/\n+$/, '') + '\n```\n\n';
+            case 'BLOCKQUOTE':
+                return '\n\n' + inner().trim().split('\n').map(function (line) {
+                    return '> ' + line;
+                }).join('\n') + '\n\n';
+            case 'UL': case 'OL':
+                var items = [];
+                var index = 1;
+                for (var li = el.firstElementChild; li; li = li.nextElementSibling) {
+                    if (li.tagName !== 'LI' || hidden(li)) continue;
+                    var body = '';
+                    for (var c = li.firstChild; c; c = c.nextSibling) body += toMarkdown(c, ctx);
+                    body = body.trim().replace(/\n{2,}/g, '\n');
+                    if (!body) continue;
+                    var bullet = tag === 'OL' ? (index++) + '. ' : '- ';
+                    // Nested lists end up indented under their item
+                    items.push(bullet + body.replace(/\n/g, '\n  '));
+                }
+                return items.length ? '\n\n' + items.join('\n') + '\n\n' : '';
+            case 'TABLE':
+                var rows = [];
+                var trs = el.querySelectorAll('tr');
+                for (var r = 0; r < trs.length; r++) {
+                    var cells = [];
+                    for (var cell = trs[r].firstElementChild; cell; cell = cell.nextElementSibling) {
+                        var cellText = '';
+                        for (var cc = cell.firstChild; cc; cc = cc.nextSibling) cellText += toMarkdown(cc, ctx);
+                        cells.push(cellText.trim().replace(/\s*\n\s*/g, ' ').replace(/\|/g, '\\|'));
+                    }
+                    if (!cells.length) continue;
+                    rows.push('| ' + cells.join(' | ') + ' |');
+                    if (rows.length === 1) {
+                        rows.push('|' + cells.map(function () { return ' --- '; }).join('|') + '|');
+                    }
+                }
+                return rows.length ? '\n\n' + rows.join('\n') + '\n\n' : '';
+            default:
+                return inner();
+        }
+    }
+
+    function extract() {
+        var root = options.selector ? document.querySelector(options.selector) : null;
+        if (options.selector && !root) return null;
+        var main = root || findMainContent(document.body);
+        var ctx = { root: main, links: 0 };
+        var markdown = toMarkdown(main, ctx)
+            .replace(/[ \t]+\n/g, '\n')
+            .replace(/\n{3,}/g, '\n\n')
+            .trim();
+        var title = document.title || '';
+        if (title && markdown.indexOf('# ') !== 0) markdown = '# ' + title + '\n\n' + markdown;
+        return { markdown: markdown, links: ctx.links };
+    }
+
+    // Reuse the extraction while the page stays the same
+    var key = location.href + '|' + (options.selector || '') + '|' + document.getElementsByTagName('*').length;
+    var cache = window.__fragoReadable;
+    if (!cache || cache.key !== key) {
+        var extracted = extract();
+        if (!extracted) return { error: 'Element not found' };
+        cache = window.__fragoReadable = { key: key, markdown: extracted.markdown, links: extracted.links };
+    }
+
+    var total = cache.markdown.length;
+    var end = limit > 0 ? Math.min(total, offset + limit) : total;
+    return {
+        source_url: location.href,
+        title: document.title || '',
+        content: cache.markdown.slice(offset, end),
+        offset: offset,
+        total_length: total,
+        next_offset: end < total ? end : null,
+        links_count: cache.links
+    };
+})
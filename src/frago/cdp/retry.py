@@ -6,10 +6,11 @@ Implements exponential backoff retry strategy for handling CDP connection and co
 
 import time
 import random
-from typing import Callable, Any, Optional, Tuple, Type
+import threading
+from typing import Callable, Any, Dict, Optional, Tuple, Type
 
 from .logger import get_logger
-from .exceptions import RetryExhaustedError, ProxyConnectionError, ConnectionError
+from .exceptions import RetryExhaustedError, ProxyConnectionError, ConnectionError, CircuitOpenError
 
 
 class RetryPolicy:
@@ -155,6 +156,135 @@ class RetryableOperation:
         return wrapper
 
 
+class CircuitBreaker:
+    """Circuit breaker
+
+    Tracks consecutive failures against an endpoint. After failure_threshold
+    failures the circuit opens and calls fail fast for reset_timeout seconds,
+    then a single trial call is let through (half-open); success closes the
+    circuit again, failure re-opens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 30.0):
+        """
+        Initialize circuit breaker
+
+        Args:
+            failure_threshold: Consecutive failures before opening the circuit
+            reset_timeout: Time (seconds) the circuit stays open before a trial call
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failure_count = 0
+        self.opened_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self.logger = get_logger()
+
+    @property
+    def state(self) -> str:
+        """Get current circuit state"""
+        with self._lock:
+            return self._state_unlocked()
+
+    def _state_unlocked(self) -> str:
+        if self.opened_at is None:
+            return self.CLOSED
+        if time.time() - self.opened_at >= self.reset_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def before_call(self) -> None:
+        """
+        Check whether a call may proceed
+
+        Raises:
+            CircuitOpenError: Circuit is open
+        """
+        with self._lock:
+            if self._state_unlocked() == self.OPEN:
+                remaining = self.reset_timeout - (time.time() - self.opened_at)
+                raise CircuitOpenError(
+                    f"Circuit open after {self.failure_count} consecutive failures, "
+                    f"retry in {remaining:.1f}s"
+                )
+
+    def record_success(self) -> None:
+        """Record a successful call, closing the circuit"""
+        with self._lock:
+            self.failure_count = 0
+            self.opened_at = None
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the circuit when threshold is reached"""
+        with self._lock:
+            self.failure_count += 1
+            if self.failure_count >= self.failure_threshold:
+                if self.opened_at is None:
+                    self.logger.warning(
+                        f"Circuit opened after {self.failure_count} consecutive failures"
+                    )
+                self.opened_at = time.time()
+
+    def call(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Execute function through the circuit breaker
+
+        Args:
+            func: Function to execute
+            *args: Function arguments
+            **kwargs: Function keyword arguments
+
+        Returns:
+            Any: Function execution result
+
+        Raises:
+            CircuitOpenError: Circuit is open
+            Exception: Exception raised by func
+        """
+        self.before_call()
+        try:
+            result = func(*args, **kwargs)
+        except Exception:
+            self.record_failure()
+            raise
+        self.record_success()
+        return result
+
+
+# Circuit breakers shared per endpoint, so all sessions against the same
+# Chrome instance fail fast together while it is down
+_circuit_breakers: Dict[str, CircuitBreaker] = {}
+_circuit_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(
+    endpoint: str,
+    failure_threshold: int = 3,
+    reset_timeout: float = 30.0
+) -> CircuitBreaker:
+    """
+    Get the shared circuit breaker for an endpoint
+
+    Args:
+        endpoint: Endpoint key, e.g. "127.0.0.1:9222"
+        failure_threshold: Consecutive failures before opening (used on creation)
+        reset_timeout: Open duration in seconds (used on creation)
+
+    Returns:
+        CircuitBreaker: Circuit breaker instance
+    """
+    with _circuit_breakers_lock:
+        breaker = _circuit_breakers.get(endpoint)
+        if breaker is None:
+            breaker = CircuitBreaker(failure_threshold, reset_timeout)
+            _circuit_breakers[endpoint] = breaker
+        return breaker
+
+
 # Common retry policy instances
 default_retry_policy = RetryPolicy()
 aggressive_retry_policy = RetryPolicy(max_retries=5, base_delay=0.5)
@@ -0,0 +1,65 @@
+"""
+Init script registry
+
+Scripts registered here are installed by every CDPSession with
+Page.addScriptToEvaluateOnNewDocument when it connects, replayed on
+reconnect and tab switches, and pushed into tabs and frames the session
+creates or auto-attaches to, so they run before any page script in every
+document frago touches. The stealth script (stealth.js) is registered
+under STEALTH_SCRIPT when CDPConfig.stealth is enabled.
+"""
+
+from pathlib import Path
+from typing import Dict
+
+
+STEALTH_SCRIPT = "stealth"
+STEALTH_SCRIPT_PATH = Path(__file__).parent / "stealth.js"
+
+# name -> source, in installation order
+_init_scripts: Dict[str, str] = {}
+_stealth_source = None
+
+
+def register_init_script(name: str, source: str) -> None:
+    """
+    Register a script to run in every new document of future sessions
+
+    Args:
+        name: Script name (re-registering a name replaces its source)
+        source: JavaScript source
+    """
+    _init_scripts[name] = source
+
+
+def unregister_init_script(name: str) -> None:
+    """Remove a registered init script (sessions already connected keep it)"""
+    _init_scripts.pop(name, None)
+
+
+def get_stealth_script() -> str:
+    """Load the stealth script, empty if it is not shipped"""
+    global _stealth_source
+    if _stealth_source is None:
+        try:
+            _stealth_source = STEALTH_SCRIPT_PATH.read_text(encoding="utf-8")
+        except OSError:
+            _stealth_source = ""
+    return _stealth_source
+
+
+def get_init_scripts(stealth: bool = True) -> Dict[str, str]:
+    """
+    Get the scripts a new session should install
+
+    Args:
+        stealth: Include the stealth script first
+
+    Returns:
+        Dict[str, str]: Script name -> source
+    """
+    scripts: Dict[str, str] = {}
+    if stealth and get_stealth_script():
+        scripts[STEALTH_SCRIPT] = get_stealth_script()
+    scripts.update(_init_scripts)
+    return scripts
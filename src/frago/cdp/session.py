@@ -5,23 +5,60 @@ Implements CDP session management with WebSocket connections.
 """
 
 import json
-import uuid
 import threading
 import queue
 import time
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, List, Optional, Callable, Set
 
 import websocket
 
 from .client import CDPClient
 from .config import CDPConfig
-from .logger import get_logger
-from .exceptions import ConnectionError, TimeoutError, CDPError
-from .types import CDPRequest, CDPResponse
+from .exceptions import ConnectionError, TimeoutError, CDPError, RetryExhaustedError
+from .gc import TOUCH_INTERVAL
+from .retry import RetryPolicy, get_circuit_breaker
+from .types import CDPRequest
 # Lazy import to avoid circular imports
 # from .commands import PageCommands, InputCommands, RuntimeCommands, DOMCommands
 
 
+# Commands whose effect lives in the DevTools session and must be replayed
+# after a reconnect (enable/disable calls are tracked separately per domain)
+REPLAYED_SETUP_METHODS = {
+    "Runtime.addBinding",
+    "Page.addScriptToEvaluateOnNewDocument",
+    "Animation.setPlaybackRate",
+    "Network.setExtraHTTPHeaders",
+    "Network.setUserAgentOverride",
+    "Emulation.setDeviceMetricsOverride",
+    "Browser.setDownloadBehavior",
+    "Target.setAutoAttach",
+}
+
+# Auto-attach settings used to push init scripts into related targets
+# (out-of-process iframes, workers) before they run any script
+AUTO_ATTACH_PARAMS = {"autoAttach": True, "waitForDebuggerOnStart": True, "flatten": True}
+
+# Method name prefixes (after the domain) considered free of side effects,
+# so they can be resubmitted when the connection drops mid-flight
+IDEMPOTENT_PREFIXES = ("get", "query", "describe", "capture", "request", "resolve", "search")
+
+# Socket errors that mean the connection is gone
+CONNECTION_LOST_ERRORS = (
+    websocket.WebSocketConnectionClosedException,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+
+class _ConnectionLost(ConnectionError):
+    """Connection dropped before a command's response arrived"""
+
+    def __init__(self, message: str, delivered: bool = True):
+        super().__init__(message)
+        self.delivered = delivered
+
+
 class CDPSession(CDPClient):
     """CDP session class"""
 
@@ -36,12 +73,38 @@ class CDPSession(CDPClient):
         self.ws: Optional[websocket.WebSocket] = None
         self._request_id = 0
         self._pending_requests: Dict[int, Dict] = {}
-        self._event_handlers: Dict[str, Callable] = {}
+        self._event_handlers: Dict[str, List[Callable]] = {}
         self._message_queue = queue.Queue()
         self._listener_thread: Optional[threading.Thread] = None
         self._running = False
         self._lock = threading.RLock()
 
+        # Reconnection state
+        self._ws_url: Optional[str] = None
+        self._connection_lost = threading.Event()
+        self._reconnect_lock = threading.Lock()
+        self._enabled_domains: Dict[str, Dict[str, Any]] = {}
+        self._replay_commands: Dict[str, Dict[str, Any]] = {}
+        self._script_keys: Dict[str, str] = {}
+        self._live_script_ids: Dict[str, str] = {}
+        self.reconnect_count = 0
+
+        # Init scripts (see scripts.py) and attached child sessions (target ID -> session ID)
+        from .scripts import get_init_scripts
+        self.init_scripts: Dict[str, str] = get_init_scripts(self.config.stealth)
+        self.child_sessions: Dict[str, str] = {}
+        # Child session ID -> events of it dispatched to this session's handlers
+        self._forwarded_events: Dict[str, Set[str]] = {}
+
+        # Protocol trace recorder (see trace.py)
+        self._recorder = None
+
+        # Opt-in metrics collector (see metrics.py)
+        self.metrics = None
+        if self.config.collect_metrics:
+            from .metrics import CDPMetrics
+            self.metrics = CDPMetrics()
+
         # Lazy initialization of command wrappers
         self._page = None
         self._input = None
@@ -54,6 +117,14 @@ class CDPSession(CDPClient):
         self._status = None
         self._visual_effects = None
         self._target = None
+        self._state = None
+        self._emulation = None
+        self._downloads = None
+        self._prefetch = None
+        self._performance = None
+        self._sampling = False
+        # Last time the current tab's GC record was marked as in use
+        self._last_touch = 0.0
 
     def connect(self) -> None:
         """Establish WebSocket connection
@@ -63,63 +134,391 @@ class CDPSession(CDPClient):
         - Unnecessary handshake checks disabled to speed up connection
         - Supports fast-fail mechanism
         """
+        start_time = time.time()
         try:
-            start_time = time.time()
-
             # Dynamically get WebSocket URL
             ws_url = self._get_websocket_url()
             self.logger.info(f"Connecting to CDP at {ws_url}")
 
-            # Prepare WebSocket connection options (performance optimization)
-            ws_options = {
-                "timeout": 1.0,  # Receive message timeout set to 1 second for periodic _running check
-                "skip_utf8_validation": True,  # Skip UTF-8 validation for performance
-                "enable_multithread": True      # Enable multithreading support
-            }
-
-            # Configure proxy parameters
-            if self.config.proxy_host and self.config.proxy_port and not self.config.no_proxy:
-                ws_options["http_proxy_host"] = self.config.proxy_host
-                ws_options["http_proxy_port"] = self.config.proxy_port
-
-                if self.config.proxy_username and self.config.proxy_password:
-                    ws_options["http_proxy_auth"] = (
-                        self.config.proxy_username,
-                        self.config.proxy_password
-                    )
-
-                self.logger.debug(f"Using proxy: {self.config.proxy_host}:{self.config.proxy_port}")
-            elif self.config.no_proxy:
-                self.logger.debug("Proxy bypassed (no_proxy=True)")
-
-            # Create WebSocket connection
-            self.ws = websocket.create_connection(
-                ws_url,
-                **ws_options
-            )
-
-            self._connected = True
-            self._running = True
+            self._open_connection(ws_url)
 
             # Log connection time
             elapsed = (time.time() - start_time) * 1000  # Convert to milliseconds
             self.logger.info(f"CDP connection established in {elapsed:.2f}ms")
 
-            # Start message listener thread
-            self._start_message_listener()
+            if self.config.trace_file and self._recorder is None:
+                self.start_trace(self.config.trace_file)
+
+            if self.init_scripts:
+                self._install_init_scripts()
+
+            if self.config.fast_settle:
+                self._enable_fast_settle()
 
         except Exception as e:
             self._connected = False
             self._running = False
             elapsed = (time.time() - start_time) * 1000
             self.logger.error(f"Connection failed after {elapsed:.2f}ms: {e}")
-            raise ConnectionError(f"Failed to connect to CDP: {e}")
+            raise ConnectionError(f"Failed to connect to CDP: {e}") from e
+
+    def _open_connection(self, ws_url: str) -> None:
+        """Open WebSocket connection to ws_url and start the listener thread"""
+        # Prepare WebSocket connection options (performance optimization)
+        ws_options = {
+            "timeout": 1.0,  # Receive message timeout set to 1 second for periodic _running check
+            "skip_utf8_validation": True,  # Skip UTF-8 validation for performance
+            "enable_multithread": True      # Enable multithreading support
+        }
+
+        # Configure proxy parameters
+        if self.config.proxy_host and self.config.proxy_port and not self.config.no_proxy:
+            ws_options["http_proxy_host"] = self.config.proxy_host
+            ws_options["http_proxy_port"] = self.config.proxy_port
+
+            if self.config.proxy_username and self.config.proxy_password:
+                ws_options["http_proxy_auth"] = (
+                    self.config.proxy_username,
+                    self.config.proxy_password
+                )
+
+            self.logger.debug(f"Using proxy: {self.config.proxy_host}:{self.config.proxy_port}")
+        elif self.config.no_proxy:
+            self.logger.debug("Proxy bypassed (no_proxy=True)")
+
+        # Create WebSocket connection
+        self.ws = websocket.create_connection(
+            ws_url,
+            **ws_options
+        )
+
+        self._ws_url = ws_url
+        self._connection_lost.clear()
+        self._connected = True
+        self._running = True
+
+        # Start message listener thread
+        self._start_message_listener()
 
-    def _get_websocket_url(self) -> str:
+    def start_trace(self, path: str) -> None:
+        """
+        Start recording all CDP traffic of this session to a JSONL trace
+
+        Args:
+            path: Trace file path (appended to)
+        """
+        from .trace import TraceRecorder
+
+        self.stop_trace()
+        self._recorder = TraceRecorder(path)
+        self.logger.info(f"Recording CDP trace to {path}")
+
+    def stop_trace(self) -> None:
+        """Stop recording CDP traffic"""
+        if self._recorder:
+            self._recorder.close()
+            self._recorder = None
+
+    def _script_key(self, source: str) -> str:
+        """Replay key of an init script (matches _record_session_state)"""
+        return f"Page.addScriptToEvaluateOnNewDocument:{hash(source)}"
+
+    def _install_init_scripts(self) -> None:
+        """Install init scripts on this connection once and auto-attach to related targets"""
+        for name, source in self.init_scripts.items():
+            if self._script_key(source) in self._replay_commands:
+                continue
+            try:
+                self.send_command("Page.addScriptToEvaluateOnNewDocument", {"source": source})
+            except CDPError as e:
+                # Browser-level connections have no Page domain; auto-attach covers their pages
+                self.logger.debug(f"Init script {name} not installed on this target: {e}")
+        if "Target.setAutoAttach" not in self._replay_commands:
+            try:
+                self.send_command("Target.setAutoAttach", dict(AUTO_ATTACH_PARAMS))
+            except CDPError as e:
+                self.logger.debug(f"Auto-attach unavailable: {e}")
+
+    def add_init_script(self, name: str, source: str) -> None:
+        """
+        Run a script in every new document of this session's tab
+
+        Also pushed into tabs and frames attached from now on.
+
+        Args:
+            name: Script name
+            source: JavaScript source
+        """
+        self.init_scripts[name] = source
+        if self.connected:
+            self._install_init_scripts()
+
+    def _on_attached_to_target(self, params: Dict[str, Any]) -> None:
+        """
+        Prepare an auto-attached target (listener thread)
+
+        Runs on the listener thread so the target is resumed even while
+        nobody drains the queue; commands are sent without waiting, their
+        responses are dropped by whoever drains next.
+        """
+        session_id = params.get("sessionId")
+        info = params.get("targetInfo", {})
+        if not session_id:
+            return
+        self.child_sessions[info.get("targetId")] = session_id
+
+        if info.get("type") in ("page", "iframe"):
+            for source in self.init_scripts.values():
+                self._post("Page.addScriptToEvaluateOnNewDocument", {"source": source}, session_id)
+            self._post("Target.setAutoAttach", dict(AUTO_ATTACH_PARAMS), session_id)
+        if params.get("waitingForDebugger"):
+            self._post("Runtime.runIfWaitingForDebugger", {}, session_id)
+
+    def _post(self, method: str, params: Dict[str, Any], session_id: Optional[str] = None) -> None:
+        """Send a command without waiting for its response"""
+        with self._lock:
+            request_id = self._request_id
+            self._request_id += 1
+        request: CDPRequest = {"id": request_id, "method": method, "params": params}
+        if session_id:
+            request["sessionId"] = session_id
+        message = json.dumps(request)
+        try:
+            self.ws.send(message)
+        except Exception as e:
+            self.logger.debug(f"Failed to send {method} to session {session_id}: {e}")
+            return
+        if self._recorder:
+            self._recorder.record_raw("send", message)
+
+    def _can_reconnect(self) -> bool:
+        """Whether a lost connection may be re-established automatically"""
+        return self.config.auto_reconnect and self._ws_url is not None and self._running
+
+    def _mark_connection_lost(self) -> None:
+        """Mark the connection as lost so waiters stop waiting on it"""
+        self._connected = False
+        self._connection_lost.set()
+
+    def _reconnect(self) -> None:
+        """
+        Re-establish a lost connection and replay session state
+
+        Reconnects to the same target with exponential backoff, looking its
+        WebSocket URL up again on every attempt: after a Chrome restart the
+        old target is gone and the session continues on the first page. A
+        circuit breaker shared per Chrome endpoint makes callers fail fast
+        while Chrome is down instead of each waiting out the backoff.
+
+        Raises:
+            ConnectionError: Reconnection failed or circuit is open
+        """
+        with self._reconnect_lock:
+            if self._connected and not self._connection_lost.is_set():
+                # Another thread already reconnected
+                return
+
+            breaker = get_circuit_breaker(
+                f"{self.config.host}:{self.config.port}",
+                failure_threshold=self.config.circuit_failure_threshold,
+                reset_timeout=self.config.circuit_reset_timeout
+            )
+            breaker.before_call()
+
+            # Close the dead socket and let its listener thread finish
+            if self.ws:
+                try:
+                    self.ws.close()
+                except Exception:
+                    pass
+            if self._listener_thread and self._listener_thread.is_alive():
+                self._listener_thread.join(timeout=2.0)
+
+            # Stay on the page the session picked itself while it exists
+            if not self.config.target_id and "/devtools/page/" in self._ws_url:
+                self.config.target_id = self._ws_url.rsplit("/", 1)[-1]
+
+            self.logger.warning(f"CDP connection lost, reconnecting to {self._ws_url}")
+            policy = RetryPolicy(
+                max_retries=self.config.max_retries,
+                base_delay=self.config.retry_delay,
+                max_delay=10.0,
+                retryable_exceptions=(Exception,)
+            )
+            try:
+                breaker.call(policy.execute, self._reconnect_once)
+            except RetryExhaustedError as e:
+                self._connected = False
+                raise ConnectionError(f"Failed to reconnect to CDP: {e}") from e
+
+            self.reconnect_count += 1
+            self.logger.info("CDP connection re-established")
+            # Node IDs and child sessions belong to the old DevTools session
+            if self._dom is not None:
+                self._dom.invalidate()
+            self.child_sessions.clear()
+            self._forwarded_events.clear()
+            self._replay_session_state()
+
+    def _reconnect_once(self) -> None:
+        """One reconnection attempt: resolve the target again and connect to it"""
+        ws_url = self._get_websocket_url(fallback=True)
+        self._open_connection(ws_url)
+
+    def switch_target(self, target_id: str) -> None:
+        """
+        Re-attach this session to another tab
+
+        Enabled domains, bindings and injected scripts are replayed on the
+        new tab; pending events of the old tab are dropped.
+
+        Args:
+            target_id: Target ID of the tab to attach to
+
+        Raises:
+            ConnectionError: Target not found or connection failed
+        """
+        with self._reconnect_lock:
+            previous_target = self.config.target_id
+            self.config.target_id = target_id
+            try:
+                ws_url = self._get_websocket_url()
+            except ConnectionError:
+                self.config.target_id = previous_target
+                raise
+
+            # Detach from the old tab without it counting as a lost connection
+            old_ws, self.ws = self.ws, None
+            if old_ws:
+                try:
+                    old_ws.close()
+                except Exception:
+                    pass
+            if self._listener_thread and self._listener_thread.is_alive():
+                self._listener_thread.join(timeout=2.0)
+            while not self._message_queue.empty():
+                try:
+                    self._message_queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            self.logger.info(f"Switching CDP session to target {target_id}")
+            self.child_sessions.clear()
+            self._forwarded_events.clear()
+            try:
+                self._open_connection(ws_url)
+            except Exception as e:
+                self._connected = False
+                raise ConnectionError(f"Failed to attach to target {target_id}: {e}") from e
+            self._replay_session_state()
+
+        self._maybe_touch_target(force=True)
+
+        # Samples of the old tab say nothing about the new one
+        if self._performance is not None:
+            self._performance.samples.clear()
+        if self._dom is not None:
+            self._dom.invalidate()
+
+    def _replay_session_state(self) -> None:
+        """Re-enable domains and re-register bindings/scripts on a new connection"""
+        for domain, params in list(self._enabled_domains.items()):
+            try:
+                self._send_once(f"{domain}.enable", params)
+            except CDPError as e:
+                self.logger.warning(f"Failed to re-enable {domain}: {e}")
+
+        for key, entry in list(self._replay_commands.items()):
+            try:
+                response = self._send_once(entry["method"], entry["params"])
+            except CDPError as e:
+                self.logger.warning(f"Failed to replay {entry['method']}: {e}")
+                continue
+            identifier = response.get("result", {}).get("identifier")
+            if identifier:
+                self._script_keys[identifier] = key
+                self._live_script_ids[key] = identifier
+
+    def _record_session_state(self, method: str, params: Dict[str, Any], response: Dict[str, Any]) -> None:
+        """Remember state-changing commands so they can be replayed after reconnect"""
+        domain, _, command = method.partition(".")
+        if command == "enable":
+            self._enabled_domains[domain] = params
+        elif command == "disable":
+            self._enabled_domains.pop(domain, None)
+        elif method == "Page.removeScriptToEvaluateOnNewDocument":
+            key = self._script_keys.pop(params.get("identifier"), None)
+            if key:
+                self._replay_commands.pop(key, None)
+                self._live_script_ids.pop(key, None)
+        elif method in REPLAYED_SETUP_METHODS:
+            if method == "Runtime.addBinding":
+                key = f"{method}:{params.get('name')}"
+            elif method == "Page.addScriptToEvaluateOnNewDocument":
+                key = f"{method}:{hash(params.get('source'))}"
+            else:
+                key = method
+            self._replay_commands[key] = {"method": method, "params": params}
+            identifier = response.get("result", {}).get("identifier")
+            if identifier:
+                self._script_keys[identifier] = key
+                self._live_script_ids[key] = identifier
+
+    def _maybe_sample_performance(self, reason: str = "interval") -> None:
+        """Take a performance sample if due (never from within another sample)"""
+        if self._sampling:
+            return
+        performance = self.performance
+        if reason == "interval" and \
+                time.time() - performance.last_sample_time < self.config.performance_sample_interval:
+            return
+        self._sampling = True
+        try:
+            performance.sample(reason)
+        except CDPError as e:
+            self.logger.debug(f"Performance sample failed: {e}")
+        finally:
+            self._sampling = False
+
+    def _maybe_touch_target(self, force: bool = False) -> None:
+        """Restart the GC TTL of the tab this session drives, at most every TOUCH_INTERVAL"""
+        target_id = self.config.target_id
+        if not target_id or not self.config.touch_target:
+            return
+        now = time.time()
+        if not force and now - self._last_touch < TOUCH_INTERVAL:
+            return
+        self._last_touch = now
+        try:
+            self.target.registry.touch(target_id)
+        except OSError as e:
+            self.logger.debug(f"Could not mark target {target_id} as in use: {e}")
+
+    @staticmethod
+    def _is_idempotent(method: str) -> bool:
+        """Whether a command can be safely resubmitted"""
+        command = method.partition(".")[2]
+        return command in ("enable", "disable") or command.startswith(IDEMPOTENT_PREFIXES)
+
+    def _enable_fast_settle(self) -> None:
+        """Apply fast settle emulation, failures only degrade to normal waiting"""
+        try:
+            self.emulation.enable_fast_settle(
+                playback_rate=self.config.animation_playback_rate,
+                disable_smooth_scroll=self.config.disable_smooth_scroll
+            )
+        except CDPError as e:
+            self.logger.warning(f"Fast settle mode unavailable: {e}")
+
+    def _get_websocket_url(self, fallback: bool = False) -> str:
         """Dynamically get WebSocket debug URL
 
         If target_id is specified, connect to that tab; otherwise auto-select the first page-type tab.
 
+        Args:
+            fallback: If target_id no longer exists (Chrome restarted), use the
+                first page instead and make it the new target_id
+
         Returns:
             str: WebSocket URL
         """
@@ -145,12 +544,17 @@ class CDPSession(CDPClient):
                             raise ConnectionError(f"Target {self.config.target_id} has no WebSocket URL available")
 
                 # Specified target not found
-                raise ConnectionError(f"Target not found: {self.config.target_id}")
+                if not fallback:
+                    raise ConnectionError(f"Target not found: {self.config.target_id}")
+                self.logger.warning(f"Target {self.config.target_id} is gone, using the first page")
+                self.config.target_id = None
 
             # No target_id specified, find first available page
             for target in targets:
                 if target.get('type') == 'page' and target.get('webSocketDebuggerUrl'):
                     self.logger.debug(f"Using page: {target.get('title', 'Unknown')}")
+                    if fallback:
+                        self.config.target_id = target.get('id')
                     return target['webSocketDebuggerUrl']
 
             # If no page available, use browser endpoint
@@ -170,8 +574,16 @@ class CDPSession(CDPClient):
     
     def disconnect(self) -> None:
         """Disconnect WebSocket connection"""
+        # Close background tabs that were never visited
+        if self._prefetch is not None and self.connected:
+            try:
+                self._prefetch.cancel()
+            except CDPError as e:
+                self.logger.debug(f"Failed to close prefetched tabs: {e}")
+
         # Stop message listener thread
         self._running = False
+        self._ws_url = None
 
         if self._listener_thread and self._listener_thread.is_alive():
             self._listener_thread.join(timeout=5.0)
@@ -186,13 +598,46 @@ class CDPSession(CDPClient):
                 self.ws = None
                 self._connected = False
 
-    def send_command(self, method: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        self.stop_trace()
+        self._save_metrics()
+
+    def _save_metrics(self) -> None:
+        """Merge this session's metrics into the accumulated stats file"""
+        if self.metrics is None or self.metrics.empty:
+            return
+
+        from .metrics import CDPMetrics, save_stats
+
+        self.metrics.reconnects = self.reconnect_count
+        try:
+            path = save_stats(self.metrics)
+            self.logger.debug(f"CDP metrics saved to {path}")
+        except OSError as e:
+            self.logger.warning(f"Failed to save CDP metrics: {e}")
+        # Start over so a reconnect-and-disconnect does not count twice
+        self.metrics = CDPMetrics()
+
+    def send_command(
+        self,
+        method: str,
+        params: Optional[Dict[str, Any]] = None,
+        idempotent: Optional[bool] = None,
+        session_id: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Send CDP command
 
+        If the connection drops, the session reconnects (see _reconnect).
+        Commands that never reached Chrome are always resent; commands lost
+        in flight are only resubmitted when idempotent.
+
         Args:
             method: CDP method name
             params: Command parameters
+            idempotent: Whether the command may be resubmitted after a drop,
+                None to infer from the method name
+            session_id: Send to an attached child session (see child_sessions)
+                instead of this connection's target
 
         Returns:
             Dict[str, Any]: Command result
@@ -200,8 +645,61 @@ class CDPSession(CDPClient):
         Raises:
             CDPError: Command execution failed
         """
-        if not self.connected:
-            raise ConnectionError("CDP not connected")
+        params = params or {}
+        if idempotent is None:
+            idempotent = self._is_idempotent(method)
+
+        resubmits = 0
+        while True:
+            if not self.connected:
+                if self._connection_lost.is_set() and self._can_reconnect():
+                    self._reconnect()
+                else:
+                    raise ConnectionError("CDP not connected")
+
+            try:
+                response = self._send_once(method, params, session_id)
+            except _ConnectionLost as e:
+                if not self._can_reconnect():
+                    raise ConnectionError(f"CDP connection lost while waiting for {method}") from e
+                self._reconnect()
+                # Commands that never reached Chrome are always safe to resend
+                if session_id:
+                    # Child sessions do not survive the connection
+                    raise ConnectionError(
+                        f"CDP connection lost while sending {method} to session {session_id}"
+                    ) from e
+                if e.delivered and not idempotent:
+                    raise ConnectionError(
+                        f"CDP connection lost while waiting for {method}; "
+                        f"not resubmitted because it is not idempotent"
+                    ) from e
+                resubmits += 1
+                if resubmits > self.config.max_retries:
+                    raise ConnectionError(f"CDP connection kept dropping while sending {method}") from e
+                self.logger.info(f"Resubmitting {method} after reconnect")
+                continue
+
+            if not session_id:
+                self._record_session_state(method, params, response)
+            if self.config.collect_performance:
+                self._maybe_sample_performance()
+            self._maybe_touch_target()
+            return response
+
+    def _send_once(self, method: str, params: Dict[str, Any], session_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Send a command on the current connection and wait for its response
+
+        Raises:
+            _ConnectionLost: Connection dropped before the response arrived
+            CDPError: Command execution failed
+        """
+        # Translate script identifiers issued before a reconnect
+        if method == "Page.removeScriptToEvaluateOnNewDocument":
+            key = self._script_keys.get(params.get("identifier"))
+            if key and key in self._live_script_ids:
+                params = {**params, "identifier": self._live_script_ids[key]}
 
         # Generate request ID
         with self._lock:
@@ -212,19 +710,43 @@ class CDPSession(CDPClient):
         request: CDPRequest = {
             "id": request_id,
             "method": method,
-            "params": params or {}
+            "params": params
         }
+        if session_id:
+            request["sessionId"] = session_id
 
         # Send request
         try:
-            self.ws.send(json.dumps(request))
+            message = json.dumps(request)
+            start_time = time.perf_counter()
+            self.ws.send(message)
             self.logger.debug(f"Sent CDP command: {method} (id: {request_id})")
+            if self._recorder:
+                self._recorder.record_raw("send", message)
+            if self.metrics:
+                self.metrics.record_sent(len(message))
+        except CONNECTION_LOST_ERRORS as e:
+            if not self._can_reconnect():
+                raise CDPError(f"Failed to send CDP command: {e}") from e
+            self._mark_connection_lost()
+            raise _ConnectionLost(f"Failed to send CDP command: {e}", delivered=False) from e
         except Exception as e:
-            raise CDPError(f"Failed to send CDP command: {e}")
+            raise CDPError(f"Failed to send CDP command: {e}") from e
 
         # Wait for response
-        return self._wait_for_response(request_id)
-    
+        if not self.metrics:
+            return self._wait_for_response(request_id)
+
+        try:
+            response = self._wait_for_response(request_id)
+        except _ConnectionLost:
+            raise
+        except CDPError:
+            self.metrics.record_command(method, time.perf_counter() - start_time, error=True)
+            raise
+        self.metrics.record_command(method, time.perf_counter() - start_time)
+        return response
+
     def _validate_response(self, response: Dict[str, Any]) -> Dict[str, Any]:
         """
         Validate CDP response
@@ -278,21 +800,26 @@ class CDPSession(CDPClient):
 
                     # If this is the response we're waiting for
                     if response.get("id") == request_id:
-                        return self._validate_response(response)
+                        break
 
                     # If event, call event handler
                     elif "method" in response:
                         self._handle_event(response)
 
                 except queue.Empty:
+                    if self._connection_lost.is_set():
+                        raise _ConnectionLost("CDP connection lost") from None
                     # Queue empty, sleep briefly and continue
                     time.sleep(0.01)
                     continue
                 except Exception as e:
                     self.logger.error(f"Error processing message: {e}")
                     continue
+            else:
+                raise TimeoutError(f"Command timeout after {timeout} seconds")
 
-            raise TimeoutError(f"Command timeout after {timeout} seconds")
+            # Outside the loop so error responses are raised, not retried until timeout
+            return self._validate_response(response)
 
         finally:
             # Clean up pending request
@@ -303,23 +830,33 @@ class CDPSession(CDPClient):
         """Start message listener thread"""
         self._listener_thread = threading.Thread(
             target=self._message_listener,
+            args=(self.ws,),
             daemon=True,
             name="CDPMessageListener"
         )
         self._listener_thread.start()
 
-    def _message_listener(self) -> None:
-        """Message listener thread main loop"""
-        while self._running and self.ws:
+    def _message_listener(self, ws: websocket.WebSocket) -> None:
+        """Message listener thread main loop (bound to one connection)"""
+        while self._running and self.ws is ws:
             try:
                 # Receive message
-                message = self.ws.recv()
-
-                # Put into queue
-                self._message_queue.put(message)
-
-            except websocket.WebSocketConnectionClosedException:
-                self.logger.warning("WebSocket connection closed")
+                message = ws.recv()
+
+                # Put into queue (close frames arrive as empty messages)
+                if message:
+                    if self._recorder:
+                        self._recorder.record_raw("recv", message)
+                    if '"Target.attachedToTarget"' in message:
+                        self._on_attached_to_target(json.loads(message).get("params", {}))
+                    self._message_queue.put(message)
+                    if self.metrics:
+                        self.metrics.record_received(len(message), self._message_queue.qsize())
+
+            except CONNECTION_LOST_ERRORS:
+                if self._running and self.ws is ws:
+                    self.logger.warning("WebSocket connection closed")
+                    self._mark_connection_lost()
                 break
             except websocket.WebSocketTimeoutException:
                 # Timeout is normal, used for periodic _running check, not an error
@@ -339,16 +876,44 @@ class CDPSession(CDPClient):
         method = event.get("method")
         params = event.get("params", {})
 
-        if method in self._event_handlers:
+        if self.metrics:
+            self.metrics.record_event(method)
+
+        child_session = event.get("sessionId")
+        if method == "Target.detachedFromTarget":
+            self.child_sessions.pop(params.get("targetId"), None)
+            if not child_session:
+                self._forwarded_events.pop(params.get("sessionId"), None)
+        if child_session and method not in self._forwarded_events.get(child_session, ()):
+            # Traffic of attached child targets is not this session's page
+            return
+
+        for handler in list(self._event_handlers.get(method, [])):
             try:
-                self._event_handlers[method](params)
+                handler(params)
             except Exception as e:
                 self.logger.error(f"Error in event handler for {method}: {e}")
 
+    def forward_events(self, session_id: str, *event_names: str) -> None:
+        """
+        Dispatch events of an attached child session to this session's handlers
+
+        Args:
+            session_id: Child session ID (see child_sessions)
+            *event_names: Events to forward, e.g. "Page.downloadProgress"
+        """
+        self._forwarded_events.setdefault(session_id, set()).update(event_names)
+
+    def stop_forwarding(self, session_id: str) -> None:
+        """Stop dispatching a child session's events (see forward_events)"""
+        self._forwarded_events.pop(session_id, None)
+
     def on_event(self, event_name: str) -> Callable:
         """
         Event handler decorator
 
+        Multiple handlers can be registered for the same event.
+
         Args:
             event_name: Event name
 
@@ -356,10 +921,91 @@ class CDPSession(CDPClient):
             Callable: Decorator function
         """
         def decorator(handler: Callable) -> Callable:
-            self._event_handlers[event_name] = handler
+            self._event_handlers.setdefault(event_name, []).append(handler)
             return handler
         return decorator
 
+    def off_event(self, event_name: str, handler: Callable) -> None:
+        """
+        Remove a previously registered event handler
+
+        Args:
+            event_name: Event name
+            handler: Handler registered via on_event
+        """
+        handlers = self._event_handlers.get(event_name, [])
+        if handler in handlers:
+            handlers.remove(handler)
+
+    def wait_for_event(
+        self,
+        event_name: str,
+        timeout: Optional[float] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Wait for a CDP event, dispatching other events to their handlers meanwhile
+
+        Events are only delivered while someone drains the message queue, so
+        events that arrived during an earlier send_command are not seen here;
+        register a handler via on_event before sending the triggering command
+        when that matters.
+
+        Args:
+            event_name: Event name, e.g. "Page.loadEventFired"
+            timeout: Timeout (seconds), defaults to command timeout
+            predicate: Optional filter on event params
+
+        Returns:
+            Optional[Dict[str, Any]]: Event params, None on timeout
+        """
+        if timeout is None:
+            timeout = self.config.command_timeout
+        deadline = time.time() + timeout
+
+        while time.time() < deadline:
+            try:
+                message = self._message_queue.get(timeout=0.05)
+            except queue.Empty:
+                continue
+
+            try:
+                response = json.loads(message)
+            except ValueError:
+                continue
+
+            if "method" not in response:
+                continue
+
+            self._handle_event(response)
+            params = response.get("params", {})
+            if response["method"] == event_name and (predicate is None or predicate(params)):
+                return params
+
+        return None
+
+    def process_events(self) -> int:
+        """
+        Dispatch events that arrived since the last command, without waiting
+
+        Returns:
+            int: Number of events dispatched
+        """
+        dispatched = 0
+        while True:
+            try:
+                message = self._message_queue.get_nowait()
+            except queue.Empty:
+                return dispatched
+            try:
+                response = json.loads(message)
+            except ValueError:
+                continue
+            # Responses left in the queue belong to timed-out requests
+            if "method" in response:
+                self._handle_event(response)
+                dispatched += 1
+
     def health_check(self) -> bool:
         """
         Perform connection health check
@@ -388,27 +1034,18 @@ class CDPSession(CDPClient):
 
     def click(self, selector: str, wait_timeout: int = 10) -> None:
         """Click element matching selector"""
-        # Wait for element first
-        self.page.wait_for_selector(selector, timeout=wait_timeout)
-
-        # Get element position and click
-        result = self.dom.get_document()
-        # CDP return format: {"id": ..., "result": {"root": {...}}}
-        node_id = result.get("result", {}).get("root", {}).get("nodeId")
+        # A cached node skips waiting and selector resolution entirely
+        model = self.dom.get_element_box(selector) if self.dom.is_cached(selector) else None
 
-        if not node_id:
-            raise CDPError("Unable to get document node")
+        if not model:
+            # Wait for element first
+            self.page.wait_for_selector(selector, timeout=wait_timeout)
+            model = self.dom.get_element_box(selector)
+            if model is None and not self.dom.find(selector):
+                raise CDPError(f"Element not found: {selector}")
 
-        query_result = self.dom.query_selector(node_id, selector)
-        # CDP return format: {"id": ..., "result": {"nodeId": ...}}
-        element_node_id = query_result.get("result", {}).get("nodeId")
-
-        if not element_node_id:
-            raise CDPError(f"Element not found: {selector}")
-
-        box_model = self.dom.get_box_model(element_node_id)
-        # CDP return format: {"id": ..., "result": {"model": {"content": [...]}}}
-        content = box_model.get("result", {}).get("model", {}).get("content", [])
+        # Box model format: {"content": [x1, y1, x2, y2, x3, y3, x4, y4], ...}
+        content = (model or {}).get("content", [])
 
         if not content:
             raise CDPError(f"Cannot get element position: {selector}")
@@ -448,6 +1085,23 @@ class CDPSession(CDPClient):
         import time
         time.sleep(seconds)
 
+    def settle(self, seconds: float) -> None:
+        """
+        Let the page settle after an action
+
+        In fast settle mode page timers are advanced with a virtual time budget
+        instead of waiting on the wall clock; otherwise this is a plain sleep.
+
+        Args:
+            seconds: Settle time (seconds)
+        """
+        if seconds <= 0:
+            return
+        if self.config.fast_settle:
+            self.emulation.advance_virtual_time(int(seconds * 1000), timeout=seconds)
+        else:
+            time.sleep(seconds)
+
     def zoom(self, factor: float) -> None:
         """Set page zoom factor"""
         self.evaluate(f"document.body.style.zoom = '{factor}'")
@@ -456,7 +1110,7 @@ class CDPSession(CDPClient):
         """Clear all visual effects"""
         self.evaluate("""
             // Clear element styles
-            document.querySelectorAll('[data-frago-highlight], [style*="pointer"], [style*="spotlight"]').forEach(el => {
+            document.querySelectorAll('[data-frago-highlight], [data-frago-pointer], [data-frago-spotlight]').forEach(el => {
                 el.style.removeProperty('background-color');
                 el.style.removeProperty('border');
                 el.style.removeProperty('outline');
@@ -465,9 +1119,11 @@ class CDPSession(CDPClient):
                 el.style.removeProperty('z-index');
                 el.style.removeProperty('position');
                 el.removeAttribute('data-frago-highlight');
+                el.removeAttribute('data-frago-pointer');
+                el.removeAttribute('data-frago-spotlight');
             });
             // Remove frago-added DOM elements (annotate, underline, pointer, etc.)
-            document.querySelectorAll('.frago-underline, .frago-annotation, #frago-pointer, #frago-underline-style').forEach(el => el.remove());
+            document.querySelectorAll('.frago-underline, .frago-annotation, #frago-pointer, #frago-spotlight, #frago-underline-style, #frago-spotlight-style').forEach(el => el.remove());
         """)
 
     def highlight(self, selector: str, color: str = "magenta", border_width: int = 3, lifetime: int = 5000) -> None:
@@ -673,7 +1329,10 @@ class CDPSession(CDPClient):
 
     def wait_for_load(self, timeout: float = 30) -> bool:
         """Wait for page to finish loading"""
-        return self.page.wait_for_load(timeout=timeout)
+        loaded = self.page.wait_for_load(timeout=timeout)
+        if self.config.collect_performance:
+            self._maybe_sample_performance("navigation")
+        return loaded
 
     # Lazy-loaded property accessors for command classes
     @property
@@ -751,4 +1410,39 @@ class CDPSession(CDPClient):
         if self._target is None:
             from .commands.target import TargetCommands
             self._target = TargetCommands(self)
-        return self._target
\ No newline at end of file
+        return self._target
+
+    @property
+    def state(self):
+        if self._state is None:
+            from .commands.state import StateCommands
+            self._state = StateCommands(self)
+        return self._state
+
+    @property
+    def emulation(self):
+        if self._emulation is None:
+            from .commands.emulation import EmulationCommands
+            self._emulation = EmulationCommands(self)
+        return self._emulation
+
+    @property
+    def downloads(self):
+        if self._downloads is None:
+            from .commands.download import DownloadCommands
+            self._downloads = DownloadCommands(self)
+        return self._downloads
+
+    @property
+    def prefetch(self):
+        if self._prefetch is None:
+            from .commands.prefetch import PrefetchCommands
+            self._prefetch = PrefetchCommands(self, concurrency=self.config.prefetch_concurrency)
+        return self._prefetch
+
+    @property
+    def performance(self):
+        if self._performance is None:
+            from .commands.performance import PerformanceCommands
+            self._performance = PerformanceCommands(self)
+        return self._performance
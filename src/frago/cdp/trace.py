@@ -0,0 +1,92 @@
+"""
+CDP protocol trace recording
+
+Records all CDP traffic of a session (timestamp, direction, payload) into a
+JSONL trace file, and loads traces back for replay by the fake CDP server.
+
+Trace line format:
+    {"ts": 1700000000.123, "dir": "send", "data": {"id": 1, "method": "...", "params": {...}}}
+    {"ts": 1700000000.145, "dir": "recv", "data": {"id": 1, "result": {...}}}
+"""
+
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Union
+
+
+class TraceRecorder:
+    """CDP trace recorder (thread-safe, append-only JSONL)"""
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Initialize trace recorder
+
+        Args:
+            path: Trace file path, appended to if it exists
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8")
+        self._lock = threading.Lock()
+        self.count = 0
+
+    def record(self, direction: str, payload: Dict[str, Any]) -> None:
+        """
+        Record a message
+
+        Args:
+            direction: "send" or "recv"
+            payload: Message payload
+        """
+        self._write(direction, json.dumps(payload, ensure_ascii=False))
+
+    def record_raw(self, direction: str, message: Union[str, bytes]) -> None:
+        """
+        Record a raw JSON message without re-serializing it
+
+        Args:
+            direction: "send" or "recv"
+            message: JSON text as received from the WebSocket
+        """
+        if isinstance(message, bytes):
+            message = message.decode("utf-8", errors="replace")
+        self._write(direction, message)
+
+    def _write(self, direction: str, data_json: str) -> None:
+        line = f'{{"ts":{time.time():.6f},"dir":"{direction}","data":{data_json}}}\n'
+        with self._lock:
+            if self._file.closed:
+                return
+            self._file.write(line)
+            self.count += 1
+
+    def close(self) -> None:
+        """Flush and close the trace file"""
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+
+def load_trace(path: Union[str, Path]) -> List[Dict[str, Any]]:
+    """
+    Load a trace file
+
+    Args:
+        path: Trace file path
+
+    Returns:
+        List[Dict[str, Any]]: Trace entries in file order, malformed lines skipped
+    """
+    entries = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return entries
@@ -21,13 +21,17 @@ class CDPResponse(TypedDict, total=False):
     params: Optional[Dict[str, Any]]
 
 
-class CDPRequest(TypedDict):
-    """CDP request data structure"""
+class _CDPRequestBase(TypedDict):
     id: int
     method: str
     params: Optional[CommandParams]
 
 
+class CDPRequest(_CDPRequestBase, total=False):
+    """CDP request data structure (sessionId targets an attached child session)"""
+    sessionId: str
+
+
 # Connection related types
 WebSocketMessage = Union[str, bytes]
 
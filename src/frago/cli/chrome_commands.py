@@ -6,6 +6,7 @@ Includes:
   - Page operations: navigate, scroll, scroll-to, zoom, wait
   - Element interaction: click, exec-js, get-title, get-content
   - Visual effects: screenshot, highlight, pointer, spotlight, annotate, underline, clear-effects
+  - Browser state: state save/load/list
 """
 
 import click
@@ -32,6 +33,11 @@ from .commands import (
     chrome_stop,
     list_tabs,
     switch_tab,
+    chrome_state,
+    chrome_stats,
+    chrome_gc,
+    download,
+    archive,
 )
 from .agent_friendly import AgentFriendlyGroup
 
@@ -50,6 +56,7 @@ def chrome_group():
       Page operations: navigate, scroll, scroll-to, zoom, wait
       Element interaction: click, exec-js, get-title, get-content
       Visual effects: screenshot, highlight, pointer, spotlight, ...
+      Browser state: state
 
     \b
     Examples:
@@ -82,6 +89,8 @@ chrome_group.add_command(click_element, name="click")
 chrome_group.add_command(execute_javascript, name="exec-js")
 chrome_group.add_command(get_title, name="get-title")
 chrome_group.add_command(get_content, name="get-content")
+chrome_group.add_command(download, name="download")
+chrome_group.add_command(archive, name="archive")
 
 # Visual effects
 chrome_group.add_command(screenshot, name="screenshot")
@@ -91,3 +100,10 @@ chrome_group.add_command(spotlight, name="spotlight")
 chrome_group.add_command(annotate, name="annotate")
 chrome_group.add_command(underline, name="underline")
 chrome_group.add_command(clear_effects, name="clear-effects")
+
+# Browser state
+chrome_group.add_command(chrome_state, name="state")
+
+# Diagnostics
+chrome_group.add_command(chrome_stats, name="stats")
+chrome_group.add_command(chrome_gc, name="gc")
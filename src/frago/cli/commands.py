@@ -36,6 +36,7 @@ COMMAND_EXAMPLES = {
         "frago chrome screenshot <output_file>",
         "frago chrome screenshot page.png",
         "frago chrome screenshot full.png --full-page --quality 90",
+        "frago chrome screenshot card.webp --selector '.product-card' --preset balanced",
     ],
     "exec-js": [
         "frago chrome exec-js <script>",
@@ -46,10 +47,22 @@ COMMAND_EXAMPLES = {
     "get-title": [
         "frago chrome get-title",
     ],
+    "archive": [
+        "frago chrome archive [description]",
+        "frago chrome archive product-page",
+        "frago recipe run my_recipe --offline ~/.frago/projects/<run>/outputs/001_product-page.mhtml",
+    ],
+    "download": [
+        "frago chrome download <url>",
+        "frago chrome download https://example.com/report.pdf",
+        "frago chrome download https://example.com/data.zip --output-dir ./data --timeout 600",
+    ],
     "get-content": [
         "frago chrome get-content [selector]",
         "frago chrome get-content  # Default: get body",
         "frago chrome get-content 'article.main' --desc 'article-content'",
+        "frago chrome get-content --readable --limit 8000  # Main content as Markdown",
+        "frago chrome get-content --readable --offset 8000 --limit 8000  # Next page",
     ],
     "scroll": [
         "frago chrome scroll <distance>",
@@ -108,6 +121,7 @@ COMMAND_EXAMPLES = {
     "start": [
         "frago chrome start",
         "frago chrome start --headless",
+        "frago chrome start --headless --profile ephemeral",
         "frago chrome start --void --keep-alive",
         "frago chrome start --port 9333 --width 1920 --height 1080",
     ],
@@ -122,6 +136,30 @@ COMMAND_EXAMPLES = {
         "frago chrome switch-tab <tab_id>",
         "frago chrome switch-tab ABC123  # Supports partial ID matching",
     ],
+    "state-save": [
+        "frago chrome state save <name>",
+        "frago chrome state save github-login",
+        "frago chrome state save work --origin https://app.example.com --origin https://auth.example.com",
+    ],
+    "state-load": [
+        "frago chrome state load <name>",
+        "frago chrome state load github-login",
+    ],
+    "state-list": [
+        "frago chrome state list",
+    ],
+    "chrome-stats": [
+        "frago --cdp-stats chrome navigate https://example.com  # Collect stats",
+        "frago chrome stats",
+        "frago chrome stats --top 10 --json",
+        "frago chrome stats --dump   # Write into current run's logs/",
+        "frago chrome stats --reset",
+    ],
+    "chrome-gc": [
+        "frago chrome gc",
+        "frago chrome gc --dry-run   # Only list tabs that would be closed",
+        "frago chrome gc --keep-overlays --json",
+    ],
     # Top-level commands
     "status": [
         "frago status",
@@ -181,6 +219,7 @@ def print_usage(func):
 from ..cdp.config import CDPConfig
 from ..cdp.exceptions import CDPError
 from ..cdp.session import CDPSession
+from .agent_friendly import AgentFriendlyGroup
 
 
 # =============================================================================
@@ -406,6 +445,10 @@ def create_session(ctx) -> CDPSession:
     - --proxy-password: Proxy auth password
     - --no-proxy: Bypass proxy connection
     - --target-id: Specify target tab ID
+    - --fast-settle: Speed up animations, settle with virtual time
+    - --cdp-trace: Record CDP traffic to a JSONL trace file
+    - --cdp-stats: Collect per-method latency and traffic stats
+    - --perf-metrics: Sample page performance metrics into the run log
     """
     config = CDPConfig(
         host=ctx.obj['HOST'],
@@ -417,9 +460,24 @@ def create_session(ctx) -> CDPSession:
         proxy_username=ctx.obj.get('PROXY_USERNAME'),
         proxy_password=ctx.obj.get('PROXY_PASSWORD'),
         no_proxy=ctx.obj.get('NO_PROXY', False),
-        target_id=ctx.obj.get('TARGET_ID')
+        target_id=ctx.obj.get('TARGET_ID'),
+        fast_settle=ctx.obj.get('FAST_SETTLE', False),
+        trace_file=ctx.obj.get('CDP_TRACE'),
+        collect_metrics=ctx.obj.get('CDP_STATS', False),
+        collect_performance=ctx.obj.get('PERF_METRICS', False)
     )
-    return CDPSession(config)
+    session = CDPSession(config)
+    if config.collect_performance:
+        session.performance.on_sample(_log_performance_sample)
+    return session
+
+
+def _log_performance_sample(sample: Dict[str, Any]) -> None:
+    """Write a performance sample to the run log"""
+    metrics = sample.get("metrics", {})
+    heap_mb = metrics.get("JSHeapUsedSize", 0) / (1024 * 1024)
+    step = f"Performance ({sample.get('reason')}): heap {heap_mb:.1f}MB, {int(metrics.get('Nodes', 0))} nodes"
+    _write_run_log(step, "success", "analysis", sample)
 
 
 def _get_dom_features(session: CDPSession) -> dict:
@@ -529,19 +587,14 @@ def _take_perception_screenshot(session: CDPSession, description: str = "page")
         Screenshot file path, None on failure
     """
     try:
-        from ..run.screenshot import get_next_screenshot_number
-        from slugify import slugify
-        import base64
+        from ..run.screenshot import save_screenshot
 
         screenshots_dir = _get_run_screenshots_dir()
-        seq = get_next_screenshot_number(screenshots_dir)
-        desc_slug = slugify(description or 'page', max_length=40)
-        filename = f"{seq:03d}_{desc_slug}.png"
-        file_path = screenshots_dir / filename
-
         result = session.screenshot.capture()
-        screenshot_data = base64.b64decode(result.get("data", ""))
-        file_path.write_bytes(screenshot_data)
+        # Written off-thread; identical consecutive screenshots are stored once
+        file_path, _, _ = save_screenshot(
+            result.get("data", ""), description or 'page', screenshots_dir, background=True
+        )
 
         return str(file_path)
     except Exception:
@@ -560,9 +613,9 @@ def _do_perception(session: CDPSession, action_desc: str, delay: float = 0) -> N
         action_desc: Action description (kept for logging)
         delay: Delay before getting DOM features (seconds), for waiting page load
     """
-    # Optional delay
+    # Optional delay (virtual time in fast settle mode)
     if delay > 0:
-        time.sleep(delay)
+        session.settle(delay)
 
     # Get and print DOM features
     features = _get_dom_features(session)
@@ -634,7 +687,7 @@ def click_element(ctx, selector: str, wait_timeout: int):
             _print_msg("success", f"Clicked element: {selector}", "interaction", {"selector": selector})
 
             # Brief wait for page response after click
-            time.sleep(0.5)
+            session.settle(0.5)
 
             # Perception: get DOM features
             _do_perception(session, f"click-{selector}")
@@ -654,45 +707,92 @@ def click_element(ctx, selector: str, wait_timeout: int):
     '--quality',
     type=int,
     default=80,
-    help='Image quality (1-100), default 80'
+    help='Image quality (1-100) for jpeg/webp, default 80'
+)
+@click.option(
+    '--format',
+    'image_format',
+    type=click.Choice(['png', 'jpeg', 'webp']),
+    default='png',
+    help='Image format, default png'
+)
+@click.option(
+    '--preset',
+    type=click.Choice(['lossless', 'high', 'balanced', 'draft']),
+    default=None,
+    help='Format/quality preset (overrides --format and --quality)'
+)
+@click.option(
+    '--selector',
+    type=str,
+    default=None,
+    help='Capture only the element matching this CSS selector'
 )
 @click.pass_context
 @print_usage
-def screenshot(ctx, output_file: str, full_page: bool, quality: int):
+def screenshot(ctx, output_file: str, full_page: bool, quality: int,
+               image_format: str, preset: Optional[str], selector: Optional[str]):
     """
     Capture page screenshot
 
     If there's an active run context, screenshot will be saved to run's screenshots directory,
     OUTPUT_FILE will be used as description for filename generation (auto-numbered).
+    A screenshot identical to the run's previous one is not stored again.
 
     If no run context, OUTPUT_FILE is used as complete file path.
+
+    Full-page captures of long pages are taken in tiles and stitched.
     """
-    try:
-        # Check for active run context
-        actual_output_file = output_file
-        try:
-            from ..run.screenshot import get_next_screenshot_number
-            from slugify import slugify
+    from ..cdp.commands.screenshot import resolve_format
+
+    image = resolve_format(image_format, quality, preset)
 
+    # Check for active run context
+    screenshots_dir = None
+    try:
+        if _get_run_dir().name != ".tmp":
             screenshots_dir = _get_run_screenshots_dir()
-            run_dir = _get_run_dir()
-
-            # Check if .tmp directory (no run context)
-            if run_dir.name != ".tmp":
-                # Has run context, use output_file as description for filename
-                # Remove possible extension as description
-                description = Path(output_file).stem
-                seq = get_next_screenshot_number(screenshots_dir)
-                desc_slug = slugify(description or 'screenshot', max_length=40)
-                filename = f"{seq:03d}_{desc_slug}.png"
-                actual_output_file = str(screenshots_dir / filename)
-        except Exception:
-            # Get run context failed, use original path
-            pass
+    except Exception:
+        # Get run context failed, use original path
+        pass
 
+    try:
         with create_session(ctx) as session:
-            session.screenshot.capture(actual_output_file, full_page=full_page, quality=quality)
-            _print_msg("success", f"Screenshot saved to: {actual_output_file}", "screenshot", {"file": actual_output_file, "full_page": full_page})
+            if screenshots_dir is None:
+                if selector:
+                    session.screenshot.capture_element(selector, output_file, **image)
+                else:
+                    session.screenshot.capture(output_file, full_page=full_page, **image)
+                _print_msg("success", f"Screenshot saved to: {output_file}", "screenshot", {"file": output_file, "full_page": full_page})
+                return
+
+            # Has run context, use output_file as description for filename
+            # Remove possible extension as description
+            description = Path(output_file).stem
+            if full_page and not selector:
+                from ..run.screenshot import reserve_screenshot_path
+
+                # Tiled captures stream straight to disk, no dedupe; recording
+                # them as the last screenshot keeps later ones from being
+                # deduped against an older capture
+                path, _ = reserve_screenshot_path(description, screenshots_dir, format=image['format'])
+                actual_output_file = str(path)
+                session.screenshot.capture(actual_output_file, full_page=True, **image)
+                deduped = False
+            else:
+                from ..run.screenshot import save_screenshot
+
+                if selector:
+                    result = session.screenshot.capture_element(selector, **image)
+                else:
+                    result = session.screenshot.capture(**image)
+                path, _, deduped = save_screenshot(result["data"], description, screenshots_dir, format=image['format'])
+                actual_output_file = str(path)
+
+            if deduped:
+                _print_msg("success", f"Screenshot unchanged, already saved as: {actual_output_file}", "screenshot", {"file": actual_output_file, "deduplicated": True})
+            else:
+                _print_msg("success", f"Screenshot saved to: {actual_output_file}", "screenshot", {"file": actual_output_file, "full_page": full_page})
     except CDPError as e:
         _print_msg("error", f"Screenshot failed: {e}", "screenshot", {"file": output_file, "error": str(e)})
 
@@ -733,7 +833,7 @@ def execute_javascript(ctx, script: str, return_value: bool):
                 _print_msg("success", "JavaScript execution completed", "interaction")
 
             # Brief wait after JS execution
-            time.sleep(0.3)
+            session.settle(0.3)
 
             # Perception: capture DOM features
             _do_perception(session, "exec-js")
@@ -783,9 +883,16 @@ def _get_next_output_number(outputs_dir: Path, ext: str = ".txt") -> int:
     default=None,
     help='Content description (used for filename generation)'
 )
+@click.option(
+    '--readable',
+    is_flag=True,
+    help='Extract only the main content (readability-style) as Markdown with links'
+)
+@click.option('--offset', type=int, default=0, help='First character to return (for paging)')
+@click.option('--limit', type=int, default=None, help='Maximum number of characters to return')
 @click.pass_context
 @print_usage
-def get_content(ctx, selector: str, desc: Optional[str]):
+def get_content(ctx, selector: str, desc: Optional[str], readable: bool, offset: int, limit: Optional[int]):
     """
     Get text content from page or element
 
@@ -794,12 +901,24 @@ def get_content(ctx, selector: str, desc: Optional[str]):
     - Text content
     - Hyperlinks contained in the content
 
+    With --readable, menus, footers, scripts and other boilerplate are
+    dropped and the main content is returned as Markdown. Use --limit to
+    cap the printed characters and --offset to page through the rest.
+
     If an active run context exists, the content will be automatically saved to the run's outputs directory.
     """
     import json as json_module
 
+    if offset < 0 or (limit is not None and limit <= 0):
+        _print_msg("error", "--offset must be >= 0 and --limit > 0", "extraction", {"selector": selector})
+        return
+
     try:
         with create_session(ctx) as session:
+            if readable:
+                _get_readable_content(session, selector, desc, offset, limit)
+                return
+
             script = f"""
             (function() {{
                 var el = document.querySelector('{selector}');
@@ -827,7 +946,8 @@ def get_content(ctx, selector: str, desc: Optional[str]):
 
                 return JSON.stringify({{
                     source_url: sourceUrl,
-                    content: textContent,
+                    content: textContent.substring({offset}, {offset + limit if limit else "undefined"}),
+                    total_length: textContent.length,
                     links: links
                 }});
             }})()
@@ -848,10 +968,17 @@ def get_content(ctx, selector: str, desc: Optional[str]):
             content = result.get('content', '')
             links = result.get('links', [])
 
+            total_length = result.get('total_length', len(content))
+
             # Format output content
             formatted_output = f"Source: {source_url}\n\n"
             formatted_output += "--- Content ---\n"
             formatted_output += content
+            if offset + len(content) < total_length:
+                formatted_output += (
+                    f"\n\n[Truncated: characters {offset}-{offset + len(content)} of {total_length}, "
+                    f"continue with --offset {offset + len(content)}]"
+                )
             if links:
                 formatted_output += "\n\n--- Included Links ---\n"
                 for link in links:
@@ -896,6 +1023,65 @@ def get_content(ctx, selector: str, desc: Optional[str]):
         _print_msg("error", f"Failed to get content: {e}", "extraction", {"selector": selector, "error": str(e)})
 
 
+def _get_readable_content(session: CDPSession, selector: str, desc: Optional[str],
+                          offset: int, limit: Optional[int]) -> None:
+    """Print one page of the readable Markdown, streaming the full document to outputs/"""
+    root_selector = None if selector == 'body' else selector
+    try:
+        page = session.page.get_readable_content(root_selector, offset=offset, limit=limit)
+    except CDPError as e:
+        _print_msg("error", f"Failed to extract readable content: {e}", "extraction", {"selector": selector})
+        return
+
+    source_url = page['source_url']
+    total_length = page['total_length']
+    end = offset + len(page['content'])
+
+    # Save the whole document once, on the first page, in slices
+    saved_file = None
+    if offset == 0:
+        try:
+            from slugify import slugify
+
+            outputs_dir = _get_run_outputs_dir()
+            if _get_run_dir().name != ".tmp":
+                seq = _get_next_output_number(outputs_dir, ".md")
+                description = desc or page.get('title') or selector.replace(" ", "-")[:30]
+                file_path = outputs_dir / f"{seq:03d}_{slugify(description, max_length=40)}.md"
+                with open(file_path, "w", encoding="utf-8") as f:
+                    f.write(f"<!-- Source: {source_url} -->\n\n")
+                    if page['next_offset'] is None:
+                        f.write(page['content'])
+                    else:
+                        for chunk in session.page.iter_readable_content(root_selector):
+                            f.write(chunk['content'])
+                saved_file = str(file_path)
+        except Exception:
+            pass
+
+    formatted_output = f"Source: {source_url}\n\n--- Content (Markdown) ---\n{page['content']}"
+    if page['next_offset'] is not None:
+        formatted_output += (
+            f"\n\n[Truncated: characters {offset}-{end} of {total_length}, "
+            f"continue with --offset {page['next_offset']}]"
+        )
+
+    log_data = {
+        "selector": selector,
+        "source_url": source_url,
+        "mode": "readable",
+        "offset": offset,
+        "returned_chars": len(page['content']),
+        "total_chars": total_length,
+        "links_count": page['links_count'],
+    }
+    if saved_file:
+        log_data["file"] = saved_file
+        _print_msg("success", f"Readable content retrieved ({selector}), saved to: {saved_file}\n{formatted_output}", "extraction", log_data)
+    else:
+        _print_msg("success", f"Readable content retrieved ({selector}):\n{formatted_output}", "extraction", log_data)
+
+
 @click.command('status')
 @click.pass_context
 @print_usage
@@ -938,7 +1124,7 @@ def scroll(ctx, distance: int):
             _print_msg("success", f"Scrolled {distance} pixels", "interaction", {"distance": distance})
 
             # Brief wait after scroll
-            time.sleep(0.3)
+            session.settle(0.3)
 
             # Perception: capture DOM features
             _do_perception(session, f"scroll-{distance}px")
@@ -981,6 +1167,8 @@ def scroll_to(ctx, selector: Optional[str], text: Optional[str], block: str = 'c
 
     try:
         with create_session(ctx) as session:
+            # Smooth scrolling only costs time in fast settle mode
+            behavior = 'auto' if session.config.fast_settle else 'smooth'
             if text:
                 # Find element by text content
                 js_code = f'''
@@ -1004,7 +1192,7 @@ def scroll_to(ctx, selector: Optional[str], text: Optional[str], block: str = 'c
 
                     const textNode = walker.nextNode();
                     if (textNode && textNode.parentElement) {{
-                        textNode.parentElement.scrollIntoView({{behavior: 'smooth', block: block}});
+                        textNode.parentElement.scrollIntoView({{behavior: '{behavior}', block: block}});
                         return 'success';
                     }}
                     return 'element not found';
@@ -1017,7 +1205,7 @@ def scroll_to(ctx, selector: Optional[str], text: Optional[str], block: str = 'c
                 (function() {{
                     const el = document.querySelector({repr(selector)});
                     if (el) {{
-                        el.scrollIntoView({{behavior: 'smooth', block: '{block}'}});
+                        el.scrollIntoView({{behavior: '{behavior}', block: '{block}'}});
                         return 'success';
                     }} else {{
                         return 'element not found';
@@ -1030,7 +1218,7 @@ def scroll_to(ctx, selector: Optional[str], text: Optional[str], block: str = 'c
 
             if result == 'success':
                 _print_msg("success", f"Scrolled to element: {display_target}", "interaction", {"selector": selector, "text": text, "block": block})
-                time.sleep(0.5)  # Wait for scroll animation to complete
+                session.settle(0.5)  # Wait for scroll animation to complete
                 _do_perception(session, f"scroll-to-{(text or selector)[:30]}")
             else:
                 _print_msg("error", f"Element not found: {display_target}", "interaction", {"selector": selector, "text": text})
@@ -1071,7 +1259,7 @@ def zoom(ctx, factor: float):
             _print_msg("success", f"Page zoom set to: {factor}", "interaction", {"zoom_factor": factor})
 
             # Brief wait after zoom
-            time.sleep(0.2)
+            session.settle(0.2)
 
             # Perception: capture DOM features
             _do_perception(session, f"zoom-{factor}x")
@@ -1468,6 +1656,12 @@ def init(force: bool):
     type=click.Path(),
     help='Chrome user data directory (default ~/.frago/chrome_profile)'
 )
+@click.option(
+    '--profile',
+    type=click.Choice(['persistent', 'ephemeral']),
+    default='persistent',
+    help='Profile mode: persistent (reuse profile directory) or ephemeral (fresh temporary profile on tmpfs, removed on stop)'
+)
 @click.option(
     '--no-kill',
     is_flag=True,
@@ -1480,7 +1674,7 @@ def init(force: bool):
 )
 @print_usage
 def chrome_start(headless: bool, void: bool, port: int, width: int, height: int,
-                 profile_dir: str, no_kill: bool, keep_alive: bool):
+                 profile_dir: str, profile: str, no_kill: bool, keep_alive: bool):
     """
     Launch Chrome browser (with CDP debugging support)
 
@@ -1490,10 +1684,16 @@ def chrome_start(headless: bool, void: bool, port: int, width: int, height: int,
       --headless - Run without UI
       --void     - Window hidden off-screen
 
+    \b
+    Profile modes:
+      persistent - Reuse ~/.frago/chrome_profile (or --profile-dir)
+      ephemeral  - Fresh empty profile on tmpfs, deleted when Chrome stops
+
     \b
     Examples:
       frago chrome                    # Normal launch
       frago chrome --headless         # Headless mode
+      frago chrome --headless --profile ephemeral  # Lightweight unattended mode
       frago chrome --void             # Void mode
       frago chrome --port 9333        # Use different port
       frago chrome --keep-alive       # Keep running after launch
@@ -1506,6 +1706,10 @@ def chrome_start(headless: bool, void: bool, port: int, width: int, height: int,
         click.echo("Warning: --headless and --void cannot be used together, will use --headless mode")
         void = False
 
+    if profile == 'ephemeral' and profile_dir:
+        click.echo("Warning: --profile-dir is ignored with --profile ephemeral")
+        profile_dir = None
+
     profile_path = Path(profile_dir) if profile_dir else None
 
     # Detect if a non-default port was explicitly specified
@@ -1519,6 +1723,7 @@ def chrome_start(headless: bool, void: bool, port: int, width: int, height: int,
         height=height,
         profile_dir=profile_path,
         use_port_suffix=use_port_suffix,
+        profile=profile,
     )
 
     # Check if Chrome exists
@@ -1528,13 +1733,17 @@ def chrome_start(headless: bool, void: bool, port: int, width: int, height: int,
         return
 
     click.echo(f"Chrome path: {launcher.chrome_path}")
-    click.echo(f"Profile directory: {launcher.profile_dir}")
+    if profile != 'ephemeral':
+        click.echo(f"Profile directory: {launcher.profile_dir}")
     click.echo(f"CDP port: {port}")
     click.echo(f"Mode: {'headless' if headless else 'void' if void else 'normal window'}")
+    click.echo(f"Profile: {profile}")
 
     # Launch Chrome
     if launcher.launch(kill_existing=not no_kill):
         click.echo(f"\n[OK] Chrome launched, CDP listening on port: {port}")
+        if profile == 'ephemeral':
+            click.echo(f"Ephemeral profile directory: {launcher.profile_dir}")
 
         # Get and display status
         status_info = launcher.get_status()
@@ -1695,4 +1904,244 @@ def switch_tab(ctx, tab_id: str):
         })
 
     except Exception as e:
-        click.echo(f"Failed to switch tab: {e}", err=True)
\ No newline at end of file
+        click.echo(f"Failed to switch tab: {e}", err=True)
+
+
+@click.command('archive')
+@click.argument('description', default='page')
+@click.pass_context
+@print_usage
+def archive(ctx, description: str):
+    """
+    Save the current page as an MHTML snapshot
+
+    The snapshot (page plus subresources) and a JSON sidecar with the
+    original URL are saved to the run's outputs directory. Replay it with
+    `frago recipe run <name> --offline <snapshot>`.
+    """
+    try:
+        from slugify import slugify
+        from ..cdp.offline import save_snapshot
+
+        outputs_dir = _get_run_outputs_dir()
+        seq = _get_next_output_number(outputs_dir, ".mhtml")
+        desc_slug = slugify(description or 'page', max_length=40)
+        file_path = outputs_dir / f"{seq:03d}_{desc_slug}.mhtml"
+
+        with create_session(ctx) as session:
+            meta = save_snapshot(session, file_path)
+            _print_msg("success", f"Page archived to: {file_path} ({meta['size'] / 1048576:.1f}MB, {meta['url']})", "extraction", meta)
+    except CDPError as e:
+        _print_msg("error", f"Archive failed: {e}", "extraction", {"description": description, "error": str(e)})
+
+
+@click.command('download')
+@click.argument('url')
+@click.option(
+    '--output-dir',
+    type=click.Path(file_okay=False, path_type=Path),
+    default=None,
+    help="Download directory, default: current run's outputs/"
+)
+@click.option(
+    '--timeout',
+    'download_timeout',
+    type=float,
+    default=300,
+    help='Seconds to wait for the download to finish, default 300'
+)
+@click.pass_context
+@print_usage
+def download(ctx, url: str, output_dir: Optional[Path], download_timeout: float):
+    """
+    Download a file through the browser
+
+    Uses the browser's cookies and session, and saves the file directly into
+    the run's outputs directory (or --output-dir) without re-fetching it.
+    """
+    directory = output_dir or _get_run_outputs_dir()
+    last_report = [0.0]
+
+    def report(info: Dict[str, Any]) -> None:
+        # Throttle progress lines to one per second
+        now = time.time()
+        if info.get("state") != "inProgress" or now - last_report[0] < 1.0:
+            return
+        last_report[0] = now
+        total = info.get("total_bytes") or 0
+        received = info.get("received_bytes") or 0
+        percent = f" ({received * 100 // total}%)" if total else ""
+        click.echo(f"  {info.get('filename') or 'download'}: {received / 1048576:.1f}MB{percent}", err=True)
+
+    try:
+        with create_session(ctx) as session:
+            session.downloads.set_download_dir(directory)
+            session.downloads.on_progress(report)
+            info = session.downloads.download(url, timeout=download_timeout)
+            log_data = {"url": url, "file": info.get("path"), "bytes": info.get("received_bytes")}
+            _print_msg("success", f"Downloaded: {info.get('path')} ({info.get('received_bytes', 0)} bytes)", "other", log_data)
+    except CDPError as e:
+        _print_msg("error", f"Download failed: {e}", "other", {"url": url, "error": str(e)})
+
+
+# ============================================================
+# Browser State Commands
+# ============================================================
+
+
+@click.group('state', cls=AgentFriendlyGroup)
+def chrome_state():
+    """
+    Save and restore browser login state
+
+    Snapshots cookies, localStorage/sessionStorage and IndexedDB names into
+    ~/.frago/browser_states/<name>.json, so later runs can start already
+    authenticated instead of repeating the login flow.
+    """
+    pass
+
+
+@chrome_state.command('save')
+@click.argument('name')
+@click.option(
+    '--origin',
+    'origins',
+    multiple=True,
+    help='Origin whose storage to capture (repeatable), default: current page origin'
+)
+@click.pass_context
+@print_usage
+def state_save(ctx, name: str, origins: tuple):
+    """Capture cookies and storage of the current browser into a named state"""
+    try:
+        with create_session(ctx) as session:
+            path = session.state.save(name, list(origins) or None)
+            _print_msg("success", f"Browser state saved: {name} ({path})", "other", {"name": name, "file": str(path)})
+    except (CDPError, ValueError) as e:
+        _print_msg("error", f"Failed to save browser state: {e}", "other", {"name": name, "error": str(e)})
+
+
+@chrome_state.command('load')
+@click.argument('name')
+@click.pass_context
+@print_usage
+def state_load(ctx, name: str):
+    """Restore a named state into the current browser"""
+    try:
+        with create_session(ctx) as session:
+            counts = session.state.load(name)
+            _print_msg("success", f"Browser state restored: {name} ({counts['cookies']} cookies, {counts['storage_items']} storage items)", "other", {"name": name, **counts})
+            if counts["skipped_origins"]:
+                _print_msg("warning", f"Storage not restored for: {', '.join(counts['skipped_origins'])}", "other", {"name": name, "skipped_origins": counts["skipped_origins"]})
+    except (CDPError, ValueError) as e:
+        _print_msg("error", f"Failed to load browser state: {e}", "other", {"name": name, "error": str(e)})
+
+
+@chrome_state.command('list')
+@print_usage
+def state_list():
+    """List saved browser states"""
+    from ..cdp.commands.state import list_states
+
+    names = list_states()
+    if not names:
+        click.echo("No saved browser states")
+        return
+    for name in names:
+        click.echo(name)
+
+
+# ============================================================
+# CDP Stats Commands
+# ============================================================
+
+
+@click.command('stats')
+@click.option('--top', type=int, default=None, help='Only show the N methods with the highest total time')
+@click.option('--json', 'as_json', is_flag=True, help='Output as JSON')
+@click.option('--dump', is_flag=True, help="Write stats to the current run's logs/cdp_stats.json")
+@click.option('--reset', is_flag=True, help='Delete accumulated stats')
+@print_usage
+def chrome_stats(top: Optional[int], as_json: bool, dump: bool, reset: bool):
+    """
+    Show CDP latency and traffic stats
+
+    Stats are collected by sessions started with --cdp-stats (or
+    FRAGO_CDP_STATS=1) and accumulated in ~/.frago/cdp_stats.json:
+    per-method latency percentiles, bytes sent/received, events per
+    domain, message queue depth and reconnects.
+    """
+    import json
+
+    from ..cdp.metrics import format_stats, load_stats, reset_stats, write_stats
+
+    if reset:
+        reset_stats()
+        click.echo("CDP stats reset")
+        return
+
+    metrics = load_stats()
+    if metrics.empty:
+        click.echo("No CDP stats recorded (run commands with --cdp-stats to collect)")
+        return
+
+    if dump:
+        path = _get_run_dir() / "logs" / "cdp_stats.json"
+        write_stats(metrics, path)
+        _print_msg("success", f"CDP stats written to: {path}", "other", {"file": str(path)})
+        return
+
+    summary = metrics.summary(top=top)
+    if as_json:
+        click.echo(json.dumps(summary, indent=2, ensure_ascii=False))
+        return
+    for line in format_stats(summary):
+        click.echo(line)
+
+
+@click.command('gc')
+@click.option('--dry-run', is_flag=True, help='Only show which tabs would be closed')
+@click.option('--keep-overlays', is_flag=True, help='Do not clear frago overlays from the tabs frago opened')
+@click.option('--json', 'as_json', is_flag=True, help='Output as JSON')
+@click.pass_context
+@print_usage
+def chrome_gc(ctx, dry_run: bool, keep_overlays: bool, as_json: bool):
+    """
+    Close leaked tabs and clear leftover overlays
+
+    Tabs opened by frago are tracked with their owner and TTL. This
+    closes tracked tabs left unused for longer than their TTL or whose
+    owning process has exited, removes frago highlights/annotations/underlines
+    from the tracked tabs left open and reports Chrome's memory usage.
+    """
+    import json
+
+    from ..cdp.gc import BrowserGC
+    from ..cdp.metrics import format_bytes
+
+    config = CDPConfig(host=ctx.obj['HOST'], port=ctx.obj['PORT'])
+    try:
+        report = BrowserGC(config).collect(dry_run=dry_run, clear_overlays=not keep_overlays)
+    except CDPError as e:
+        _print_msg("error", str(e), "other")
+        sys.exit(1)
+
+    if as_json:
+        click.echo(json.dumps(report, indent=2, ensure_ascii=False))
+        return
+
+    verb = "Would close" if dry_run else "Closed"
+    for entry in report["closed"]:
+        click.echo(f"{verb} {entry['reason']} tab {entry['target_id'][:8]}... "
+                   f"({entry['owner']}, {entry['age']:.0f}s old, idle {entry['idle']:.0f}s) {entry['url']}")
+    memory = report["memory"]
+    if memory:
+        click.echo(f"Chrome memory: {format_bytes(memory['rss_bytes'])} "
+                   f"in {memory['processes']} processes (pid {memory['browser_pid']})")
+    _print_msg(
+        "success",
+        f"{verb} {len(report['closed'])} tabs, cleared overlays in "
+        f"{len(report['overlays_cleared'])} pages, {report['tracked']} tracked tabs remain",
+        "other",
+        report
+    )
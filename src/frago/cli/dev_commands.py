@@ -2,11 +2,13 @@
 
 Contains:
   - pack: User directory → Package resources
+  - fake-cdp: Fake CDP server for benchmarks and tests without Chrome
 """
 
 import click
 
 from .pack_command import dev_pack
+from .fake_cdp_command import dev_fake_cdp
 from .agent_friendly import AgentFriendlyGroup
 
 
@@ -20,6 +22,7 @@ def dev_group():
     \b
     Subcommands:
       pack     User directory → Package resources (src/frago/resources/)
+      fake-cdp Fake CDP server replaying a recorded trace
 
     \b
     Data flow:
@@ -36,9 +39,11 @@ def dev_group():
       frago dev pack              # Package user directory resources
       frago dev pack --dry-run    # Preview files to be synced
       frago dev pack --all        # Ignore manifest, sync all
+      frago dev fake-cdp --trace run.jsonl --port 9333
     """
     pass
 
 
-# Register subcommand
+# Register subcommands
 dev_group.add_command(dev_pack, name="pack")
+dev_group.add_command(dev_fake_cdp, name="fake-cdp")
@@ -0,0 +1,88 @@
+"""dev fake-cdp command - Run a fake CDP server for benchmarks and tests without Chrome"""
+
+from pathlib import Path
+from typing import Optional
+
+import click
+
+
+@click.command(name="fake-cdp")
+@click.option(
+    "--host",
+    type=str,
+    default="127.0.0.1",
+    help="Listen host, default 127.0.0.1",
+)
+@click.option(
+    "--port",
+    type=int,
+    default=9333,
+    help="Listen port, default 9333",
+)
+@click.option(
+    "--trace",
+    "trace_path",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    default=None,
+    help="CDP trace file (recorded with --cdp-trace) to replay responses from",
+)
+@click.option(
+    "--latency",
+    type=float,
+    default=0.0,
+    help="Fixed response latency in seconds",
+)
+@click.option(
+    "--jitter",
+    type=float,
+    default=0.0,
+    help="Random extra latency up to this many seconds",
+)
+@click.option(
+    "--replay-timing",
+    is_flag=True,
+    help="Use response latencies recorded in the trace",
+)
+def dev_fake_cdp(
+    host: str,
+    port: int,
+    trace_path: Optional[Path],
+    latency: float,
+    jitter: float,
+    replay_timing: bool,
+):
+    """
+    Run a fake CDP server
+
+    Serves Chrome's /json endpoints and DevTools WebSockets, answering
+    commands from a recorded trace or with built-in defaults. Point frago
+    at it with --port (or FRAGO_CDP_PORT, which recipes inherit).
+
+    \b
+    Examples:
+      frago --cdp-trace run.jsonl chrome navigate https://example.com
+      frago dev fake-cdp --trace run.jsonl --port 9333
+      FRAGO_CDP_PORT=9333 frago recipe run my_recipe
+    """
+    from frago.cdp.fake_server import FakeCDPServer
+
+    server = FakeCDPServer(
+        host=host,
+        port=port,
+        trace=trace_path,
+        latency=latency,
+        jitter=jitter,
+        replay_timing=replay_timing,
+    )
+
+    source = f"trace {trace_path}" if trace_path else "default responses"
+    click.echo(f"Fake CDP server on http://{host}:{port} ({source}), Ctrl+C to stop")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+    if server.command_counts:
+        click.echo("\nCommands served:")
+        for method, count in server.command_counts.most_common():
+            click.echo(f"  {count:6d}  {method}")
@@ -49,8 +49,10 @@ CHROME_SUBGROUPS = OrderedDict([
     ("Lifecycle", ["start", "stop", "status"]),
     ("Tab Management", ["list-tabs", "switch-tab"]),
     ("Page Control", ["navigate", "scroll", "scroll-to", "zoom", "wait"]),
-    ("Element Interaction", ["click", "exec-js", "get-title", "get-content"]),
+    ("Element Interaction", ["click", "exec-js", "get-title", "get-content", "download", "archive"]),
     ("Visual Effects", ["screenshot", "highlight", "pointer", "spotlight", "annotate", "underline", "clear-effects"]),
+    ("Browser State", ["state"]),
+    ("Diagnostics", ["stats", "gc"]),
 ])
 
 
@@ -191,13 +193,15 @@ class AgentFriendlyGroupedGroup(AgentFriendlyGroup):
     '--host',
     type=str,
     default='127.0.0.1',
-    help='Chrome DevTools Protocol host address, default 127.0.0.1'
+    envvar='FRAGO_CDP_HOST',
+    help='Chrome DevTools Protocol host address, default 127.0.0.1 (env: FRAGO_CDP_HOST)'
 )
 @click.option(
     '--port',
     type=int,
     default=9222,
-    help='Chrome DevTools Protocol port, default 9222'
+    envvar='FRAGO_CDP_PORT',
+    help='Chrome DevTools Protocol port, default 9222 (env: FRAGO_CDP_PORT)'
 )
 @click.option(
     '--proxy-host',
@@ -227,13 +231,38 @@ class AgentFriendlyGroupedGroup(AgentFriendlyGroup):
 @click.option(
     '--target-id',
     type=str,
-    help='Specify target tab ID for precise control in multi-tab environments'
+    envvar='FRAGO_TARGET_ID',
+    help='Specify target tab ID for precise control in multi-tab environments (env: FRAGO_TARGET_ID)'
+)
+@click.option(
+    '--fast-settle',
+    is_flag=True,
+    help='Speed up animations and advance page timers with virtual time instead of waiting'
+)
+@click.option(
+    '--cdp-trace',
+    type=click.Path(dir_okay=False),
+    envvar='FRAGO_CDP_TRACE',
+    help='Record all CDP traffic to a JSONL trace file (env: FRAGO_CDP_TRACE)'
+)
+@click.option(
+    '--cdp-stats',
+    is_flag=True,
+    envvar='FRAGO_CDP_STATS',
+    help='Collect per-method CDP latency stats (see frago chrome stats) (env: FRAGO_CDP_STATS)'
+)
+@click.option(
+    '--perf-metrics',
+    is_flag=True,
+    envvar='FRAGO_PERF_METRICS',
+    help='Sample page performance metrics after page loads into the run log (env: FRAGO_PERF_METRICS)'
 )
 @click.pass_context
 def cli(ctx, gui: bool, gui_background: bool, debug: bool, timeout: int, host: str, port: int,
         proxy_host: Optional[str], proxy_port: Optional[int],
         proxy_username: Optional[str], proxy_password: Optional[str],
-        no_proxy: bool, target_id: Optional[str]):
+        no_proxy: bool, target_id: Optional[str], fast_settle: bool,
+        cdp_trace: Optional[str], cdp_stats: bool, perf_metrics: bool):
     """
     Frago - AI Agent Multi-Runtime Automation Infrastructure
 
@@ -258,6 +287,10 @@ def cli(ctx, gui: bool, gui_background: bool, debug: bool, timeout: int, host: s
     ctx.obj['PROXY_PASSWORD'] = proxy_password
     ctx.obj['NO_PROXY'] = no_proxy
     ctx.obj['TARGET_ID'] = target_id
+    ctx.obj['FAST_SETTLE'] = fast_settle
+    ctx.obj['CDP_TRACE'] = cdp_trace
+    ctx.obj['CDP_STATS'] = cdp_stats
+    ctx.obj['PERF_METRICS'] = perf_metrics
 
     # Handle --gui option (deprecated, show migration notice)
     if gui:
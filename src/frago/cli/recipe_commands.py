@@ -284,6 +284,13 @@ def recipe_info(name: str, source: Optional[str], output_format: str):
     default=300,
     help='Execution timeout (seconds)'
 )
+@click.option(
+    '--offline',
+    'offline_snapshot',
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    default=None,
+    help='Run against an MHTML snapshot (from frago chrome archive) in an isolated offline tab'
+)
 def run_recipe(
     name: str,
     source: Optional[str],
@@ -292,9 +299,15 @@ def run_recipe(
     env_vars: tuple,
     output_file: Optional[str],
     output_clipboard: bool,
-    timeout: int
+    timeout: int,
+    offline_snapshot: Optional[Path]
 ):
-    """Execute specified recipe"""
+    """
+    Execute specified recipe
+
+    With --offline, the recipe runs against a saved page snapshot instead
+    of the live site (network disabled), for fast, repeatable iteration.
+    """
     try:
         # Parse parameters
         if params_file:
@@ -335,7 +348,8 @@ def run_recipe(
             output_target,
             output_options,
             env_overrides=env_overrides if env_overrides else None,
-            source=source
+            source=source,
+            offline_snapshot=offline_snapshot
         )
 
         # Output stderr (logs during script execution)
@@ -7,17 +7,22 @@ Provides session data querying, viewing, and management functions:
 - session show: View session details
 - session watch: Monitor sessions in real-time
 - session clean: Clean up expired sessions
+- session compact: Compress the steps of idle sessions
+- session search: Full-text search over session steps
+- session reindex: Rebuild the session search index
 """
 
 import json
+import re
 import sys
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 import click
 
 from frago.session.formatter import (
     TerminalFormatter,
+    format_bytes,
     format_duration,
     format_timestamp,
     get_step_icon,
@@ -27,12 +32,16 @@ from frago.session.formatter import (
 from frago.session.models import AgentType, SessionStatus, StepType
 from frago.session.storage import (
     clean_old_sessions,
+    compact_idle_sessions,
     delete_session,
     get_session_data,
     list_sessions,
     read_metadata,
     read_steps,
     read_summary,
+    rebuild_index,
+    search_steps,
+    sweep_unreferenced_blobs,
 )
 from .agent_friendly import AgentFriendlyGroup
 
@@ -240,7 +249,10 @@ def show_cmd(
                 icon = get_step_icon(step.type)
                 label = get_step_label(step.type)
                 ts = step.timestamp.strftime("%H:%M:%S")
-                click.echo(f"  [{ts}] {icon} {label}: {step.content_summary}")
+                content = step.content_summary
+                if step.content_blob:
+                    content += f" ... [{step.content_size} bytes in blob {step.content_blob[:12]}]"
+                click.echo(f"  [{ts}] {icon} {label}: {content}")
 
 
 def _find_session_by_prefix(prefix: str, agent_type: AgentType):
@@ -338,7 +350,8 @@ def clean_cmd(
     """
     Clean up expired sessions
 
-    Delete session data older than the specified number of days.
+    Delete session data older than the specified number of days, then
+    remove the blobs no remaining session refers to.
 
     \b
     Examples:
@@ -383,6 +396,88 @@ def clean_cmd(
             cleaned += 1
 
     click.echo(f"[OK] Cleaned {cleaned} sessions")
+    if cleaned:
+        _echo_blob_sweep()
+
+
+def _echo_blob_sweep() -> None:
+    """Remove the blobs left unreferenced by deleted sessions and report them"""
+    report = sweep_unreferenced_blobs()
+    if report["blobs"]:
+        click.echo(
+            f"[OK] Removed {report['blobs']} unreferenced blobs "
+            f"(reclaimed {format_bytes(report['bytes_reclaimed'])})"
+        )
+
+
+@session_group.command("compact")
+@click.option(
+    "--days", "-d",
+    type=int,
+    default=30,
+    help="Compact sessions idle for more than N days"
+)
+@click.option(
+    "--agent-type", "-a",
+    type=click.Choice(["claude", "cursor", "cline", "all"]),
+    default="all",
+    help="Filter by agent type"
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    help="Only show how much would be compacted"
+)
+@click.option(
+    "--json", "json_output",
+    is_flag=True,
+    help="Output in JSON format"
+)
+def compact_cmd(
+    days: int,
+    agent_type: str,
+    dry_run: bool,
+    json_output: bool
+):
+    """
+    Compress the steps of idle sessions
+
+    Converts steps.jsonl of sessions idle for more than the specified
+    number of days into gzip blocks. History stays readable by session
+    show and the web UI; a resumed session is decompressed again.
+
+    \b
+    Examples:
+      frago session compact              # Sessions idle for 30+ days
+      frago session compact --days 7
+      frago session compact --dry-run
+    """
+    agent_filter = None
+    if agent_type != "all":
+        agent_filter = AgentType(agent_type)
+
+    report = compact_idle_sessions(days, agent_filter, dry_run=dry_run)
+
+    if json_output:
+        click.echo(json.dumps(report, indent=2))
+        return
+
+    if not report["sessions"]:
+        click.echo(f"No uncompacted sessions idle for more than {days} days")
+        return
+
+    if dry_run:
+        click.echo(
+            f"[Dry Run] {report['sessions']} sessions to compact "
+            f"({format_bytes(report['bytes_before'])} of steps)"
+        )
+        return
+
+    click.echo(
+        f"[OK] Compacted {report['sessions']} sessions: "
+        f"{format_bytes(report['bytes_before'])} -> {format_bytes(report['bytes_after'])} "
+        f"(reclaimed {format_bytes(report['bytes_reclaimed'])})"
+    )
 
 
 @session_group.command("delete")
@@ -429,6 +524,7 @@ def delete_cmd(
 
     if delete_session(session.session_id, agent):
         click.echo(f"[OK] Deleted session: {session.session_id[:8]}...")
+        _echo_blob_sweep()
     else:
         click.echo("[X] Deletion failed", err=True)
         sys.exit(1)
@@ -445,6 +541,12 @@ def delete_cmd(
     is_flag=True,
     help="Force re-sync (including existing sessions)"
 )
+@click.option(
+    "--workers", "-w",
+    type=int,
+    default=None,
+    help="Parallel sync processes (default: FRAGO_SYNC_WORKERS or CPU count, max 8)"
+)
 @click.option(
     "--json", "json_output",
     is_flag=True,
@@ -453,6 +555,7 @@ def delete_cmd(
 def sync_cmd(
     sync_all: bool,
     force: bool,
+    workers: Optional[int],
     json_output: bool
 ):
     """
@@ -466,18 +569,37 @@ def sync_cmd(
       frago session sync           # Sync current project
       frago session sync --all     # Sync all projects
       frago session sync --force   # Force re-sync
+      frago session sync --all -w 4
     """
     import os
 
     from frago.session.sync import sync_all_projects, sync_project_sessions
 
-    if sync_all:
-        click.echo("Syncing sessions from all projects...")
-        result = sync_all_projects(force=force)
-    else:
-        project_path = os.getcwd()
-        click.echo(f"Syncing project: {project_path}")
-        result = sync_project_sessions(project_path, force=force)
+    bar = None
+
+    def progress(done: int, total: int) -> None:
+        nonlocal bar
+        if json_output:
+            return
+        if bar is None:
+            bar = click.progressbar(length=total, label="Syncing", file=sys.stderr)
+            bar.__enter__()
+        # Worker pools report once per chunk of files
+        bar.update(done - bar.pos)
+
+    try:
+        if sync_all:
+            click.echo("Syncing sessions from all projects...")
+            result = sync_all_projects(force=force, workers=workers, progress=progress)
+        else:
+            project_path = os.getcwd()
+            click.echo(f"Syncing project: {project_path}")
+            result = sync_project_sessions(
+                project_path, force=force, workers=workers, progress=progress
+            )
+    finally:
+        if bar is not None:
+            bar.__exit__(None, None, None)
 
     if json_output:
         import json as json_module
@@ -503,3 +625,119 @@ def sync_cmd(
             click.echo(f"  - {err}")
         if len(result.errors) > 5:
             click.echo(f"  ... and {len(result.errors) - 5} more errors")
+
+
+_SINCE_UNITS = {"m": "minutes", "h": "hours", "d": "days", "w": "weeks"}
+
+
+def _parse_since(value: str) -> datetime:
+    """Parse a relative age ("30m", "12h", "7d", "2w") or an ISO date/time"""
+    unit = _SINCE_UNITS.get(value[-1:].lower())
+    if unit and value[:-1].isdigit():
+        return datetime.now(timezone.utc) - timedelta(**{unit: int(value[:-1])})
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        raise click.BadParameter(f"Expected an age like 7d or an ISO date: {value}") from None
+    return parsed if parsed.tzinfo else parsed.astimezone(timezone.utc)
+
+
+@session_group.command("search")
+@click.argument("query")
+@click.option(
+    "--project", "-p",
+    default=None,
+    help="Only sessions of this project path"
+)
+@click.option(
+    "--since",
+    default=None,
+    help="Only steps newer than an age (30m, 12h, 7d, 2w) or an ISO date"
+)
+@click.option(
+    "--status", "-s",
+    type=click.Choice(["running", "completed", "error", "cancelled", "all"]),
+    default="all",
+    help="Filter by session status"
+)
+@click.option(
+    "--limit", "-n",
+    type=int,
+    default=20,
+    help="Limit the number of results"
+)
+@click.option(
+    "--json", "json_output",
+    is_flag=True,
+    help="Output in JSON format"
+)
+def search_cmd(
+    query: str,
+    project: Optional[str],
+    since: Optional[str],
+    status: str,
+    limit: int,
+    json_output: bool
+):
+    """
+    Search session steps
+
+    Finds steps containing all words of QUERY in their content, tool
+    names, tool inputs or project path, best matches first.
+
+    \b
+    Examples:
+      frago session search "npm install"
+      frago session search migration --project . --since 7d
+      frago session search "permission denied" --status error --json
+    """
+    import os
+
+    hits = search_steps(
+        query,
+        status=SessionStatus(status) if status != "all" else None,
+        project_path=os.path.abspath(project) if project else None,
+        since=_parse_since(since) if since else None,
+        limit=limit,
+        marks=("**", "**") if json_output else ("\x00", "\x01"),
+    )
+
+    if json_output:
+        data = [h.model_dump(mode="json") for h in hits]
+        click.echo(json.dumps(data, ensure_ascii=False, indent=2))
+        return
+
+    if not hits:
+        click.echo("No matching steps found")
+        return
+
+    for hit in hits:
+        ts = hit.timestamp.strftime("%Y-%m-%d %H:%M")
+        label = get_step_label(hit.step_type)
+        click.echo(
+            f"{hit.session_id[:8]}  #{hit.step_id:<5} {ts}  {label}  "
+            f"{click.style(hit.session_name or hit.project_path, dim=True)}"
+        )
+        snippet = re.sub(
+            "\x00(.*?)\x01",
+            lambda m: click.style(m.group(1), bold=True),
+            " ".join(hit.snippet.split()),
+        )
+        click.echo(f"  {snippet}")
+
+
+@session_group.command("reindex")
+def reindex_cmd():
+    """
+    Rebuild the session index
+
+    Re-reads every metadata.json and steps.jsonl under ~/.frago/sessions/
+    into the SQLite index used by session lists and search. Only needed if
+    session directories were changed by hand.
+
+    \b
+    Examples:
+      frago session reindex
+    """
+    count = rebuild_index()
+    click.echo(f"[OK] Indexed {count} sessions")
@@ -1,7 +1,9 @@
 """Cross-platform compatibility utilities"""
 import platform
 import shutil
-from typing import List
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List
 
 
 def prepare_command_for_windows(cmd: List[str]) -> List[str]:
@@ -31,3 +33,43 @@ def prepare_command_for_windows(cmd: List[str]) -> List[str]:
         return [executable] + cmd[1:]
 
     return cmd
+
+
+@contextmanager
+def file_lock(path: Path) -> Iterator[None]:
+    """Hold an exclusive inter-process lock while the block runs
+
+    Used to serialize read-modify-write cycles of files shared by the CLI,
+    the server and session processes. The lock file is created if missing
+    and left in place: removing it would let two processes lock different files.
+    Threads of one process exclude each other too, as each call opens the file anew.
+
+    Args:
+        path: Lock file path (e.g. the shared file's path plus ".lock")
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a+b") as f:
+        if platform.system() == "Windows":
+            import msvcrt
+
+            while True:
+                f.seek(0)
+                try:
+                    # LK_LOCK gives up after about 10 seconds, keep waiting
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
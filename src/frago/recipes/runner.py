@@ -44,7 +44,8 @@ class RecipeRunner:
         output_options: dict[str, Any] | None = None,
         env_overrides: dict[str, str] | None = None,
         workflow_context: WorkflowContext | None = None,
-        source: str | None = None
+        source: str | None = None,
+        offline_snapshot: Path | None = None
     ) -> dict[str, Any]:
         """
         Execute the specified Recipe
@@ -57,6 +58,8 @@ class RecipeRunner:
             env_overrides: Environment variable overrides provided by CLI --env parameter
             workflow_context: Workflow execution context (for sharing environment variables across Recipes)
             source: Specify recipe source ('project' | 'user' | 'example'), selects by priority when None
+            offline_snapshot: MHTML snapshot to run against, opened in an isolated tab with
+                network disabled instead of using the live page
 
         Returns:
             Execution result dictionary in format:
@@ -96,7 +99,13 @@ class RecipeRunner:
         # Record start time
         start_time = time.time()
 
+        offline_tab = None
         try:
+            if offline_snapshot is not None:
+                offline_tab = self._open_offline_tab(name, recipe.metadata.runtime, offline_snapshot, resolved_env)
+                # Child frago commands attach to the offline tab
+                resolved_env = {**resolved_env, **offline_tab.env}
+
             # Execute Recipe based on runtime type
             if recipe.metadata.runtime == 'chrome-js':
                 result_data = self._run_chrome_js(name, recipe.script_path, params, resolved_env)
@@ -118,7 +127,7 @@ class RecipeRunner:
             execution_time = time.time() - start_time
 
             # Return success result
-            return {
+            result = {
                 "success": True,
                 "data": result_data.get("data"),
                 "stderr": result_data.get("stderr", ""),
@@ -127,6 +136,9 @@ class RecipeRunner:
                 "recipe_name": name,
                 "runtime": recipe.metadata.runtime
             }
+            if offline_snapshot is not None:
+                result["offline_snapshot"] = str(offline_snapshot)
+            return result
 
         except RecipeExecutionError:
             # Re-raise RecipeExecutionError directly
@@ -140,6 +152,49 @@ class RecipeRunner:
                 exit_code=-1,
                 stderr=str(e)
             )
+        finally:
+            if offline_tab is not None:
+                offline_tab.close()
+
+    def _open_offline_tab(
+        self,
+        recipe_name: str,
+        runtime: str,
+        snapshot_path: Path,
+        env: dict[str, str]
+    ):
+        """
+        Open an MHTML snapshot in an isolated offline tab
+
+        Args:
+            recipe_name: Recipe name
+            runtime: Recipe runtime type
+            snapshot_path: MHTML snapshot path
+            env: Resolved environment variables (FRAGO_CDP_HOST/PORT select the browser)
+
+        Returns:
+            OfflineSnapshotTab: Opened tab, caller must close it
+
+        Raises:
+            RecipeExecutionError: Snapshot could not be opened
+        """
+        from ..cdp.config import CDPConfig
+        from ..cdp.exceptions import CDPError
+        from ..cdp.offline import OfflineSnapshotTab
+
+        config = CDPConfig(
+            host=env.get('FRAGO_CDP_HOST', '127.0.0.1'),
+            port=int(env.get('FRAGO_CDP_PORT', 9222))
+        )
+        try:
+            return OfflineSnapshotTab(snapshot_path, config).open()
+        except CDPError as e:
+            raise RecipeExecutionError(
+                recipe_name=recipe_name,
+                runtime=runtime,
+                exit_code=-1,
+                stderr=f"Failed to open offline snapshot: {e}"
+            )
 
     def _validate_params(self, metadata, params: dict[str, Any]) -> None:
         """
@@ -1,19 +1,28 @@
 """Screenshot Auto-numbering and Saving
 
-Provides screenshot file naming, numbering, and atomic write functionality
+Provides screenshot file naming, numbering, content-hash dedupe and
+off-thread atomic write functionality
 """
 
-import base64
+import hashlib
+import json
 import re
 from pathlib import Path
-from typing import Tuple
+from typing import Optional, Tuple
 
 from slugify import slugify
 
+from ..cdp.imaging import write_image, write_image_async
 from ..cdp.session import CDPSession
 from .exceptions import FileSystemError
 from .utils import ensure_directory_exists
 
+# Records the last saved screenshot of a directory (hash, file, sequence)
+LAST_SCREENSHOT_FILE = ".last_screenshot.json"
+
+# File extension per image format
+IMAGE_EXTENSIONS = {"png": "png", "jpeg": "jpg", "webp": "webp"}
+
 
 def get_next_screenshot_number(screenshots_dir: Path) -> int:
     """Get next screenshot sequence number
@@ -26,8 +35,10 @@ def get_next_screenshot_number(screenshots_dir: Path) -> int:
     """
     ensure_directory_exists(screenshots_dir)
 
-    max_num = 0
-    for file in screenshots_dir.glob("*.png"):
+    # Screenshots still being written in the background are not on disk yet
+    last = _read_last_screenshot(screenshots_dir)
+    max_num = last.get("seq", 0) if last else 0
+    for file in screenshots_dir.iterdir():
         match = re.match(r"^(\d{3})_", file.name)
         if match:
             num = int(match.group(1))
@@ -36,6 +47,83 @@ def get_next_screenshot_number(screenshots_dir: Path) -> int:
     return max_num + 1
 
 
+def _read_last_screenshot(screenshots_dir: Path) -> Optional[dict]:
+    try:
+        return json.loads((screenshots_dir / LAST_SCREENSHOT_FILE).read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def reserve_screenshot_path(
+    description: str,
+    screenshots_dir: Path,
+    format: str = "png",
+    digest: Optional[str] = None,
+) -> Tuple[Path, int]:
+    """Take the next sequence number and record it as the last screenshot
+
+    Args:
+        description: screenshot description
+        screenshots_dir: screenshots directory path
+        format: image format ("png", "jpeg" or "webp")
+        digest: content hash for dedupe, None if the caller writes the file
+            itself (nothing is deduped against it)
+
+    Returns:
+        (file path to write, sequence number)
+    """
+    ensure_directory_exists(screenshots_dir)
+    seq = get_next_screenshot_number(screenshots_dir)
+    desc_slug = slugify(description or "screenshot", max_length=40)
+    filename = f"{seq:03d}_{desc_slug}.{IMAGE_EXTENSIONS.get(format, format)}"
+    (screenshots_dir / LAST_SCREENSHOT_FILE).write_text(
+        json.dumps({"hash": digest, "file": filename, "seq": seq})
+    )
+    return screenshots_dir / filename, seq
+
+
+def save_screenshot(
+    data: str,
+    description: str,
+    screenshots_dir: Path,
+    format: str = "png",
+    dedupe: bool = True,
+    background: bool = False,
+) -> Tuple[Path, int, bool]:
+    """Save screenshot data under the next sequence number
+
+    Identical consecutive screenshots (same content hash) are stored once:
+    the previous file is returned instead of writing a new one.
+
+    Args:
+        data: base64 image data as returned by Page.captureScreenshot
+        description: screenshot description
+        screenshots_dir: screenshots directory path
+        format: image format ("png", "jpeg" or "webp")
+        dedupe: skip saving if identical to the previous screenshot
+        background: decode and write on the screenshot writer pool
+
+    Returns:
+        (file path, sequence number, whether it was deduplicated)
+    """
+    ensure_directory_exists(screenshots_dir)
+    digest = hashlib.sha256(data.encode("ascii")).hexdigest()
+
+    last = _read_last_screenshot(screenshots_dir)
+    if dedupe and last and last.get("hash") == digest:
+        # The previous file may still be pending on the writer pool
+        return screenshots_dir / last["file"], last["seq"], True
+
+    # Reserve the sequence number before the (possibly deferred) write
+    final_path, seq = reserve_screenshot_path(description, screenshots_dir, format, digest)
+
+    if background:
+        write_image_async(data, final_path)
+    else:
+        write_image(data, final_path)
+    return final_path, seq, False
+
+
 def capture_screenshot(description: str, screenshots_dir: Path) -> Tuple[Path, int]:
     """Capture screenshot and save
 
@@ -49,35 +137,14 @@ def capture_screenshot(description: str, screenshots_dir: Path) -> Tuple[Path, i
     Raises:
         FileSystemError: screenshot save failed
     """
-    # Get sequence number
-    seq = get_next_screenshot_number(screenshots_dir)
-
-    # Slugify description
-    desc_slug = slugify(description, max_length=40)
-
-    # Construct filename
-    filename = f"{seq:03d}_{desc_slug}.png"
-    final_path = screenshots_dir / filename
-    temp_path = screenshots_dir / f".tmp_{filename}"
-
     try:
         # Use CDP session to capture screenshot
         with CDPSession() as session:
             result = session.screenshot.capture()
-            screenshot_data = base64.b64decode(result.get("data", ""))
 
         # Atomic write (write to temp file first, then rename)
-        ensure_directory_exists(screenshots_dir)
-        temp_path.write_bytes(screenshot_data)
-        temp_path.rename(final_path)
-
+        final_path, seq, _ = save_screenshot(result.get("data", ""), description, screenshots_dir)
         return final_path, seq
 
     except Exception as e:
-        # Clean up temp file
-        if temp_path.exists():
-            try:
-                temp_path.unlink()
-            except Exception:
-                pass
-        raise FileSystemError("save screenshot", str(final_path), str(e))
+        raise FileSystemError("save screenshot", str(screenshots_dir), str(e))
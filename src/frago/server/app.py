@@ -36,6 +36,7 @@ from frago.server.websocket import manager, MessageType, create_message
 from frago.server.services.cache_service import CacheService
 from frago.server.services.sync_service import SyncService
 from frago.server.services.community_recipe_service import CommunityRecipeService
+from frago.server.services.browser_gc_service import BrowserGCService
 
 
 @asynccontextmanager
@@ -46,6 +47,7 @@ async def lifespan(app: FastAPI):
     - Initialize cache with preloaded data
     - Start background session sync
     - Start community recipe refresh service
+    - Start browser tab garbage collection
     - Stop services on shutdown
     """
     # Startup: Initialize cache first (preload all data)
@@ -62,9 +64,14 @@ async def lifespan(app: FastAPI):
     community_service.set_cache_service(cache_service)
     await community_service.start()
 
+    # Start browser GC (closes leaked frago tabs every 5 minutes)
+    browser_gc_service = BrowserGCService.get_instance()
+    await browser_gc_service.start()
+
     yield
 
     # Shutdown
+    await browser_gc_service.stop()
     await community_service.stop()
     await sync_service.stop()
 
@@ -156,6 +156,16 @@ class TaskStepResponse(BaseModel):
     content: str
     tool_name: Optional[str] = None
     tool_result: Optional[str] = None
+    content_blob: Optional[str] = None  # content is a preview; see /tasks/blobs/{id}
+    content_size: Optional[int] = None
+
+
+class TaskBlobResponse(BaseModel):
+    """Response for GET /api/tasks/blobs/{id}"""
+
+    id: str
+    size: int
+    content: str
 
 
 class ToolUsageStatResponse(BaseModel):
@@ -211,6 +221,27 @@ class TaskStepsResponse(BaseModel):
     has_more: bool
 
 
+class TaskSearchHitResponse(BaseModel):
+    """Step matching a task search"""
+
+    task_id: str
+    step_id: int
+    step_type: str
+    timestamp: datetime
+    title: Optional[str] = None
+    status: str
+    project_path: str
+    snippet: str  # matched words wrapped in **
+    rank: float
+
+
+class TaskSearchResponse(BaseModel):
+    """Response for GET /api/tasks/search"""
+
+    hits: List[TaskSearchHitResponse]
+    query: str
+
+
 class ConsoleMessageResponse(BaseModel):
     """Response for console message item"""
 
@@ -86,9 +86,14 @@ def calculate_activity_overview() -> ActivityOverview:
             "completed_count": 0,
         }
 
-    # Get all sessions and filter by time
+    # Get recently active and still running sessions from the session index
     try:
-        all_sessions = list_sessions(limit=1000)
+        all_sessions = list_sessions(since=time_range_ago, limit=1000)
+        recent_ids = {s.session_id for s in all_sessions}
+        all_sessions += [
+            s for s in list_sessions(status=SessionStatus.RUNNING, limit=1000)
+            if s.session_id not in recent_ids
+        ]
     except Exception:
         all_sessions = []
 
@@ -202,7 +207,7 @@ async def get_dashboard():
     # Get resource counts using services
     from frago.server.services.recipe_service import RecipeService
     from frago.server.services.skill_service import SkillService
-    from frago.session.storage import list_sessions
+    from frago.session.storage import count_sessions
     from frago.recipes.installer import RecipeInstaller
 
     try:
@@ -222,8 +227,7 @@ async def get_dashboard():
         skill_count = 0
 
     try:
-        all_tasks = list_sessions(limit=1000)
-        task_count = len(all_tasks) if all_tasks else 0
+        task_count = count_sessions()
     except Exception:
         task_count = 0
 
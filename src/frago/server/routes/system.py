@@ -3,7 +3,9 @@
 Provides endpoints for server health checks and information.
 """
 
-from fastapi import APIRouter
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, HTTPException
 
 from frago.server.models import SystemStatusResponse, ServerInfoResponse
 from frago.server.services.system_service import SystemService
@@ -53,3 +55,45 @@ async def get_info() -> ServerInfoResponse:
         port=info.get("port", 8080),
         started_at=datetime.fromisoformat(info.get("started_at", datetime.now(timezone.utc).isoformat())),
     )
+
+
+@router.get("/cdp/stats")
+async def get_cdp_stats(top: Optional[int] = None) -> Dict[str, Any]:
+    """Get accumulated CDP stats.
+
+    Returns per-method latency percentiles, traffic and event counts
+    collected by sessions run with --cdp-stats.
+    """
+    from frago.cdp.metrics import load_stats
+
+    return load_stats().summary(top=top)
+
+
+@router.get("/chrome/gc")
+async def get_chrome_gc() -> Dict[str, Any]:
+    """Get the latest browser GC report.
+
+    Returns the tabs closed by the last background pass and Chrome
+    process memory at that time.
+    """
+    from frago.server.services.browser_gc_service import BrowserGCService
+
+    return BrowserGCService.get_instance().get_status()
+
+
+@router.post("/chrome/gc")
+async def run_chrome_gc(dry_run: bool = False, clear_overlays: bool = True) -> Dict[str, Any]:
+    """Run a browser GC pass now.
+
+    Closes expired and orphaned frago tabs, optionally clears frago
+    overlays from the open tabs frago tracks and reports Chrome process memory.
+    """
+    from frago.cdp.exceptions import CDPError
+    from frago.server.services.browser_gc_service import BrowserGCService
+
+    try:
+        return await BrowserGCService.get_instance().collect(
+            dry_run=dry_run, clear_overlays=clear_overlays
+        )
+    except CDPError as e:
+        raise HTTPException(status_code=503, detail=str(e))
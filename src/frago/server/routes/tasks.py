@@ -3,14 +3,18 @@
 Provides endpoints for listing and viewing tasks/sessions.
 """
 
+from datetime import datetime
 from typing import Optional
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Path, Query
 
 from frago.server.models import (
+    TaskBlobResponse,
     TaskItemResponse,
     TaskDetailResponse,
     TaskListResponse,
+    TaskSearchHitResponse,
+    TaskSearchResponse,
     TaskStepsResponse,
     TaskStepResponse,
     TaskSummaryResponse,
@@ -95,6 +99,63 @@ async def list_tasks(
     )
 
 
+@router.get("/tasks/search", response_model=TaskSearchResponse)
+async def search_tasks(
+    q: str = Query(..., min_length=1, description="Words that must all appear in a step"),
+    project: Optional[str] = Query(None, description="Filter by project path"),
+    status: Optional[str] = Query(
+        None, pattern="^(running|completed|error|cancelled)$", description="Filter by status"
+    ),
+    since: Optional[datetime] = Query(None, description="Only steps at or after this time"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum hits to return"),
+    offset: int = Query(0, ge=0, description="Number of hits to skip"),
+) -> TaskSearchResponse:
+    """Full-text search over task steps.
+
+    Args:
+        q: Search query
+        project: Filter by project path
+        status: Filter by status (running, completed, error, cancelled)
+        since: Only steps at or after this time
+        limit: Maximum number of hits to return
+        offset: Number of hits to skip for pagination
+
+    Returns:
+        Matching steps ranked best first, with snippets
+    """
+    hits = TaskService.search_tasks(
+        q, project_path=project, status=status, since=since, limit=limit, offset=offset
+    )
+    return TaskSearchResponse(
+        hits=[TaskSearchHitResponse(**hit) for hit in hits],
+        query=q,
+    )
+
+
+@router.get("/tasks/blobs/{blob_id}", response_model=TaskBlobResponse)
+async def get_task_blob(
+    blob_id: str = Path(..., pattern="^[0-9a-f]{64}$", description="Blob ID (sha256)"),
+) -> TaskBlobResponse:
+    """Get the full content of a step stored in the blob store.
+
+    Steps whose content_blob is set only carry a preview; the UI fetches
+    the full content here when it is expanded.
+
+    Args:
+        blob_id: Blob ID from a step's content_blob
+
+    Returns:
+        Blob content and size
+
+    Raises:
+        HTTPException: 404 if the blob does not exist
+    """
+    blob = TaskService.get_blob(blob_id)
+    if blob is None:
+        raise HTTPException(status_code=404, detail=f"Blob '{blob_id}' not found")
+    return TaskBlobResponse(**blob)
+
+
 @router.get("/tasks/{task_id}", response_model=TaskDetailResponse)
 async def get_task(task_id: str) -> TaskDetailResponse:
     """Get task details by ID.
@@ -131,6 +192,8 @@ async def get_task(task_id: str) -> TaskDetailResponse:
                 content=s.get("content", ""),
                 tool_name=s.get("tool_name"),
                 tool_result=s.get("tool_result"),
+                content_blob=s.get("content_blob"),
+                content_size=s.get("content_size"),
             )
         )
 
@@ -231,6 +294,8 @@ async def get_task_steps(
                 content=s.get("content", ""),
                 tool_name=s.get("tool_name"),
                 tool_result=s.get("tool_result"),
+                content_blob=s.get("content_blob"),
+                content_size=s.get("content_size"),
             )
         )
 
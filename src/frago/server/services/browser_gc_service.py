@@ -0,0 +1,145 @@
+"""Browser garbage collection service.
+
+Periodically closes tabs that frago recipes and agents left open in the
+shared Chrome instance (expired TTL or exited owner) and keeps the latest
+report, including Chrome process memory, for the API.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Collection interval in seconds
+BROWSER_GC_INTERVAL_SECONDS = 300
+
+
+class BrowserGCService:
+    """Service running BrowserGC passes in the background."""
+
+    _instance: Optional["BrowserGCService"] = None
+    _lock = threading.Lock()
+
+    def __init__(self) -> None:
+        """Initialize the service."""
+        self._task: Optional[asyncio.Task] = None
+        self._stop_event = asyncio.Event()
+        self._last_report: Optional[Dict[str, Any]] = None
+        self._last_error: Optional[str] = None
+
+    @classmethod
+    def get_instance(cls) -> "BrowserGCService":
+        """Get singleton instance.
+
+        Returns:
+            BrowserGCService instance
+        """
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    async def start(self) -> None:
+        """Start background collection task."""
+        if self._task is not None and not self._task.done():
+            logger.warning("Browser GC service already running")
+            return
+
+        self._stop_event.clear()
+        self._task = asyncio.create_task(self._gc_loop())
+        logger.info(f"Browser GC started (interval: {BROWSER_GC_INTERVAL_SECONDS}s)")
+
+    async def stop(self) -> None:
+        """Stop background collection task."""
+        if self._task is None or self._task.done():
+            return
+
+        self._stop_event.set()
+        self._task.cancel()
+
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+        self._task = None
+        logger.info("Browser GC stopped")
+
+    async def _gc_loop(self) -> None:
+        """Background collection loop."""
+        while not self._stop_event.is_set():
+            try:
+                # Overlays are left alone here: a running recipe may still be showing them
+                await self.collect(clear_overlays=False)
+            except Exception as e:
+                # Chrome not running is the common case, not worth a warning
+                logger.debug(f"Browser GC pass skipped: {e}")
+
+            try:
+                await asyncio.wait_for(
+                    self._stop_event.wait(),
+                    timeout=BROWSER_GC_INTERVAL_SECONDS,
+                )
+                break
+            except asyncio.TimeoutError:
+                continue
+
+    async def collect(self, dry_run: bool = False, clear_overlays: bool = True) -> Dict[str, Any]:
+        """Run one collection pass.
+
+        Args:
+            dry_run: Only report what would be closed
+            clear_overlays: Clear frago overlays from frago's open tabs
+
+        Returns:
+            GC report
+
+        Raises:
+            CDPError: Chrome is not reachable
+        """
+        loop = asyncio.get_event_loop()
+        try:
+            report = await loop.run_in_executor(
+                None, self._run_collect, dry_run, clear_overlays
+            )
+        except Exception as e:
+            self._last_error = str(e)
+            raise
+
+        self._last_error = None
+        if not dry_run:
+            self._last_report = report
+        if report["closed"]:
+            logger.info(f"Browser GC closed {len(report['closed'])} tabs")
+        return report
+
+    @staticmethod
+    def _run_collect(dry_run: bool, clear_overlays: bool) -> Dict[str, Any]:
+        from frago.cdp.config import CDPConfig
+        from frago.cdp.gc import BrowserGC
+
+        overrides: Dict[str, Any] = {}
+        if os.getenv("FRAGO_CDP_HOST"):
+            overrides["host"] = os.environ["FRAGO_CDP_HOST"]
+        if os.getenv("FRAGO_CDP_PORT"):
+            overrides["port"] = int(os.environ["FRAGO_CDP_PORT"])
+        return BrowserGC(CDPConfig(**overrides)).collect(
+            dry_run=dry_run, clear_overlays=clear_overlays
+        )
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get latest GC report.
+
+        Returns:
+            Dictionary with running flag, last report and last error
+        """
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "interval": BROWSER_GC_INTERVAL_SECONDS,
+            "last_report": self._last_report,
+            "last_error": self._last_error,
+        }
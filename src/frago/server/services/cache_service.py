@@ -148,7 +148,7 @@ class CacheService:
         try:
             from frago.server.utils import get_server_state
             from frago.session.models import SessionStatus
-            from frago.session.storage import list_sessions
+            from frago.session.storage import count_sessions, list_sessions
 
             # Get server state
             server_state = get_server_state()
@@ -177,9 +177,14 @@ class CacheService:
                     "completed_count": 0,
                 }
 
-            # Get sessions
+            # Get recently active and still running sessions from the session index
             try:
-                all_sessions = list_sessions(limit=1000)
+                all_sessions = list_sessions(since=time_range_ago, limit=1000)
+                recent_ids = {s.session_id for s in all_sessions}
+                all_sessions += [
+                    s for s in list_sessions(status=SessionStatus.RUNNING, limit=1000)
+                    if s.session_id not in recent_ids
+                ]
             except Exception:
                 all_sessions = []
 
@@ -239,7 +244,7 @@ class CacheService:
                     "stats": stats,
                 },
                 "resource_counts": {
-                    "tasks": len(all_sessions),
+                    "tasks": count_sessions(),
                     "recipes": (
                         (len(self._recipes_cache) if self._recipes_cache else 0)
                         + len([r for r in (self._community_recipes_cache or []) if r.get("installed")])
@@ -2,18 +2,66 @@
 
 Provides background session synchronization from Claude Code
 (~/.claude/projects/) to Frago session storage (~/.frago/sessions/).
+
+Session files are synced when a recursive filesystem observer on
+~/.claude/projects reports them changed (debounced per file). Running
+sessions are re-checked periodically so they can be marked completed once
+idle, and a slow full sweep reconciles anything the observer missed. If
+the observer cannot run, the service falls back to frequent full sweeps.
 """
 
 import asyncio
 import logging
 import threading
-from typing import Any, Dict, Optional
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+from watchdog.events import FileSystemEvent, FileSystemEventHandler
+from watchdog.observers import Observer
 
 logger = logging.getLogger(__name__)
 
-# Sync interval in seconds (same as deprecated GUI for fast session discovery)
+# Full sweep interval in seconds when the filesystem observer is running
+RECONCILE_INTERVAL_SECONDS = 300
+
+# Full sweep interval in seconds without an observer (same as deprecated GUI)
 SYNC_INTERVAL_SECONDS = 5
 
+# Quiet time after the last change before a file is synced
+DEBOUNCE_SECONDS = 0.5
+
+# Longest a continuously written file waits to be synced
+MAX_DEBOUNCE_SECONDS = 2.0
+
+# Interval for re-checking running sessions (they complete by inactivity)
+ACTIVE_CHECK_INTERVAL_SECONDS = 15
+
+# Sweeps over at least this many files log their progress
+SWEEP_PROGRESS_MIN_FILES = 1000
+
+
+class _SessionFileHandler(FileSystemEventHandler):
+    """Reports created, modified and moved-in session files."""
+
+    def __init__(self, on_change: Callable[[str], None]) -> None:
+        super().__init__()
+        self._on_change = on_change
+
+    def on_created(self, event: FileSystemEvent) -> None:
+        self._report(event, event.src_path)
+
+    def on_modified(self, event: FileSystemEvent) -> None:
+        self._report(event, event.src_path)
+
+    def on_moved(self, event: FileSystemEvent) -> None:
+        self._report(event, event.dest_path)
+
+    def _report(self, event: FileSystemEvent, path: Any) -> None:
+        path = str(path)
+        if not event.is_directory and path.endswith(".jsonl"):
+            self._on_change(path)
+
 
 class SyncService:
     """Background session sync service."""
@@ -25,8 +73,15 @@ class SyncService:
         """Initialize the sync service."""
         self._task: Optional[asyncio.Task] = None
         self._stop_event = asyncio.Event()
+        self._wake_event = asyncio.Event()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._observer: Optional[Observer] = None
+        # path -> (first change, last change), monotonic seconds
+        self._pending: Dict[str, Tuple[float, float]] = {}
+        self._pending_lock = threading.Lock()
         self._last_result: Optional[Dict[str, Any]] = None
         self._cache_service: Optional[Any] = None
+        self._first_sweep = True
 
     def set_cache_service(self, cache_service: Any) -> None:
         """Set the cache service for triggering refreshes.
@@ -55,9 +110,10 @@ class SyncService:
             logger.warning("Sync service already running")
             return
 
+        self._loop = asyncio.get_running_loop()
         self._stop_event.clear()
         self._task = asyncio.create_task(self._sync_loop())
-        logger.info(f"Session sync started (interval: {SYNC_INTERVAL_SECONDS}s)")
+        logger.info("Session sync started")
 
     async def stop(self) -> None:
         """Stop background sync task."""
@@ -65,6 +121,7 @@ class SyncService:
             return
 
         self._stop_event.set()
+        self._wake_event.set()
         self._task.cancel()
 
         try:
@@ -73,49 +130,148 @@ class SyncService:
             pass
 
         self._task = None
+        self._stop_observer()
         logger.info("Session sync stopped")
 
-    async def _sync_loop(self) -> None:
-        """Background sync loop."""
-        while not self._stop_event.is_set():
-            try:
-                # Run sync in thread pool to avoid blocking
-                result = await asyncio.get_event_loop().run_in_executor(
-                    None, self._do_sync
-                )
-                self._last_result = result
+    # ============================================================
+    # Filesystem Observer
+    # ============================================================
+
+    def _start_observer(self) -> bool:
+        """Start watching ~/.claude/projects if it is not watched yet.
+
+        Returns:
+            Whether the observer is running
+        """
+        if self._observer is not None and self._observer.is_alive():
+            return True
+
+        from frago.session.sync import CLAUDE_PROJECTS_DIR
+
+        if not CLAUDE_PROJECTS_DIR.exists():
+            # Created on first use of Claude Code, retried on each sweep
+            return False
 
-                # Check if there are changes
-                has_changes = result.get("synced", 0) > 0 or result.get("updated", 0) > 0
+        observer = Observer()
+        try:
+            observer.schedule(
+                _SessionFileHandler(self._on_file_changed),
+                str(CLAUDE_PROJECTS_DIR),
+                recursive=True,
+            )
+            observer.start()
+        except Exception as e:
+            # e.g. inotify watch limit reached
+            logger.warning(f"Cannot watch {CLAUDE_PROJECTS_DIR}, falling back to polling: {e}")
+            return False
+
+        self._observer = observer
+        logger.info(
+            f"Watching {CLAUDE_PROJECTS_DIR} (reconcile every {RECONCILE_INTERVAL_SECONDS}s)"
+        )
+        return True
+
+    def _stop_observer(self) -> None:
+        if self._observer is None:
+            return
+        self._observer.stop()
+        self._observer.join(timeout=2)
+        self._observer = None
+
+    def _on_file_changed(self, path: str) -> None:
+        """Record a changed file (called from the observer thread)."""
+        now = time.monotonic()
+        with self._pending_lock:
+            first, _ = self._pending.get(path, (now, now))
+            self._pending[path] = (first, now)
 
-                if has_changes:
-                    logger.info(
-                        f"Session sync: synced={result.get('synced', 0)}, "
-                        f"updated={result.get('updated', 0)}"
-                    )
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._wake_event.set)
 
-                    # Refresh cache and broadcast updates
-                    if self._cache_service is not None:
-                        try:
-                            await self._cache_service.refresh_tasks(broadcast=True)
-                        except Exception as e:
-                            logger.warning(f"Failed to refresh cache: {e}")
+    def _take_due_files(self, now: float) -> Tuple[Set[str], Optional[float]]:
+        """Pop files whose debounce has elapsed.
 
-            except Exception as e:
-                logger.warning(f"Session sync failed: {e}")
+        Returns:
+            (due paths, monotonic time the next pending file becomes due)
+        """
+        due: Set[str] = set()
+        next_due: Optional[float] = None
+        with self._pending_lock:
+            for path, (first, last) in list(self._pending.items()):
+                deadline = min(last + DEBOUNCE_SECONDS, first + MAX_DEBOUNCE_SECONDS)
+                if deadline <= now:
+                    due.add(path)
+                    del self._pending[path]
+                elif next_due is None or deadline < next_due:
+                    next_due = deadline
+        return due, next_due
+
+    # ============================================================
+    # Sync Loop
+    # ============================================================
 
-            # Wait for next sync interval or stop event
+    async def _sync_loop(self) -> None:
+        """Background sync loop."""
+        next_sweep = time.monotonic()
+        next_active_check = next_sweep + ACTIVE_CHECK_INTERVAL_SECONDS
+
+        while not self._stop_event.is_set():
+            # Changes reported from here on wake the wait below
+            self._wake_event.clear()
+
+            if time.monotonic() >= next_sweep:
+                watching = self._start_observer()
+                await self._run_sync(self._do_sync)
+                interval = RECONCILE_INTERVAL_SECONDS if watching else SYNC_INTERVAL_SECONDS
+                next_sweep = time.monotonic() + interval
+                # The sweep covered running sessions too
+                next_active_check = time.monotonic() + ACTIVE_CHECK_INTERVAL_SECONDS
+
+            due, next_due = self._take_due_files(time.monotonic())
+            if time.monotonic() >= next_active_check:
+                due |= await asyncio.get_event_loop().run_in_executor(
+                    None, self._running_session_files
+                )
+                next_active_check = time.monotonic() + ACTIVE_CHECK_INTERVAL_SECONDS
+            if due:
+                await self._run_sync(self._sync_files, due)
+
+            # Sleep until the next deadline, a file change or stop
+            wake_at = min(t for t in (next_sweep, next_active_check, next_due) if t is not None)
             try:
                 await asyncio.wait_for(
-                    self._stop_event.wait(),
-                    timeout=SYNC_INTERVAL_SECONDS,
+                    self._wake_event.wait(),
+                    timeout=max(0.0, wake_at - time.monotonic()),
                 )
-                # If wait completes without timeout, stop was requested
-                break
             except asyncio.TimeoutError:
-                # Timeout means continue to next sync
                 continue
 
+    async def _run_sync(self, func: Callable[..., Dict[str, Any]], *args: Any) -> None:
+        """Run a sync function in the thread pool and publish its changes."""
+        try:
+            # Run sync in thread pool to avoid blocking
+            result = await asyncio.get_event_loop().run_in_executor(None, func, *args)
+            self._last_result = result
+
+            # Check if there are changes
+            has_changes = result.get("synced", 0) > 0 or result.get("updated", 0) > 0
+
+            if has_changes:
+                logger.info(
+                    f"Session sync: synced={result.get('synced', 0)}, "
+                    f"updated={result.get('updated', 0)}"
+                )
+
+                # Refresh cache and broadcast updates
+                if self._cache_service is not None:
+                    try:
+                        await self._cache_service.refresh_tasks(broadcast=True)
+                    except Exception as e:
+                        logger.warning(f"Failed to refresh cache: {e}")
+
+        except Exception as e:
+            logger.warning(f"Session sync failed: {e}")
+
     def _do_sync(self) -> Dict[str, Any]:
         """Perform synchronization (runs in thread pool).
 
@@ -124,7 +280,39 @@ class SyncService:
         """
         from frago.session.sync import sync_all_projects
 
-        result = sync_all_projects()
+        # Only the first sweep (the initial import) uses worker processes;
+        # later sweeps mostly skip unchanged files and stay in-process
+        workers = None if self._first_sweep else 1
+        result = sync_all_projects(workers=workers, progress=self._log_progress)
+        self._first_sweep = False
+
+        return {
+            "synced": result.synced,
+            "updated": result.updated,
+            "skipped": result.skipped,
+            "errors": result.errors,
+        }
+
+    @staticmethod
+    def _log_progress(done: int, total: int) -> None:
+        """Log progress of large sweeps (e.g. the first import) every 10%."""
+        step = max(total // 10, 1)
+        if total >= SWEEP_PROGRESS_MIN_FILES and (done % step == 0 or done == total):
+            logger.info(f"Session sync progress: {done}/{total} files")
+
+    @staticmethod
+    def _sync_files(paths: Set[str]) -> Dict[str, Any]:
+        """Sync changed session files (runs in thread pool).
+
+        Args:
+            paths: Session file paths
+
+        Returns:
+            Sync result dictionary
+        """
+        from frago.session.sync import sync_files
+
+        result = sync_files(Path(p) for p in paths)
 
         return {
             "synced": result.synced,
@@ -133,6 +321,17 @@ class SyncService:
             "errors": result.errors,
         }
 
+    @staticmethod
+    def _running_session_files() -> Set[str]:
+        """Source files of sessions still marked running (runs in thread pool)."""
+        from frago.session.models import AgentType, SessionStatus
+        from frago.session.storage import list_sessions
+
+        sessions = list_sessions(
+            agent_type=AgentType.CLAUDE, status=SessionStatus.RUNNING, limit=1000
+        )
+        return {s.source_file for s in sessions if s.source_file}
+
     def get_last_result(self) -> Optional[Dict[str, Any]]:
         """Get the last sync result.
 
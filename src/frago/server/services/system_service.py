@@ -28,15 +28,13 @@ class SystemService:
         """
         try:
             from frago.session.models import AgentType, SessionStatus
-            from frago.session.storage import list_sessions
+            from frago.session.storage import count_sessions
 
             # Count running tasks
-            running_sessions = list_sessions(
+            tasks_running = count_sessions(
                 agent_type=AgentType.CLAUDE,
                 status=SessionStatus.RUNNING,
-                limit=100,
             )
-            tasks_running = len(running_sessions)
 
             # Check Chrome status via CDP
             chrome_available = False
@@ -60,36 +60,48 @@ class TaskService:
 
             tasks = []
 
-            # Request more sessions to compensate for filtering losses
-            sessions = list_sessions(
-                agent_type=AgentType.CLAUDE,
-                limit=(limit + offset) * 3,
-                status=status_filter,
-            )
-
             # Track sessions that need title generation
             sessions_needing_titles = []
 
-            for session in sessions:
-                try:
-                    # Skip excluded sessions (e.g., title generation sessions)
-                    if title_manager.is_excluded_session(session.session_id):
-                        continue
+            # Page through the session index (newest first) until enough
+            # displayable sessions are found; display filtering needs the
+            # steps file, so it cannot be pushed into the index query
+            wanted = offset + limit
+            batch_size = max(wanted * 2, 50)
+            cursor = 0
+            while len(tasks) < wanted:
+                sessions = list_sessions(
+                    agent_type=AgentType.CLAUDE,
+                    limit=batch_size,
+                    offset=cursor,
+                    status=status_filter,
+                    order_by="started_at",
+                )
+                cursor += len(sessions)
 
-                    # Filter out sessions that shouldn't be displayed
-                    if not TaskService._should_display(session):
-                        continue
+                for session in sessions:
+                    try:
+                        # Skip excluded sessions (e.g., title generation sessions)
+                        if title_manager.is_excluded_session(session.session_id):
+                            continue
+
+                        # Filter out sessions that shouldn't be displayed
+                        if not TaskService._should_display(session):
+                            continue
 
-                    # Collect sessions needing titles (don't generate yet)
-                    if generate_titles and not title_manager.has_title(session.session_id):
-                        sessions_needing_titles.append(session)
+                        # Collect sessions needing titles (don't generate yet)
+                        if generate_titles and not title_manager.has_title(session.session_id):
+                            sessions_needing_titles.append(session)
 
-                    task = TaskService._session_to_task(session, title_manager)
-                    if task:
-                        tasks.append(task)
-                except Exception as e:
-                    logger.debug("Failed to convert session: %s", e)
-                    continue
+                        task = TaskService._session_to_task(session, title_manager)
+                        if task:
+                            tasks.append(task)
+                    except Exception as e:
+                        logger.debug("Failed to convert session: %s", e)
+                        continue
+
+                if len(sessions) < batch_size:
+                    break
 
             # Start background thread for title generation (non-blocking)
             if sessions_needing_titles:
@@ -97,12 +109,6 @@ class TaskService:
                     sessions_needing_titles, title_manager
                 )
 
-            # Sort by started_at descending
-            tasks.sort(
-                key=lambda t: t.get("started_at") or "",
-                reverse=True,
-            )
-
             # Apply offset and limit
             paginated_tasks = tasks[offset:offset + limit]
 
@@ -230,9 +236,8 @@ class TaskService:
         Returns:
             Whether session should be displayed.
         """
-        import json
-        from frago.session.models import SessionStatus
-        from frago.session.storage import get_session_dir
+        from frago.session.models import SessionStatus, StepType
+        from frago.session.storage import iter_steps
 
         status = getattr(session, "status", None)
         step_count = getattr(session, "step_count", 0)
@@ -251,25 +256,17 @@ class TaskService:
 
         # Check for assistant messages if step_count < 10
         if step_count < 10:
-            session_dir = get_session_dir(session.session_id, session.agent_type)
-            steps_file = session_dir / "steps.jsonl"
-            if steps_file.exists():
-                has_assistant = False
-                try:
-                    with open(steps_file, "r", encoding="utf-8") as f:
-                        for line in f:
-                            if not line.strip():
-                                continue
-                            step = json.loads(line)
-                            if step.get("type") == "assistant_message":
-                                has_assistant = True
-                                break
-                except Exception:
-                    pass
-
-                # No assistant messages → system session, don't display
-                if not has_assistant:
-                    return False
+            stats = getattr(session, "stats", None)
+            if stats is not None:
+                has_assistant = stats.count(StepType.ASSISTANT_MESSAGE) > 0
+            else:
+                has_assistant = any(
+                    step.type == StepType.ASSISTANT_MESSAGE
+                    for step in iter_steps(session.session_id, session.agent_type)
+                )
+            # No assistant messages → system session, don't display
+            if not has_assistant:
+                return False
 
         # Display if step count >= 5
         if step_count >= 5:
@@ -411,6 +408,29 @@ class TaskService:
             "tool_name": getattr(step, "tool_name", None),
             "tool_call_id": getattr(step, "tool_call_id", None),
             "tool_result": getattr(step, "tool_result", None),
+            "content_blob": getattr(step, "content_blob", None),
+            "content_size": getattr(step, "content_size", None),
+        }
+
+    @staticmethod
+    def get_blob(blob_id: str) -> Optional[Dict[str, Any]]:
+        """Get a step content stored in the blob store.
+
+        Args:
+            blob_id: Blob ID (sha256 hex).
+
+        Returns:
+            Dictionary with 'id', 'size' and 'content', or None if not found.
+        """
+        from frago.session.blobs import get_blob
+
+        data = get_blob(blob_id)
+        if data is None:
+            return None
+        return {
+            "id": blob_id,
+            "size": len(data),
+            "content": data.decode("utf-8", errors="replace"),
         }
 
     @staticmethod
@@ -457,3 +477,59 @@ class TaskService:
         except Exception as e:
             logger.error("Failed to get steps for task %s: %s", session_id, e)
             return {"steps": [], "total": 0, "has_more": False}
+
+    @staticmethod
+    def search_tasks(
+        query: str,
+        project_path: Optional[str] = None,
+        status: Optional[str] = None,
+        since: Optional[datetime] = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> List[Dict[str, Any]]:
+        """Full-text search over task steps.
+
+        Args:
+            query: Words that must all appear in a step.
+            project_path: Filter by project path.
+            status: Filter by task status.
+            since: Only steps at or after this time.
+            limit: Maximum hits to return (1-100).
+            offset: Number of hits to skip.
+
+        Returns:
+            Hits ranked best first, with snippets marking matches in **.
+        """
+        try:
+            from frago.session.models import AgentType, SessionStatus
+            from frago.session.storage import search_steps
+
+            hits = search_steps(
+                query,
+                agent_type=AgentType.CLAUDE,
+                status=SessionStatus(status) if status else None,
+                project_path=project_path,
+                since=since,
+                limit=max(1, min(100, limit)),
+                offset=max(0, offset),
+                marks=("**", "**"),
+            )
+
+            return [
+                {
+                    "task_id": hit.session_id,
+                    "step_id": hit.step_id,
+                    "step_type": hit.step_type.value,
+                    "timestamp": hit.timestamp.isoformat(),
+                    "title": hit.session_name,
+                    "status": hit.status.value,
+                    "project_path": hit.project_path,
+                    "snippet": hit.snippet,
+                    "rank": hit.rank,
+                }
+                for hit in hits
+            ]
+
+        except Exception as e:
+            logger.error("Failed to search tasks for %r: %s", query, e)
+            return []
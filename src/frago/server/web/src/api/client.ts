@@ -86,6 +86,14 @@ export interface TaskStep {
   content: string;
   tool_name: string | null;
   tool_result: string | null;
+  content_blob?: string | null;
+  content_size?: number | null;
+}
+
+export interface TaskBlob {
+  id: string;
+  size: number;
+  content: string;
 }
 
 export interface ToolUsageStat {
@@ -215,6 +223,10 @@ export async function getTaskSteps(
   );
 }
 
+export async function getTaskBlob(blobId: string): Promise<TaskBlob> {
+  return fetchApi<TaskBlob>(`/tasks/blobs/${encodeURIComponent(blobId)}`);
+}
+
 // ============================================================
 // Agent API
 // ============================================================
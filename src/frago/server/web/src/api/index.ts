@@ -146,6 +146,8 @@ export async function getTaskDetail(
       content: s.content,
       tool_name: s.tool_name,
       tool_status: null,
+      content_blob: s.content_blob,
+      content_size: s.content_size,
     })),
     steps_total: task.steps_total ?? task.steps.length,
     steps_offset: task.steps_offset ?? 0,
@@ -183,6 +185,8 @@ export async function getTaskSteps(
       content: s.content,
       tool_name: s.tool_name,
       tool_status: null,
+      content_blob: s.content_blob,
+      content_size: s.content_size,
     })),
     total: response.total,
     offset: offset ?? 0,
@@ -190,6 +194,18 @@ export async function getTaskSteps(
   };
 }
 
+/**
+ * Full content of a step whose content was moved to the blob store
+ * (step.content_blob set, step.content holds a preview).
+ */
+export async function getTaskBlobContent(blobId: string): Promise<string> {
+  if (isPywebviewMode()) {
+    throw new Error('Blob API not available in pywebview mode');
+  }
+  const blob = await httpApi.getTaskBlob(blobId);
+  return blob.content;
+}
+
 export async function startAgentTask(
   prompt: string
 ): Promise<TaskStartResponse> {
@@ -1,4 +1,6 @@
+import { useState } from 'react';
 import type { TaskStep } from '@/types/pywebview';
+import { getTaskBlobContent } from '@/api';
 import MarkdownContent from '@/components/ui/MarkdownContent';
 import PreformattedContent from './PreformattedContent';
 import CollapsibleContent from './CollapsibleContent';
@@ -11,11 +13,53 @@ interface StepContentProps {
 }
 
 /**
- * Dispatcher component for rendering step content.
- * Chooses the appropriate renderer based on step type and content.
+ * Renders step content. Large contents arrive as a preview with a blob
+ * reference; the full content is fetched when the user asks for it.
  */
 export default function StepContent({ step }: StepContentProps) {
-  const { type, content, tool_name } = step;
+  const [fullContent, setFullContent] = useState<string | null>(null);
+  const [loading, setLoading] = useState(false);
+  const [error, setError] = useState<string | null>(null);
+
+  const body = renderContent(step, fullContent ?? step.content);
+  if (!step.content_blob || fullContent !== null) {
+    return body;
+  }
+
+  const loadFullContent = async () => {
+    setLoading(true);
+    setError(null);
+    try {
+      setFullContent(await getTaskBlobContent(step.content_blob!));
+    } catch (e) {
+      setError(e instanceof Error ? e.message : String(e));
+    } finally {
+      setLoading(false);
+    }
+  };
+
+  return (
+    <>
+      {body}
+      <button
+        type="button"
+        className="collapsible-toggle"
+        onClick={loadFullContent}
+        disabled={loading}
+      >
+        {loading ? 'Loading...' : `Load full content (${formatSize(step.content_size ?? 0)})`}
+      </button>
+      {error && <div className="text-scaled-xs text-[var(--accent-error)]">{error}</div>}
+    </>
+  );
+}
+
+/**
+ * Dispatcher for rendering step content.
+ * Chooses the appropriate renderer based on step type and content.
+ */
+function renderContent(step: TaskStep, content: string) {
+  const { type, tool_name } = step;
 
   // Assistant messages use Markdown rendering
   if (type === 'assistant_message') {
@@ -64,6 +108,12 @@ export default function StepContent({ step }: StepContentProps) {
   );
 }
 
+function formatSize(bytes: number): string {
+  if (bytes < 1024) return `${bytes} B`;
+  if (bytes < 1024 * 1024) return `${(bytes / 1024).toFixed(1)} KB`;
+  return `${(bytes / (1024 * 1024)).toFixed(1)} MB`;
+}
+
 /**
  * Heuristic to detect if content looks like JSON.
  */
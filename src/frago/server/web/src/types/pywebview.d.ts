@@ -58,6 +58,9 @@ export interface TaskStep {
   tool_name: string | null;
   tool_status: string | null;
   tool_call_id?: string;
+  /** Set when content is only a preview; the full content is fetched with getTaskBlob */
+  content_blob?: string | null;
+  content_size?: number | null;
 }
 
 export interface ToolUsageStat {
@@ -5,7 +5,8 @@ Provides real-time monitoring and data storage capabilities for Agent tool execu
 such as Claude Code.
 
 Core components:
-- models: Session data models (MonitoredSession, SessionStep, ToolCallRecord, SessionSummary)
+- models: Session data models (MonitoredSession, SessionStep, ToolCallRecord, SessionSummary,
+  SessionStats)
 - parser: JSONL incremental parser
 - storage: Session data persistent storage
 - formatter: Terminal output formatter
@@ -20,6 +21,7 @@ Environment variables:
 from frago.session.models import (
     AgentType,
     MonitoredSession,
+    SessionStats,
     SessionStatus,
     SessionStep,
     SessionSummary,
@@ -39,4 +41,5 @@ __all__ = [
     "SessionStep",
     "ToolCallRecord",
     "SessionSummary",
+    "SessionStats",
 ]
@@ -0,0 +1,196 @@
+"""
+Content-Addressed Blob Store
+
+Step contents larger than BLOB_THRESHOLD bytes (big file reads, diffs,
+base64 screenshots) are stored once under ~/.frago/blobs/<ab>/<sha256>
+and replaced in steps.jsonl by a preview plus the blob's hash and size
+(SessionStep.content_blob / content_size). Identical payloads, such as
+the same file read in many sessions, share one blob. Readers that need
+the full text call load_step_content or fetch the blob by hash.
+
+Blobs are not reference counted: after sessions are deleted,
+sweep_blobs removes the ones no remaining step refers to.
+"""
+
+import hashlib
+import logging
+import os
+import re
+import time
+from pathlib import Path
+from typing import Optional, Set, Tuple
+
+from frago.session.models import SessionStep
+
+logger = logging.getLogger(__name__)
+
+# Default blob directory
+DEFAULT_BLOB_DIR = Path.home() / ".frago" / "blobs"
+
+# Contents larger than this (UTF-8 bytes) are moved into the blob store
+BLOB_THRESHOLD = 16 * 1024
+
+# Characters of an externalized content kept inline as its preview
+PREVIEW_CHARS = 1000
+
+# Blobs touched more recently are never swept: their step may not be written yet
+BLOB_SWEEP_GRACE_SECONDS = 3600
+
+_BLOB_ID = re.compile(r"^[0-9a-f]{64}$")
+
+
+def get_blob_dir() -> Path:
+    """Get blob store directory
+
+    Supports customization via environment variable FRAGO_BLOB_DIR.
+
+    Returns:
+        Blob store directory path
+    """
+    custom_dir = os.environ.get("FRAGO_BLOB_DIR")
+    if custom_dir:
+        return Path(custom_dir).expanduser()
+    return DEFAULT_BLOB_DIR
+
+
+def is_blob_id(blob_id: str) -> bool:
+    """Whether a string is a well-formed blob ID (lowercase sha256 hex)"""
+    return bool(_BLOB_ID.match(blob_id))
+
+
+def blob_path(blob_id: str) -> Path:
+    """Path of a blob
+
+    Raises:
+        ValueError: Malformed blob ID
+    """
+    if not is_blob_id(blob_id):
+        raise ValueError(f"Invalid blob ID: {blob_id}")
+    return get_blob_dir() / blob_id[:2] / blob_id
+
+
+def put_blob(data: bytes) -> str:
+    """Store data, reusing an existing blob with the same content
+
+    Args:
+        data: Blob content
+
+    Returns:
+        Blob ID (sha256 hex of the content)
+    """
+    blob_id = hashlib.sha256(data).hexdigest()
+    path = blob_path(blob_id)
+    if path.exists():
+        try:
+            # Reused: keep it out of a sweep that started before this step is written
+            os.utime(path)
+            return blob_id
+        except FileNotFoundError:
+            pass
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f"{blob_id}.{os.getpid()}.tmp")
+    try:
+        temp_path.write_bytes(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    return blob_id
+
+
+def get_blob(blob_id: str) -> Optional[bytes]:
+    """Read a blob
+
+    Args:
+        blob_id: Blob ID
+
+    Returns:
+        Blob content, None if the ID is malformed or the blob is missing
+    """
+    try:
+        return blob_path(blob_id).read_bytes()
+    except (ValueError, FileNotFoundError):
+        return None
+
+
+def sweep_blobs(referenced: Set[str]) -> Tuple[int, int]:
+    """Remove blobs no step refers to
+
+    Blobs modified within BLOB_SWEEP_GRACE_SECONDS are kept, so a blob
+    stored or reused while the references were being collected survives.
+
+    Args:
+        referenced: IDs of the blobs still referenced by steps
+
+    Returns:
+        (blobs removed, bytes reclaimed)
+    """
+    blob_dir = get_blob_dir()
+    if not blob_dir.exists():
+        return 0, 0
+
+    cutoff = time.time() - BLOB_SWEEP_GRACE_SECONDS
+    removed = reclaimed = 0
+    for path in blob_dir.glob("??/*"):
+        if not is_blob_id(path.name) or path.name in referenced:
+            continue
+        try:
+            stat = path.stat()
+            if stat.st_mtime > cutoff:
+                continue
+            path.unlink()
+        except OSError as e:
+            logger.warning(f"Failed to remove blob {path.name}: {e}")
+            continue
+        removed += 1
+        reclaimed += stat.st_size
+
+    logger.debug(f"Swept {removed} unreferenced blobs ({reclaimed} bytes)")
+    return removed, reclaimed
+
+
+def externalize_step(step: SessionStep) -> SessionStep:
+    """Move a large step content into the blob store
+
+    Args:
+        step: Step about to be written
+
+    Returns:
+        The step itself if its content is small, otherwise a copy holding
+        a preview and the blob reference
+    """
+    content = step.content_summary
+    if step.content_blob or len(content) <= BLOB_THRESHOLD // 4:
+        return step
+    data = content.encode("utf-8")
+    if len(data) <= BLOB_THRESHOLD:
+        return step
+
+    try:
+        blob_id = put_blob(data)
+    except OSError as e:
+        logger.warning(f"Failed to store content of step {step.step_id} as blob: {e}")
+        return step
+
+    return step.model_copy(
+        update={
+            "content_summary": content[:PREVIEW_CHARS],
+            "content_blob": blob_id,
+            "content_size": len(data),
+        }
+    )
+
+
+def load_step_content(step: SessionStep) -> str:
+    """Full content of a step, reading its blob if it was externalized
+
+    Falls back to the preview if the blob is missing.
+    """
+    if not step.content_blob:
+        return step.content_summary
+    data = get_blob(step.content_blob)
+    if data is None:
+        logger.warning(f"Missing blob {step.content_blob} of step {step.step_id}")
+        return step.content_summary
+    return data.decode("utf-8", errors="replace")
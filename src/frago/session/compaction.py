@@ -0,0 +1,206 @@
+"""
+Compacted Step Storage
+
+Sessions that have been idle for a while can have their steps.jsonl
+compacted into steps.jsonl.gz: a series of independent gzip members of
+COMPACT_BLOCK_STEPS steps each (so the file is still a regular gzip file
+that zcat can read) plus steps.gz.idx, which records the step count, the
+block size and the byte offset where each member ends. Paged reads
+decompress only the blocks holding the requested steps.
+
+steps.jsonl always wins when both files exist, so an interrupted
+compaction or expansion never loses steps.
+"""
+
+import gzip
+import logging
+import os
+import struct
+from pathlib import Path
+from typing import Iterator, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+COMPACTED_FILENAME = "steps.jsonl.gz"
+COMPACTED_INDEX_FILENAME = "steps.gz.idx"
+
+# Steps per gzip member: a paged read decompresses at most a few blocks
+COMPACT_BLOCK_STEPS = 256
+
+# gzip compression level (6 is gzip's default speed/size trade-off)
+COMPACT_LEVEL = 6
+
+# steps.gz.idx: step count and steps per block, then one end offset per block
+_HEADER = struct.Struct("<QQ")
+_OFFSET = struct.Struct("<Q")
+
+
+def compacted_path(steps_path: Path) -> Path:
+    """Compacted counterpart of a steps.jsonl path"""
+    return steps_path.with_name(COMPACTED_FILENAME)
+
+
+def _index_path(steps_path: Path) -> Path:
+    return steps_path.with_name(COMPACTED_INDEX_FILENAME)
+
+
+def is_compacted(steps_path: Path) -> bool:
+    """Whether a session's steps are only stored in compacted form"""
+    return not steps_path.exists() and compacted_path(steps_path).exists()
+
+
+def compact_steps_file(steps_path: Path) -> Tuple[int, int]:
+    """Compact a steps.jsonl file and remove it
+
+    Args:
+        steps_path: steps.jsonl file path
+
+    Returns:
+        (bytes before, bytes after), the latter counting steps.gz.idx
+
+    Raises:
+        OSError: steps.jsonl was appended to or replaced while compacting
+            (it is left in place and the compacted form removed)
+    """
+    gz_path = compacted_path(steps_path)
+    index_path = _index_path(steps_path)
+    gz_temp = gz_path.with_name(f"{COMPACTED_FILENAME}.{os.getpid()}.tmp")
+    index_temp = index_path.with_name(f"{COMPACTED_INDEX_FILENAME}.{os.getpid()}.tmp")
+
+    stat = steps_path.stat()
+    before = stat.st_size
+
+    count = 0
+    ends: List[int] = []
+    try:
+        with open(steps_path, "rb") as src, open(gz_temp, "wb") as dst:
+            block: List[bytes] = []
+            for line in src:
+                if not line.strip():
+                    continue
+                block.append(line if line.endswith(b"\n") else line + b"\n")
+                if len(block) == COMPACT_BLOCK_STEPS:
+                    dst.write(gzip.compress(b"".join(block), COMPACT_LEVEL, mtime=0))
+                    ends.append(dst.tell())
+                    count += len(block)
+                    block = []
+            if block:
+                dst.write(gzip.compress(b"".join(block), COMPACT_LEVEL, mtime=0))
+                ends.append(dst.tell())
+                count += len(block)
+
+        with open(index_temp, "wb") as f:
+            f.write(_HEADER.pack(count, COMPACT_BLOCK_STEPS))
+            f.write(struct.pack(f"<{len(ends)}Q", *ends))
+
+        os.replace(index_temp, index_path)
+        os.replace(gz_temp, gz_path)
+    except BaseException:
+        gz_temp.unlink(missing_ok=True)
+        index_temp.unlink(missing_ok=True)
+        raise
+
+    current = steps_path.stat()
+    if (current.st_size, current.st_ino) != (stat.st_size, stat.st_ino):
+        remove_compacted(steps_path)
+        raise OSError(f"Steps changed during compaction: {steps_path}")
+    steps_path.unlink()
+
+    after = gz_path.stat().st_size + index_path.stat().st_size
+    logger.debug(f"Compacted {count} steps ({before} -> {after} bytes): {gz_path}")
+    return before, after
+
+
+def expand_steps_file(steps_path: Path) -> None:
+    """Restore steps.jsonl from its compacted form (before appending to it)
+
+    Args:
+        steps_path: steps.jsonl file path
+    """
+    gz_path = compacted_path(steps_path)
+    temp_path = steps_path.with_name(f"steps.jsonl.{os.getpid()}.tmp")
+    try:
+        with gzip.open(gz_path, "rb") as src, open(temp_path, "wb") as dst:
+            while True:
+                chunk = src.read(1 << 20)
+                if not chunk:
+                    break
+                dst.write(chunk)
+        os.replace(temp_path, steps_path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+    remove_compacted(steps_path)
+    logger.debug(f"Expanded compacted steps: {steps_path}")
+
+
+def remove_compacted(steps_path: Path) -> None:
+    """Remove the compacted form of a session's steps"""
+    compacted_path(steps_path).unlink(missing_ok=True)
+    _index_path(steps_path).unlink(missing_ok=True)
+
+
+def count_compacted_steps(steps_path: Path) -> int:
+    """Number of steps in a compacted steps file"""
+    with open(_index_path(steps_path), "rb") as f:
+        return _HEADER.unpack(f.read(_HEADER.size))[0]
+
+
+def iter_compacted_lines(steps_path: Path) -> Iterator[bytes]:
+    """Stream the step lines of a compacted steps file"""
+    with gzip.open(compacted_path(steps_path), "rb") as f:
+        for line in f:
+            yield line
+
+
+def iter_step_lines(steps_path: Path) -> Iterator[bytes]:
+    """Stream the step lines of a session, plain or compacted (none if neither exists)"""
+    if is_compacted(steps_path):
+        yield from iter_compacted_lines(steps_path)
+        return
+    try:
+        f = open(steps_path, "rb")
+    except FileNotFoundError:
+        return
+    with f:
+        yield from f
+
+
+def read_compacted_lines(steps_path: Path, start: int, end: int) -> List[bytes]:
+    """Read step lines [start, end) of a compacted steps file
+
+    Only the gzip members holding the requested steps are decompressed.
+
+    Args:
+        steps_path: steps.jsonl file path
+        start: First step index (0-based)
+        end: Step index after the last one
+
+    Returns:
+        Encoded step lines
+    """
+    if start >= end:
+        return []
+
+    with open(_index_path(steps_path), "rb") as f:
+        count, block_steps = _HEADER.unpack(f.read(_HEADER.size))
+        end = min(end, count)
+        if start >= end:
+            return []
+        first_block = start // block_steps
+        last_block = (end - 1) // block_steps
+        # End offset of the block before the first one, then of each block read
+        entry = max(0, first_block - 1)
+        f.seek(_HEADER.size + entry * _OFFSET.size)
+        n = last_block - entry + 1
+        offsets = struct.unpack(f"<{n}Q", f.read(n * _OFFSET.size))
+    byte_start = offsets[0] if first_block > 0 else 0
+
+    with open(compacted_path(steps_path), "rb") as f:
+        f.seek(byte_start)
+        data = gzip.decompress(f.read(offsets[-1] - byte_start))
+
+    lines = data.splitlines()
+    skip = start - first_block * block_steps
+    return lines[skip:skip + (end - start)]
@@ -83,6 +83,24 @@ def format_duration(ms: int) -> str:
         return f"{minutes}m{seconds:.0f}s"
 
 
+def format_bytes(size: int) -> str:
+    """Format byte count
+
+    Args:
+        size: Size in bytes
+
+    Returns:
+        Formatted size string (e.g. "1.5MB")
+    """
+    if size < 1024:
+        return f"{size}B"
+    for unit in ("KB", "MB"):
+        size /= 1024
+        if size < 1024:
+            return f"{size:.1f}{unit}"
+    return f"{size / 1024:.1f}GB"
+
+
 def get_step_icon(step_type: StepType) -> str:
     """Get icon corresponding to step type
 
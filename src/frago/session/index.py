@@ -0,0 +1,605 @@
+"""
+Session Metadata Index
+
+SQLite (WAL) index of every session's metadata.json, stored next to the
+session directories as index.db. Session list queries filter, sort and
+page in SQL instead of opening and validating every metadata.json. The
+same database keeps the per-source-file checkpoints of session sync and
+an FTS5 full-text index of session steps (content, tool names, tool
+input summaries and project path), filled as steps are appended.
+
+The index is a cache of the files on disk: storage.write_metadata
+updates the row in the same transaction that writes the file, and the
+whole index is rebuilt from the session directories when the database is
+new, has an older schema, or on request (`rebuild`).
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from frago.session.blobs import load_step_content
+from frago.session.compaction import iter_step_lines
+from frago.session.models import (
+    AgentType,
+    MonitoredSession,
+    SessionStatus,
+    SessionStep,
+    StepSearchHit,
+)
+
+logger = logging.getLogger(__name__)
+
+# Index database file name (inside the session base directory)
+INDEX_FILENAME = "index.db"
+
+# Bumped whenever the schema changes; an older index is rebuilt from disk
+SCHEMA_VERSION = 3
+
+# Columns that list queries may sort by
+SORT_COLUMNS = ("last_activity", "started_at")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    agent_type TEXT NOT NULL,
+    session_id TEXT NOT NULL,
+    project_path TEXT NOT NULL,
+    status TEXT NOT NULL,
+    started_at TEXT NOT NULL,
+    last_activity TEXT NOT NULL,
+    step_count INTEGER NOT NULL,
+    tool_call_count INTEGER NOT NULL,
+    metadata TEXT NOT NULL,
+    PRIMARY KEY (agent_type, session_id)
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_activity
+    ON sessions (last_activity);
+CREATE INDEX IF NOT EXISTS idx_sessions_started
+    ON sessions (started_at);
+CREATE INDEX IF NOT EXISTS idx_sessions_agent_status
+    ON sessions (agent_type, status, last_activity);
+CREATE INDEX IF NOT EXISTS idx_sessions_status
+    ON sessions (status, last_activity);
+CREATE INDEX IF NOT EXISTS idx_sessions_project
+    ON sessions (project_path, last_activity);
+CREATE TABLE IF NOT EXISTS sync_checkpoints (
+    source_file TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS search_steps (
+    rowid INTEGER PRIMARY KEY,
+    agent_type TEXT NOT NULL,
+    session_id TEXT NOT NULL,
+    step_id INTEGER NOT NULL,
+    step_type TEXT NOT NULL,
+    timestamp TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_search_steps_session
+    ON search_steps (agent_type, session_id);
+CREATE VIRTUAL TABLE IF NOT EXISTS search_fts USING fts5(
+    content, tool_name, tool_input, project_path
+);
+"""
+
+
+def _sort_key(value: datetime) -> str:
+    """Timestamp as a UTC string that sorts chronologically (naive means UTC)"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")
+
+
+def _row_values(session: MonitoredSession, data: Dict[str, Any]) -> Tuple:
+    return (
+        session.agent_type.value,
+        session.session_id,
+        session.project_path,
+        session.status.value,
+        _sort_key(session.started_at),
+        _sort_key(session.last_activity),
+        session.step_count,
+        session.tool_call_count,
+        json.dumps(data, ensure_ascii=False),
+    )
+
+
+def _match_expression(query: str) -> str:
+    """Turn free text into an FTS5 query matching all of its words
+
+    Every word is quoted, so FTS5 operators and punctuation in the query
+    are searched for literally instead of raising syntax errors.
+    """
+    terms = ['"' + term.replace('"', '""') + '"' for term in query.split()]
+    return " ".join(terms)
+
+
+_UPSERT = (
+    "INSERT OR REPLACE INTO sessions (agent_type, session_id, project_path, status,"
+    " started_at, last_activity, step_count, tool_call_count, metadata)"
+    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+class SessionIndex:
+    """SQLite index of session metadata under one session base directory"""
+
+    def __init__(self, base_dir: Path):
+        """Initialize session index
+
+        Args:
+            base_dir: Session storage base directory
+        """
+        self.base_dir = base_dir
+        self.path = base_dir / INDEX_FILENAME
+        self._local = threading.local()
+        self._init_lock = threading.Lock()
+        self._ready = False
+
+    # ============================================================
+    # Connection Management
+    # ============================================================
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get this thread's connection, creating the schema on first use"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.base_dir.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=10.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+
+        if not self._ready:
+            with self._init_lock:
+                if not self._ready:
+                    self._initialize(conn)
+                    self._ready = True
+        return conn
+
+    def _initialize(self, conn: sqlite3.Connection) -> None:
+        """Create the schema, rebuilding from disk if the index is new or outdated"""
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version == SCHEMA_VERSION:
+            return
+        if version:
+            # Sync checkpoints keep their format, everything else is rebuilt
+            conn.execute("DROP TABLE IF EXISTS sessions")
+            conn.execute("DROP TABLE IF EXISTS search_steps")
+            conn.execute("DROP TABLE IF EXISTS search_fts")
+        conn.executescript(_SCHEMA)
+        count = self._rebuild(conn)
+        steps = self._rebuild_search(conn)
+        conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+        logger.info(
+            f"Built session index with {count} sessions and {steps} searchable steps: {self.path}"
+        )
+
+    def close(self) -> None:
+        """Close this thread's connection"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    # ============================================================
+    # Writes
+    # ============================================================
+
+    def write(
+        self, session: MonitoredSession, data: Dict[str, Any], persist: Callable[[], None]
+    ) -> None:
+        """Update a session's row and its metadata file in one transaction
+
+        The row is written first and committed only after persist() returns,
+        so a failed file write leaves the index unchanged.
+
+        Args:
+            session: Session being written
+            data: JSON-serializable metadata (session.model_dump(mode="json"))
+            persist: Writes metadata.json
+        """
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(_UPSERT, _row_values(session, data))
+            persist()
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def remove(self, session_id: str, agent_type: AgentType) -> None:
+        """Remove a session's row and its searchable steps"""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                "DELETE FROM sessions WHERE agent_type = ? AND session_id = ?",
+                (agent_type.value, session_id),
+            )
+            self._remove_steps(conn, session_id, agent_type)
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def index_steps(
+        self,
+        steps: List[SessionStep],
+        agent_type: AgentType,
+        project_path: Optional[str] = None,
+        tool_inputs: Optional[Dict[int, str]] = None,
+    ) -> None:
+        """Add appended steps of one session to the full-text index
+
+        Args:
+            steps: Steps of the same session
+            agent_type: Agent type
+            project_path: Session project path (looked up in the index if None)
+            tool_inputs: Step ID -> tool input summaries of its tool calls
+        """
+        if not steps:
+            return
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if project_path is None:
+                row = conn.execute(
+                    "SELECT project_path FROM sessions WHERE agent_type = ? AND session_id = ?",
+                    (agent_type.value, steps[0].session_id),
+                ).fetchone()
+                project_path = row[0] if row else ""
+            self._insert_steps(conn, steps, agent_type, project_path, tool_inputs or {})
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def remove_steps(self, session_id: str, agent_type: AgentType) -> None:
+        """Remove a session's steps from the full-text index"""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._remove_steps(conn, session_id, agent_type)
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    @staticmethod
+    def _insert_steps(
+        conn: sqlite3.Connection,
+        steps: List[SessionStep],
+        agent_type: AgentType,
+        project_path: str,
+        tool_inputs: Dict[int, str],
+    ) -> None:
+        for step in steps:
+            rowid = conn.execute(
+                "INSERT INTO search_steps (agent_type, session_id, step_id, step_type, timestamp)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (
+                    agent_type.value,
+                    step.session_id,
+                    step.step_id,
+                    step.type.value,
+                    _sort_key(step.timestamp),
+                ),
+            ).lastrowid
+            conn.execute(
+                "INSERT INTO search_fts (rowid, content, tool_name, tool_input, project_path)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (
+                    rowid,
+                    # Full text of contents moved to the blob store
+                    load_step_content(step),
+                    step.tool_name or "",
+                    tool_inputs.get(step.step_id, ""),
+                    project_path,
+                ),
+            )
+
+    @staticmethod
+    def _remove_steps(conn: sqlite3.Connection, session_id: str, agent_type: AgentType) -> None:
+        params = (agent_type.value, session_id)
+        conn.execute(
+            "DELETE FROM search_fts WHERE rowid IN"
+            " (SELECT rowid FROM search_steps WHERE agent_type = ? AND session_id = ?)",
+            params,
+        )
+        conn.execute(
+            "DELETE FROM search_steps WHERE agent_type = ? AND session_id = ?", params
+        )
+
+    def get_checkpoint(self, source_file: str) -> Optional[Dict[str, Any]]:
+        """Get the sync checkpoint of a source session file"""
+        row = self._connect().execute(
+            "SELECT data FROM sync_checkpoints WHERE source_file = ?", (source_file,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set_checkpoint(self, source_file: str, data: Dict[str, Any]) -> None:
+        """Store the sync checkpoint of a source session file"""
+        self._connect().execute(
+            "INSERT OR REPLACE INTO sync_checkpoints (source_file, data) VALUES (?, ?)",
+            (source_file, json.dumps(data, ensure_ascii=False)),
+        )
+
+    def rebuild(self) -> int:
+        """Rebuild the index from the metadata.json and steps.jsonl files on disk
+
+        Returns:
+            Number of indexed sessions
+        """
+        conn = self._connect()
+        with self._init_lock:
+            count = self._rebuild(conn)
+            self._rebuild_search(conn)
+            return count
+
+    def _rebuild(self, conn: sqlite3.Connection) -> int:
+        # Sync checkpoints are kept: sync falls back to a full parse for
+        # any checkpoint whose session no longer exists
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("DELETE FROM sessions")
+            count = 0
+            for session, data in scan_metadata(self.base_dir):
+                conn.execute(_UPSERT, _row_values(session, data))
+                count += 1
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        return count
+
+    def _rebuild_search(self, conn: sqlite3.Connection) -> int:
+        # Tool input summaries of multi-tool steps are only known while
+        # syncing, a rebuild indexes what steps.jsonl records
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("DELETE FROM search_steps")
+            conn.execute("DELETE FROM search_fts")
+            count = 0
+            rows = conn.execute(
+                "SELECT agent_type, session_id, project_path FROM sessions"
+            ).fetchall()
+            for agent_value, session_id, project_path in rows:
+                steps = list(
+                    _read_steps_file(self.base_dir / agent_value / session_id / "steps.jsonl")
+                )
+                self._insert_steps(conn, steps, AgentType(agent_value), project_path, {})
+                count += len(steps)
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        return count
+
+    # ============================================================
+    # Queries
+    # ============================================================
+
+    @staticmethod
+    def _where(
+        agent_type: Optional[AgentType],
+        status: Optional[SessionStatus],
+        project_path: Optional[str],
+        since: Optional[datetime],
+    ) -> Tuple[str, List[Any]]:
+        clauses: List[str] = []
+        params: List[Any] = []
+        if agent_type:
+            clauses.append("agent_type = ?")
+            params.append(agent_type.value)
+        if status:
+            clauses.append("status = ?")
+            params.append(status.value)
+        if project_path:
+            clauses.append("project_path = ?")
+            params.append(project_path)
+        if since:
+            clauses.append("last_activity >= ?")
+            params.append(_sort_key(since))
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def query(
+        self,
+        agent_type: Optional[AgentType] = None,
+        status: Optional[SessionStatus] = None,
+        project_path: Optional[str] = None,
+        since: Optional[datetime] = None,
+        limit: int = 20,
+        offset: int = 0,
+        order_by: str = "last_activity",
+    ) -> List[MonitoredSession]:
+        """Query sessions, newest first
+
+        Args:
+            agent_type: Filter by Agent type
+            status: Filter by status
+            project_path: Filter by project path
+            since: Only sessions active at or after this time
+            limit: Maximum number of sessions
+            offset: Number of sessions to skip
+            order_by: Sort column ("last_activity" or "started_at")
+
+        Returns:
+            Session list
+        """
+        if order_by not in SORT_COLUMNS:
+            raise ValueError(f"Unsupported sort column: {order_by}")
+        where, params = self._where(agent_type, status, project_path, since)
+        rows = self._connect().execute(
+            f"SELECT session_id, metadata FROM sessions{where}"
+            f" ORDER BY {order_by} DESC LIMIT ? OFFSET ?",
+            params + [limit, offset],
+        ).fetchall()
+
+        sessions = []
+        for session_id, metadata in rows:
+            try:
+                sessions.append(MonitoredSession.model_validate_json(metadata))
+            except ValueError as e:
+                logger.warning(f"Failed to read indexed session {session_id}: {e}")
+        return sessions
+
+    def count(
+        self,
+        agent_type: Optional[AgentType] = None,
+        status: Optional[SessionStatus] = None,
+        project_path: Optional[str] = None,
+        since: Optional[datetime] = None,
+    ) -> int:
+        """Count sessions matching the filters (see query)"""
+        where, params = self._where(agent_type, status, project_path, since)
+        return self._connect().execute(
+            f"SELECT COUNT(*) FROM sessions{where}", params
+        ).fetchone()[0]
+
+    def search(
+        self,
+        query: str,
+        agent_type: Optional[AgentType] = None,
+        status: Optional[SessionStatus] = None,
+        project_path: Optional[str] = None,
+        since: Optional[datetime] = None,
+        limit: int = 20,
+        offset: int = 0,
+        marks: Tuple[str, str] = ("**", "**"),
+    ) -> List[StepSearchHit]:
+        """Full-text search over session steps, best matches first
+
+        Args:
+            query: Words that must all appear in a step
+            agent_type: Filter by Agent type
+            status: Filter by session status
+            project_path: Filter by session project path
+            since: Only steps at or after this time
+            limit: Maximum number of hits
+            offset: Number of hits to skip
+            marks: Text placed before and after matched words in snippets
+
+        Returns:
+            Matching steps with snippets
+        """
+        match = _match_expression(query)
+        if not match:
+            return []
+
+        clauses = ["search_fts MATCH ?"]
+        params: List[Any] = [marks[0], marks[1], match]
+        if agent_type:
+            clauses.append("st.agent_type = ?")
+            params.append(agent_type.value)
+        if status:
+            clauses.append("s.status = ?")
+            params.append(status.value)
+        if project_path:
+            clauses.append("s.project_path = ?")
+            params.append(project_path)
+        if since:
+            clauses.append("st.timestamp >= ?")
+            params.append(_sort_key(since))
+
+        rows = self._connect().execute(
+            "SELECT st.agent_type, st.session_id, st.step_id, st.step_type, st.timestamp,"
+            " s.project_path, s.status, json_extract(s.metadata, '$.name'),"
+            " snippet(search_fts, -1, ?, ?, '...', 16), search_fts.rank"
+            " FROM search_fts"
+            " JOIN search_steps st ON st.rowid = search_fts.rowid"
+            " JOIN sessions s ON s.agent_type = st.agent_type AND s.session_id = st.session_id"
+            f" WHERE {' AND '.join(clauses)}"
+            " ORDER BY search_fts.rank LIMIT ? OFFSET ?",
+            params + [limit, offset],
+        ).fetchall()
+
+        return [
+            StepSearchHit(
+                agent_type=row[0],
+                session_id=row[1],
+                step_id=row[2],
+                step_type=row[3],
+                timestamp=datetime.strptime(row[4], "%Y-%m-%dT%H:%M:%S.%f").replace(
+                    tzinfo=timezone.utc
+                ),
+                project_path=row[5],
+                status=row[6],
+                session_name=row[7],
+                snippet=row[8],
+                rank=row[9],
+            )
+            for row in rows
+        ]
+
+
+def _read_steps_file(steps_path: Path) -> Iterator[SessionStep]:
+    """Read the steps of a steps.jsonl file (or its compacted form), skipping unreadable lines"""
+    for line in iter_step_lines(steps_path):
+        if not line.strip():
+            continue
+        try:
+            yield SessionStep.model_validate_json(line)
+        except ValueError as e:
+            logger.warning(f"Skipping unreadable step in {steps_path}: {e}")
+
+
+def scan_metadata(
+    base_dir: Path, agent_type: Optional[AgentType] = None
+) -> Iterator[Tuple[MonitoredSession, Dict[str, Any]]]:
+    """Read every metadata.json under the session base directory
+
+    Args:
+        base_dir: Session storage base directory
+        agent_type: Only scan this Agent type
+
+    Yields:
+        (session, raw metadata) for each readable metadata.json
+    """
+    if not base_dir.exists():
+        return
+
+    if agent_type:
+        agent_dirs = [base_dir / agent_type.value]
+    else:
+        agent_dirs = [d for d in base_dir.iterdir() if d.is_dir()]
+
+    for agent_dir in agent_dirs:
+        if not agent_dir.exists():
+            continue
+
+        for session_dir in agent_dir.iterdir():
+            metadata_path = session_dir / "metadata.json"
+            if not metadata_path.is_file():
+                continue
+
+            try:
+                with open(metadata_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                yield MonitoredSession.model_validate(data), data
+            except Exception as e:
+                logger.warning(f"Failed to read session {session_dir.name}: {e}")
+
+
+_indexes: Dict[Path, SessionIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_session_index(base_dir: Path) -> SessionIndex:
+    """Get the shared index of a session base directory
+
+    Args:
+        base_dir: Session storage base directory
+
+    Returns:
+        SessionIndex instance
+    """
+    index = _indexes.get(base_dir)
+    if index is None:
+        with _indexes_lock:
+            index = _indexes.setdefault(base_dir, SessionIndex(base_dir))
+    return index
@@ -4,6 +4,8 @@ Session Data Models
 Defines all data structures required for Agent session monitoring, including:
 - Enum types: AgentType, SessionStatus, StepType, ToolCallStatus
 - Core entities: MonitoredSession, SessionStep, ToolCallRecord, SessionSummary
+- Running counters: SessionStats
+- Search results: StepSearchHit
 """
 
 from datetime import datetime
@@ -83,6 +85,13 @@ class SessionStep(BaseModel):
     parent_uuid: Optional[str] = Field(None, description="UUID of the parent message")
     tool_call_id: Optional[str] = Field(None, description="Tool call ID for pairing tool_call and tool_result")
     tool_name: Optional[str] = Field(None, description="Tool name for tool_call steps")
+    is_error: bool = Field(default=False, description="Tool result reported an error")
+    content_blob: Optional[str] = Field(
+        None, description="Blob ID of the full content when content_summary is only a preview"
+    )
+    content_size: Optional[int] = Field(
+        None, ge=0, description="Full content size in bytes (set with content_blob)"
+    )
 
     class Config:
         json_encoders = {datetime: lambda v: v.isoformat()}
@@ -111,6 +120,60 @@ class ToolCallRecord(BaseModel):
         json_encoders = {datetime: lambda v: v.isoformat()}
 
 
+class SessionStats(BaseModel):
+    """Running session counters
+
+    Updated as steps are appended and stored with the session metadata,
+    so summaries and dashboards do not need to re-read steps.jsonl.
+    """
+
+    step_types: Dict[str, int] = Field(
+        default_factory=dict, description="Step count by step type"
+    )
+    tool_usage: Dict[str, int] = Field(
+        default_factory=dict, description="Tool call count by tool name"
+    )
+    tool_error_count: int = Field(default=0, ge=0, description="Tool results reporting an error")
+    first_step_at: Optional[datetime] = Field(None, description="Timestamp of the first step")
+    last_step_at: Optional[datetime] = Field(None, description="Timestamp of the latest step")
+
+    def add_step(
+        self, step: SessionStep, tool_calls: Optional[List[ToolCallRecord]] = None
+    ) -> None:
+        """Count an appended step
+
+        Args:
+            step: Appended step
+            tool_calls: Tool calls made by the step (all of them are counted
+                by name; without them the step's own tool_name is used)
+        """
+        self.step_types[step.type.value] = self.step_types.get(step.type.value, 0) + 1
+
+        if tool_calls:
+            names = [tc.tool_name for tc in tool_calls]
+        elif step.type == StepType.TOOL_CALL and step.tool_name:
+            names = [step.tool_name]
+        else:
+            names = []
+        for name in names:
+            self.tool_usage[name] = self.tool_usage.get(name, 0) + 1
+
+        if step.is_error:
+            self.tool_error_count += 1
+
+        if self.first_step_at is None or step.timestamp < self.first_step_at:
+            self.first_step_at = step.timestamp
+        if self.last_step_at is None or step.timestamp > self.last_step_at:
+            self.last_step_at = step.timestamp
+
+    def count(self, step_type: StepType) -> int:
+        """Number of steps of a type"""
+        return self.step_types.get(step_type.value, 0)
+
+    class Config:
+        json_encoders = {datetime: lambda v: v.isoformat()}
+
+
 class MonitoredSession(BaseModel):
     """Monitored session
 
@@ -134,6 +197,9 @@ class MonitoredSession(BaseModel):
         default=SessionSource.UNKNOWN,
         description="Session source (terminal/web/unknown)",
     )
+    stats: Optional[SessionStats] = Field(
+        None, description="Running step counters (None for sessions recorded before they existed)"
+    )
 
     class Config:
         json_encoders = {datetime: lambda v: v.isoformat()}
@@ -169,6 +235,27 @@ class SessionSummary(BaseModel):
         json_encoders = {datetime: lambda v: v.isoformat()}
 
 
+class StepSearchHit(BaseModel):
+    """Full-text search hit
+
+    A session step matching a search query.
+    """
+
+    session_id: str = Field(..., description="Session ID")
+    agent_type: AgentType = Field(..., description="Agent type identifier")
+    step_id: int = Field(..., ge=1, description="Step sequence number")
+    step_type: StepType = Field(..., description="Step type")
+    timestamp: datetime = Field(..., description="Step timestamp")
+    project_path: str = Field(..., description="Project absolute path")
+    session_name: Optional[str] = Field(None, description="Session name")
+    status: SessionStatus = Field(..., description="Session status")
+    snippet: str = Field(..., description="Matching text with the matched words marked")
+    rank: float = Field(..., description="FTS5 rank (lower is a better match)")
+
+    class Config:
+        json_encoders = {datetime: lambda v: v.isoformat()}
+
+
 # ============================================================
 # Helper Functions
 # ============================================================
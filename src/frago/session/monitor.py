@@ -24,6 +24,7 @@ from frago.session.models import (
     AgentType,
     MonitoredSession,
     SessionSource,
+    SessionStats,
     SessionStatus,
     SessionStep,
     SessionSummary,
@@ -37,6 +38,7 @@ from frago.session.parser import (
 )
 from frago.session.storage import (
     append_step,
+    compute_session_stats,
     generate_summary,
     update_metadata,
     write_metadata,
@@ -414,6 +416,7 @@ class SessionMonitor:
             started_at=self.start_time,
             last_activity=datetime.now(timezone.utc),
             source=self.source,
+            stats=SessionStats(),
         )
 
         # Persist
@@ -449,10 +452,16 @@ class SessionMonitor:
 
             # Update count
             self._session.step_count = self._step_id
+            if self._session.stats is None:
+                # Metadata written before stats existed (e.g. via watch_session)
+                self._session.stats = compute_session_stats(
+                    self._session.session_id, self.agent_type
+                )
+            self._session.stats.add_step(step, tool_calls)
 
             # Persist step
             if self.persist:
-                append_step(step, self.agent_type)
+                append_step(step, self.agent_type, self.project_path, tool_calls)
 
             # Output step
             if self._formatter:
@@ -489,6 +498,7 @@ class SessionMonitor:
                 step_count=self._session.step_count,
                 tool_call_count=self._session.tool_call_count,
                 last_activity=self._session.last_activity,
+                stats=self._session.stats,
             )
 
     def _finalize_session(
@@ -692,7 +702,7 @@ class ClaudeCodeAdapter(AgentAdapter):
         from frago.session.parser import IncrementalParser
 
         parser = IncrementalParser("")
-        return parser._parse_record(data)
+        return parser.parse_record(data)
 
 
 # Adapter registry
@@ -64,6 +64,89 @@ class ParsedRecord:
     raw_data: Dict[str, Any] = field(default_factory=dict)
 
 
+# ============================================================
+# Running File Statistics
+# ============================================================
+
+# Number of trailing record types kept for status inference
+TAIL_RECORD_TYPES = 10
+
+
+@dataclass
+class SessionFileStats:
+    """Running statistics of a session file
+
+    Updated record by record while a file is streamed, so callers get
+    everything they need about a session in one pass without keeping the
+    records in memory.
+    """
+
+    session_id: Optional[str] = None
+    is_sidechain: bool = False
+    first_timestamp: Optional[datetime] = None
+    last_timestamp: Optional[datetime] = None
+    record_count: int = 0  # Raw records seen
+    tool_call_count: int = 0
+    first_user_message: Optional[str] = None
+    tail_types: List[str] = field(default_factory=list)  # Types of the last records
+
+    def update(self, data: Dict[str, Any]) -> None:
+        """Fold one raw record into the statistics
+
+        Args:
+            data: Raw JSON record
+        """
+        self.record_count += 1
+
+        # Extract session_id
+        if not self.session_id:
+            self.session_id = data.get("sessionId")
+
+        # Check if this is a sidechain
+        if data.get("isSidechain"):
+            self.is_sidechain = True
+
+        self.tail_types.append(data.get("type") or "")
+        del self.tail_types[:-TAIL_RECORD_TYPES]
+
+        # Record timestamp
+        timestamp_str = data.get("timestamp")
+        if timestamp_str:
+            try:
+                ts = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
+                if not self.first_timestamp:
+                    self.first_timestamp = ts
+                self.last_timestamp = ts
+            except ValueError:
+                pass
+
+        # Count tool calls
+        message = data.get("message", {})
+        if isinstance(message, dict):
+            content = message.get("content", [])
+            if isinstance(content, list):
+                for block in content:
+                    if isinstance(block, dict) and block.get("type") == "tool_use":
+                        self.tool_call_count += 1
+
+        # Extract first real user message for session name
+        if self.first_user_message is None:
+            if data.get("type") == "user" and not data.get("isMeta"):
+                msg_content = message.get("content", "") if isinstance(message, dict) else ""
+                # Handle array content (e.g., with images)
+                if isinstance(msg_content, list):
+                    for block in msg_content:
+                        if isinstance(block, dict) and block.get("type") == "text":
+                            msg_content = block.get("text", "")
+                            break
+                    else:
+                        msg_content = ""
+                # Skip command messages
+                if isinstance(msg_content, str) and msg_content.strip():
+                    if not msg_content.strip().startswith("<"):
+                        self.first_user_message = msg_content.strip()
+
+
 # ============================================================
 # Incremental Parser
 # ============================================================
@@ -72,17 +155,27 @@ class ParsedRecord:
 class IncrementalParser:
     """JSONL incremental parser
 
-    Tracks file offset, parsing only new lines.
+    Tracks file offset, parsing only new complete lines. Records are
+    streamed one at a time, so memory stays bounded however large the
+    file is.
     """
 
-    def __init__(self, file_path: str):
+    def __init__(
+        self,
+        file_path: str,
+        offset: int = 0,
+        stats: Optional[SessionFileStats] = None,
+    ):
         """Initialize parser
 
         Args:
             file_path: JSONL file path
+            offset: Byte offset to resume from
+            stats: Running statistics to keep updating (e.g. restored from a checkpoint)
         """
         self.file_path = Path(file_path)
-        self.offset: int = 0  # Current file offset
+        self.offset: int = offset  # Byte offset after the last complete line read
+        self.stats = stats if stats is not None else SessionFileStats()
         self._session_id: Optional[str] = None  # Cached session ID
 
     @property
@@ -92,60 +185,99 @@ class IncrementalParser:
         Note: The first line of the file may be file-history-snapshot or other records without sessionId,
         need to read subsequent lines until sessionId is found.
         """
-        if self._session_id is None and self.file_path.exists():
-            try:
-                with open(self.file_path, "r", encoding="utf-8") as f:
-                    for _ in range(10):  # Read at most 10 lines
-                        line = f.readline().strip()
-                        if not line:
-                            break
-                        data = json.loads(line)
-                        session_id = data.get("sessionId")
-                        if session_id:
-                            self._session_id = session_id
-                            break
-            except Exception as e:
-                logger.warning(f"Unable to extract session_id from file: {e}")
+        if self._session_id is None:
+            self._session_id = self.stats.session_id or self.peek().session_id
         return self._session_id
 
-    def parse_new_records(self) -> List[ParsedRecord]:
-        """Parse records added since last time
+    def peek(self, max_lines: int = 10) -> SessionFileStats:
+        """Read statistics of the first lines without moving the offset
+
+        Args:
+            max_lines: Maximum number of lines to read
 
         Returns:
-            List of new records
+            Statistics of the file head (session ID, sidechain flag, ...)
+        """
+        head = SessionFileStats()
+        try:
+            with open(self.file_path, "rb") as f:
+                for _ in range(max_lines):
+                    line = f.readline()
+                    if not line.endswith(b"\n"):
+                        break
+                    try:
+                        data = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if isinstance(data, dict):
+                        head.update(data)
+                    if head.session_id:
+                        break
+        except OSError as e:
+            logger.warning(f"Unable to extract session_id from file: {e}")
+        return head
+
+    def iter_raw_records(self) -> Iterator[Dict[str, Any]]:
+        """Stream raw records of the complete lines added since last time
+
+        The offset advances past each line as it is yielded and the running
+        statistics are updated; a trailing line that is still being written
+        is left for the next call.
+
+        Yields:
+            Raw JSON records
         """
         if not self.file_path.exists():
-            return []
+            return
 
-        records = []
         try:
-            with open(self.file_path, "r", encoding="utf-8") as f:
+            with open(self.file_path, "rb") as f:
                 # Seek to last read position
                 f.seek(self.offset)
 
                 for line in f:
+                    if not line.endswith(b"\n"):
+                        break
+                    self.offset += len(line)
+
                     line = line.strip()
                     if not line:
                         continue
 
                     try:
                         data = json.loads(line)
-                        record = self._parse_record(data)
-                        if record:
-                            records.append(record)
                     except json.JSONDecodeError as e:
                         logger.warning(f"JSON parsing error: {e}")
                         continue
+                    if not isinstance(data, dict):
+                        continue
 
-                # Update offset
-                self.offset = f.tell()
+                    self.stats.update(data)
+                    yield data
 
-        except Exception as e:
+        except OSError as e:
             logger.error(f"Failed to read file: {e}")
 
-        return records
+    def iter_new_records(self) -> Iterator[ParsedRecord]:
+        """Stream parsed records added since last time
+
+        Yields:
+            New records
+        """
+        for data in self.iter_raw_records():
+            record = self.parse_record(data)
+            if record:
+                yield record
+
+    def parse_new_records(self) -> List[ParsedRecord]:
+        """Parse records added since last time
+
+        Returns:
+            List of new records
+        """
+        return list(self.iter_new_records())
 
-    def _parse_record(self, data: Dict[str, Any]) -> Optional[ParsedRecord]:
+    def parse_record(self, data: Dict[str, Any]) -> Optional[ParsedRecord]:
         """Parse a single record
 
         Uses defensive parsing strategy:
@@ -264,6 +396,7 @@ def record_to_step(
     # Determine step type and extract tool info
     tool_call_id = None
     tool_name = None
+    is_error = False
 
     if record.record_type == "user":
         if record.tool_results:
@@ -273,6 +406,7 @@ def record_to_step(
             # Extract tool_use_id for pairing with tool_call
             if record.tool_results:
                 tool_call_id = record.tool_results[0].get("tool_use_id")
+            is_error = any(r.get("is_error") for r in record.tool_results)
         else:
             step_type = StepType.USER_MESSAGE
             content = truncate_content(record.content_text or "(empty message)")
@@ -321,6 +455,7 @@ def record_to_step(
         parent_uuid=record.parent_uuid,
         tool_call_id=tool_call_id,
         tool_name=tool_name,
+        is_error=is_error,
     )
 
     return step, tool_records
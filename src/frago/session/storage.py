@@ -4,25 +4,45 @@ Session Data Persistence Storage
 Provides local storage capabilities for session data, including:
 - Session directory creation and management
 - metadata.json read/write
-- steps.jsonl append write
+- steps.jsonl append write (with a steps.idx offset index for paged reads)
+- Compaction of idle sessions' steps (see compaction.py)
+- Large step contents moved into the blob store (see blobs.py)
 - summary.json generation
-- Session list queries
+- Session list queries and step full-text search (served by the SQLite index in index.py)
 """
 
 import json
 import logging
 import os
-from collections import Counter
-from datetime import datetime
+import re
+import sqlite3
+import struct
+import zlib
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from frago.compat import file_lock
+from frago.session.blobs import externalize_step, sweep_blobs
+from frago.session.compaction import (
+    compact_steps_file,
+    compacted_path,
+    count_compacted_steps,
+    expand_steps_file,
+    is_compacted,
+    iter_step_lines,
+    read_compacted_lines,
+    remove_compacted,
+)
+from frago.session.index import SessionIndex, get_session_index, scan_metadata
 from frago.session.models import (
     AgentType,
     MonitoredSession,
+    SessionStats,
     SessionStatus,
     SessionStep,
     SessionSummary,
+    StepSearchHit,
     StepType,
     ToolCallRecord,
     ToolCallStatus,
@@ -31,6 +51,9 @@ from frago.session.models import (
 
 logger = logging.getLogger(__name__)
 
+# content_blob field of a step line (json.dumps default separators)
+_CONTENT_BLOB = re.compile(rb'"content_blob": "([0-9a-f]{64})"')
+
 # Default storage directory
 DEFAULT_SESSION_DIR = Path.home() / ".frago" / "sessions"
 
@@ -49,6 +72,24 @@ def get_session_base_dir() -> Path:
     return DEFAULT_SESSION_DIR
 
 
+def get_index() -> SessionIndex:
+    """Get the metadata index of the current session base directory
+
+    Returns:
+        SessionIndex instance
+    """
+    return get_session_index(get_session_base_dir())
+
+
+def rebuild_index() -> int:
+    """Rebuild the session index and step search from the files on disk
+
+    Returns:
+        Number of indexed sessions
+    """
+    return get_index().rebuild()
+
+
 # ============================================================
 # Session Directory Management
 # ============================================================
@@ -107,8 +148,16 @@ def write_metadata(session: MonitoredSession) -> Path:
 
     data = session.model_dump(mode="json")
 
-    with open(metadata_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    def persist() -> None:
+        with open(metadata_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+    # The index row commits only once the file is written
+    try:
+        get_index().write(session, data, persist)
+    except sqlite3.Error as e:
+        logger.warning(f"Session index unavailable, wrote metadata file only: {e}")
+        persist()
 
     logger.debug(f"Wrote metadata: {metadata_path}")
     return metadata_path
@@ -169,17 +218,239 @@ def update_metadata(
     return session
 
 
+# ============================================================
+# Sync Checkpoints
+# ============================================================
+
+
+def read_sync_checkpoint(source_file: str) -> Optional[Dict[str, Any]]:
+    """Read the sync checkpoint of a source session file
+
+    Args:
+        source_file: Source session file path
+
+    Returns:
+        Checkpoint data, None if there is none (or the index is unavailable)
+    """
+    try:
+        return get_index().get_checkpoint(source_file)
+    except (sqlite3.Error, ValueError) as e:
+        logger.warning(f"Failed to read sync checkpoint: {e}")
+        return None
+
+
+def write_sync_checkpoint(source_file: str, data: Dict[str, Any]) -> None:
+    """Write the sync checkpoint of a source session file
+
+    Args:
+        source_file: Source session file path
+        data: JSON-serializable checkpoint data
+    """
+    try:
+        get_index().set_checkpoint(source_file, data)
+    except sqlite3.Error as e:
+        logger.warning(f"Failed to write sync checkpoint: {e}")
+
+
 # ============================================================
 # steps.jsonl Append Write
 # ============================================================
 
 
-def append_step(step: SessionStep, agent_type: AgentType = AgentType.CLAUDE) -> Path:
+# Offset index next to steps.jsonl: one little-endian uint64 per step,
+# the byte offset where that step's line ends. The index is valid when
+# its last entry equals the size of steps.jsonl; otherwise it is rebuilt
+# by scanning the file once.
+STEP_INDEX_FILENAME = "steps.idx"
+_OFFSET = struct.Struct("<Q")
+
+
+def _step_index_path(steps_path: Path) -> Path:
+    return steps_path.with_name(STEP_INDEX_FILENAME)
+
+
+def _last_indexed_offset(index_path: Path) -> Optional[int]:
+    """End offset of the last indexed step (0 if no index, None if corrupt)"""
+    try:
+        with open(index_path, "rb") as f:
+            size = f.seek(0, os.SEEK_END)
+            if size % _OFFSET.size:
+                return None
+            if size == 0:
+                return 0
+            f.seek(size - _OFFSET.size)
+            return _OFFSET.unpack(f.read(_OFFSET.size))[0]
+    except FileNotFoundError:
+        return 0
+
+
+def _steps_lock_path(steps_path: Path) -> Path:
+    return steps_path.with_name(f"{steps_path.name}.lock")
+
+
+def _append_lines(steps_path: Path, lines: List[bytes]) -> None:
+    """Append encoded step lines to steps.jsonl and extend its offset index
+
+    Holds the session's steps lock, so appends never race a compaction.
+    """
+    with file_lock(_steps_lock_path(steps_path)):
+        if compacted_path(steps_path).exists():
+            # Resumed after compaction: append to the restored plain file
+            if steps_path.exists():
+                remove_compacted(steps_path)
+            else:
+                expand_steps_file(steps_path)
+
+        with open(steps_path, "ab") as f:
+            start = f.seek(0, os.SEEK_END)
+            f.write(b"".join(lines))
+
+        index_path = _step_index_path(steps_path)
+        ends = []
+        position = start
+        for line in lines:
+            position += len(line)
+            ends.append(position)
+
+        try:
+            if start == 0:
+                mode = "wb"
+            elif _last_indexed_offset(index_path) == start:
+                mode = "ab"
+            else:
+                # Index does not cover the existing steps, rebuilt on next paged read
+                index_path.unlink(missing_ok=True)
+                return
+            with open(index_path, mode) as f:
+                f.write(struct.pack(f"<{len(ends)}Q", *ends))
+        except OSError as e:
+            logger.warning(f"Failed to update step index {index_path}: {e}")
+
+
+def rebuild_step_index(steps_path: Path) -> int:
+    """Rebuild the offset index of a steps.jsonl file
+
+    Blank lines are attributed to the step before them, so every indexed
+    byte range holds exactly one record.
+
+    Args:
+        steps_path: steps.jsonl file path
+
+    Returns:
+        Number of indexed steps
+    """
+    ends: List[int] = []
+    position = 0
+    with open(steps_path, "rb") as f:
+        for line in f:
+            position += len(line)
+            if line.strip():
+                ends.append(position)
+            elif ends:
+                ends[-1] = position
+
+    index_path = _step_index_path(steps_path)
+    temp_path = index_path.with_name(f"{STEP_INDEX_FILENAME}.{os.getpid()}.tmp")
+    try:
+        with open(temp_path, "wb") as f:
+            f.write(struct.pack(f"<{len(ends)}Q", *ends))
+        os.replace(temp_path, index_path)
+    except OSError as e:
+        logger.warning(f"Failed to write step index {index_path}: {e}")
+    logger.debug(f"Rebuilt step index ({len(ends)} steps): {index_path}")
+    return len(ends)
+
+
+def _count_indexed_steps(steps_path: Path) -> int:
+    """Number of steps in steps.jsonl, rebuilding a missing or stale index"""
+    size = steps_path.stat().st_size
+    index_path = _step_index_path(steps_path)
+    try:
+        index_size = index_path.stat().st_size
+    except FileNotFoundError:
+        index_size = 0
+
+    if size and index_size and _last_indexed_offset(index_path) == size:
+        return index_size // _OFFSET.size
+    if not size:
+        return 0
+    return rebuild_step_index(steps_path)
+
+
+def _read_indexed_lines(steps_path: Path, start: int, end: int) -> List[bytes]:
+    """Read the lines of steps [start, end) using the offset index (see _count_indexed_steps)"""
+    if start >= end:
+        return []
+
+    first = max(0, start - 1)
+    with open(_step_index_path(steps_path), "rb") as f:
+        f.seek(first * _OFFSET.size)
+        count = end - first
+        offsets = struct.unpack(f"<{count}Q", f.read(count * _OFFSET.size))
+    byte_start = offsets[0] if start > 0 else 0
+
+    with open(steps_path, "rb") as f:
+        f.seek(byte_start)
+        data = f.read(offsets[-1] - byte_start)
+    return data.splitlines()
+
+
+def _count_steps(steps_path: Path) -> int:
+    """Number of steps of a session, plain or compacted"""
+    if is_compacted(steps_path):
+        return count_compacted_steps(steps_path)
+    return _count_indexed_steps(steps_path)
+
+
+def _read_step_range(steps_path: Path, start: int, end: int) -> List[SessionStep]:
+    """Decode steps [start, end) of a session, plain or compacted"""
+    if is_compacted(steps_path):
+        lines = read_compacted_lines(steps_path, start, end)
+    else:
+        lines = _read_indexed_lines(steps_path, start, end)
+
+    steps = []
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            steps.append(SessionStep.model_validate_json(line))
+        except ValueError as e:
+            logger.warning(f"Skipping unreadable step record in {steps_path}: {e}")
+    return steps
+
+
+def _index_steps(
+    steps: List[SessionStep],
+    agent_type: AgentType,
+    project_path: Optional[str],
+    tool_calls: Optional[List[ToolCallRecord]],
+) -> None:
+    """Add appended steps to the full-text search index"""
+    tool_inputs: Dict[int, str] = {}
+    for tc in tool_calls or []:
+        summary = f"{tc.tool_name} {tc.input_summary}"
+        previous = tool_inputs.get(tc.step_id)
+        tool_inputs[tc.step_id] = f"{previous}\n{summary}" if previous else summary
+    try:
+        get_index().index_steps(steps, agent_type, project_path, tool_inputs)
+    except sqlite3.Error as e:
+        logger.warning(f"Failed to index steps for search: {e}")
+
+
+def append_step(
+    step: SessionStep,
+    agent_type: AgentType = AgentType.CLAUDE,
+    project_path: Optional[str] = None,
+    tool_calls: Optional[List[ToolCallRecord]] = None,
+) -> Path:
     """Append write step record
 
     Args:
         step: Session step object
         agent_type: Agent type
+        project_path: Session project path for search (looked up if None)
+        tool_calls: Tool calls made by the step, indexed for search
 
     Returns:
         steps.jsonl file path
@@ -187,46 +458,109 @@ def append_step(step: SessionStep, agent_type: AgentType = AgentType.CLAUDE) ->
     session_dir = create_session_dir(step.session_id, agent_type)
     steps_path = session_dir / "steps.jsonl"
 
-    data = step.model_dump(mode="json")
-    line = json.dumps(data, ensure_ascii=False)
+    # Large contents go to the blob store, search indexes them in full
+    data = externalize_step(step).model_dump(mode="json")
+    line = json.dumps(data, ensure_ascii=False) + "\n"
 
-    with open(steps_path, "a", encoding="utf-8") as f:
-        f.write(line + "\n")
+    _append_lines(steps_path, [line.encode("utf-8")])
+    _index_steps([step], agent_type, project_path, tool_calls)
 
     logger.debug(f"Appended step {step.step_id}: {steps_path}")
     return steps_path
 
 
-def read_steps(
+def append_steps(
+    steps: List[SessionStep],
+    agent_type: AgentType = AgentType.CLAUDE,
+    project_path: Optional[str] = None,
+    tool_calls: Optional[List[ToolCallRecord]] = None,
+) -> Optional[Path]:
+    """Append several step records of one session with a single write
+
+    Args:
+        steps: Step records of the same session, in order
+        agent_type: Agent type
+        project_path: Session project path for search (looked up if None)
+        tool_calls: Tool calls made by the steps, indexed for search
+
+    Returns:
+        steps.jsonl file path, None if there was nothing to write
+    """
+    if not steps:
+        return None
+
+    session_dir = create_session_dir(steps[0].session_id, agent_type)
+    steps_path = session_dir / "steps.jsonl"
+
+    # Large contents go to the blob store, search indexes them in full
+    lines = [
+        (
+            json.dumps(externalize_step(step).model_dump(mode="json"), ensure_ascii=False) + "\n"
+        ).encode("utf-8")
+        for step in steps
+    ]
+
+    _append_lines(steps_path, lines)
+    _index_steps(steps, agent_type, project_path, tool_calls)
+
+    logger.debug(f"Appended steps {steps[0].step_id}-{steps[-1].step_id}: {steps_path}")
+    return steps_path
+
+
+def clear_steps(session_id: str, agent_type: AgentType = AgentType.CLAUDE) -> None:
+    """Remove a session's step records (plain or compacted) and search entries
+
+    Args:
+        session_id: Session ID
+        agent_type: Agent type
+    """
+    steps_path = get_session_dir(session_id, agent_type) / "steps.jsonl"
+    steps_path.unlink(missing_ok=True)
+    _step_index_path(steps_path).unlink(missing_ok=True)
+    remove_compacted(steps_path)
+    try:
+        get_index().remove_steps(session_id, agent_type)
+    except sqlite3.Error as e:
+        logger.warning(f"Failed to remove steps from search index: {e}")
+
+
+def iter_steps(
     session_id: str, agent_type: AgentType = AgentType.CLAUDE
-) -> List[SessionStep]:
-    """Read all step records
+) -> Iterator[SessionStep]:
+    """Stream step records one at a time
 
     Args:
         session_id: Session ID
         agent_type: Agent type
 
-    Returns:
-        List of step records
+    Yields:
+        Step records in order
     """
     session_dir = get_session_dir(session_id, agent_type)
     steps_path = session_dir / "steps.jsonl"
 
-    if not steps_path.exists():
-        return []
-
-    steps = []
     try:
-        with open(steps_path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    data = json.loads(line)
-                    steps.append(SessionStep.model_validate(data))
+        for line in iter_step_lines(steps_path):
+            line = line.strip()
+            if line:
+                yield SessionStep.model_validate_json(line)
     except Exception as e:
         logger.warning(f"Failed to read step records: {e}")
 
-    return steps
+
+def read_steps(
+    session_id: str, agent_type: AgentType = AgentType.CLAUDE
+) -> List[SessionStep]:
+    """Read all step records
+
+    Args:
+        session_id: Session ID
+        agent_type: Agent type
+
+    Returns:
+        List of step records
+    """
+    return list(iter_steps(session_id, agent_type))
 
 
 # ============================================================
@@ -234,6 +568,26 @@ def read_steps(
 # ============================================================
 
 
+def compute_session_stats(
+    session_id: str, agent_type: AgentType = AgentType.CLAUDE
+) -> SessionStats:
+    """Count a session's steps.jsonl into running counters
+
+    Only needed for sessions whose metadata predates SessionStats.
+
+    Args:
+        session_id: Session ID
+        agent_type: Agent type
+
+    Returns:
+        Counters of all recorded steps
+    """
+    stats = SessionStats()
+    for step in iter_steps(session_id, agent_type):
+        stats.add_step(step)
+    return stats
+
+
 def generate_summary(
     session_id: str,
     agent_type: AgentType = AgentType.CLAUDE,
@@ -253,34 +607,38 @@ def generate_summary(
     if not session:
         return None
 
-    steps = read_steps(session_id, agent_type)
+    # Counters kept in metadata; older sessions without them are counted from steps
+    stats = session.stats or compute_session_stats(session_id, agent_type)
 
     # Count messages
-    user_count = sum(1 for s in steps if s.type == StepType.USER_MESSAGE)
-    assistant_count = sum(1 for s in steps if s.type == StepType.ASSISTANT_MESSAGE)
+    user_count = stats.count(StepType.USER_MESSAGE)
+    assistant_count = stats.count(StepType.ASSISTANT_MESSAGE)
 
     # Count tool calls
     tool_call_count = 0
     tool_success_count = 0
     tool_error_count = 0
-    tool_usage: Counter = Counter()
+    tool_usage: Dict[str, int] = {}
 
     if tool_calls:
         for tc in tool_calls:
             tool_call_count += 1
-            tool_usage[tc.tool_name] += 1
+            tool_usage[tc.tool_name] = tool_usage.get(tc.tool_name, 0) + 1
             if tc.status == ToolCallStatus.SUCCESS:
                 tool_success_count += 1
             elif tc.status == ToolCallStatus.ERROR:
                 tool_error_count += 1
     else:
-        # Estimate from steps
-        tool_call_count = sum(1 for s in steps if s.type == StepType.TOOL_CALL)
+        # Estimate from step counters
+        tool_usage = stats.tool_usage
+        tool_call_count = sum(tool_usage.values()) or stats.count(StepType.TOOL_CALL)
+        tool_error_count = stats.tool_error_count
+        tool_success_count = max(0, stats.count(StepType.TOOL_RESULT) - tool_error_count)
 
     # Calculate most used tools
     most_used = [
         ToolUsageStats(tool_name=name, count=count)
-        for name, count in tool_usage.most_common(5)
+        for name, count in sorted(tool_usage.items(), key=lambda item: -item[1])[:5]
     ]
 
     # Calculate duration (ensure non-negative, as timestamps in file may not be strictly ordered)
@@ -394,15 +752,20 @@ def read_steps_paginated(
     limit = max(1, min(10000, limit))
     offset = max(0, offset)
 
-    all_steps = read_steps(session_id, agent_type)
-    total = len(all_steps)
+    # Only the requested slice is decoded, located through steps.idx
+    # (or the block index of compacted steps)
+    steps_path = get_session_dir(session_id, agent_type) / "steps.jsonl"
+    try:
+        total = _count_steps(steps_path)
+    except FileNotFoundError:
+        total = 0
 
     if from_end:
         # Read from end: offset=0 gets the latest `limit` steps
         # Steps are returned in reverse order (newest first)
         start = max(0, total - offset - limit)
-        end = total - offset
-        steps = all_steps[start:end]
+        end = max(0, total - offset)
+        steps = _read_step_range(steps_path, start, end)
         steps.reverse()  # Newest first
         return {
             "steps": steps,
@@ -414,7 +777,7 @@ def read_steps_paginated(
     else:
         # Original logic: read from beginning
         return {
-            "steps": all_steps[offset : offset + limit],
+            "steps": _read_step_range(steps_path, offset, min(total, offset + limit)),
             "total": total,
             "offset": offset,
             "limit": limit,
@@ -425,61 +788,70 @@ def read_steps_paginated(
 def count_sessions(
     agent_type: Optional[AgentType] = None,
     status: Optional[SessionStatus] = None,
+    project_path: Optional[str] = None,
+    since: Optional[datetime] = None,
 ) -> int:
     """Count sessions
 
     Args:
         agent_type: Filter by specific Agent type, None for all
         status: Filter by specific status
+        project_path: Filter by project path
+        since: Only count sessions active at or after this time
 
     Returns:
         Session count
     """
-    base_dir = get_session_base_dir()
-
-    if not base_dir.exists():
-        return 0
-
-    count = 0
-
-    # Determine agent directories to search
-    if agent_type:
-        agent_dirs = [base_dir / agent_type.value]
-    else:
-        agent_dirs = [d for d in base_dir.iterdir() if d.is_dir()]
-
-    for agent_dir in agent_dirs:
-        if not agent_dir.exists():
-            continue
+    try:
+        return get_index().count(agent_type, status, project_path, since)
+    except sqlite3.Error as e:
+        logger.warning(f"Session index unavailable, scanning session directories: {e}")
 
-        for session_dir in agent_dir.iterdir():
-            if not session_dir.is_dir():
-                continue
+    return len(_scan_sessions(agent_type, status, project_path, since))
 
-            metadata_path = session_dir / "metadata.json"
-            if not metadata_path.exists():
-                continue
 
-            # If status filtering needed, read metadata
-            if status:
-                try:
-                    with open(metadata_path, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-                    session_status = SessionStatus(data.get("status", "running"))
-                    if session_status != status:
-                        continue
-                except Exception:
-                    continue
+def search_steps(
+    query: str,
+    agent_type: Optional[AgentType] = None,
+    status: Optional[SessionStatus] = None,
+    project_path: Optional[str] = None,
+    since: Optional[datetime] = None,
+    limit: int = 20,
+    offset: int = 0,
+    marks: Tuple[str, str] = ("**", "**"),
+) -> List[StepSearchHit]:
+    """Full-text search over session steps, best matches first
 
-            count += 1
+    Args:
+        query: Words that must all appear in a step
+        agent_type: Filter by specific Agent type, None for all
+        status: Filter by session status
+        project_path: Filter by project path
+        since: Only steps at or after this time
+        limit: Maximum number of hits
+        offset: Number of hits to skip
+        marks: Text placed before and after matched words in snippets
 
-    return count
+    Returns:
+        Matching steps with snippets, empty if the index is unavailable
+    """
+    try:
+        return get_index().search(
+            query, agent_type, status, project_path, since, limit, offset, marks
+        )
+    except sqlite3.Error as e:
+        logger.warning(f"Step search failed: {e}")
+        return []
 
 
 def list_sessions(
     agent_type: Optional[AgentType] = None,
     limit: int = 20,
     status: Optional[SessionStatus] = None,
+    offset: int = 0,
+    project_path: Optional[str] = None,
+    since: Optional[datetime] = None,
+    order_by: str = "last_activity",
 ) -> List[MonitoredSession]:
     """List sessions
 
@@ -487,58 +859,61 @@ def list_sessions(
         agent_type: Filter by specific Agent type, None for all
         limit: Return count limit
         status: Filter by specific status
+        offset: Number of sessions to skip
+        project_path: Filter by project path
+        since: Only list sessions active at or after this time
+        order_by: Sort field, "last_activity" or "started_at"
 
     Returns:
-        Session list, sorted by last activity time descending
+        Session list, sorted by order_by descending
     """
-    base_dir = get_session_base_dir()
-
-    if not base_dir.exists():
-        return []
-
-    sessions = []
-
-    # Determine agent directories to search
-    if agent_type:
-        agent_dirs = [base_dir / agent_type.value]
-    else:
-        agent_dirs = [d for d in base_dir.iterdir() if d.is_dir()]
-
-    for agent_dir in agent_dirs:
-        if not agent_dir.exists():
-            continue
-
-        for session_dir in agent_dir.iterdir():
-            if not session_dir.is_dir():
-                continue
-
-            metadata_path = session_dir / "metadata.json"
-            if not metadata_path.exists():
-                continue
-
-            try:
-                with open(metadata_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                session = MonitoredSession.model_validate(data)
+    limit = max(0, limit)
+    offset = max(0, offset)
 
-                # Status filtering
-                if status and session.status != status:
-                    continue
+    try:
+        return get_index().query(
+            agent_type, status, project_path, since, limit, offset, order_by
+        )
+    except sqlite3.Error as e:
+        logger.warning(f"Session index unavailable, scanning session directories: {e}")
 
-                sessions.append(session)
-            except Exception as e:
-                logger.warning(f"Failed to read session {session_dir.name}: {e}")
+    sessions = _scan_sessions(agent_type, status, project_path, since)
 
-    # Sort by last activity time descending (normalize to UTC timezone for comparison)
-    from datetime import timezone
+    # Sort descending (normalize to UTC timezone for comparison)
     def get_sortable_time(s):
-        t = s.last_activity
+        t = getattr(s, order_by)
         if t.tzinfo is None:
             t = t.replace(tzinfo=timezone.utc)
         return t
     sessions.sort(key=get_sortable_time, reverse=True)
 
-    return sessions[:limit]
+    return sessions[offset : offset + limit]
+
+
+def _scan_sessions(
+    agent_type: Optional[AgentType],
+    status: Optional[SessionStatus],
+    project_path: Optional[str],
+    since: Optional[datetime],
+) -> List[MonitoredSession]:
+    """Filter sessions by reading every metadata.json (fallback without the index)"""
+    if since is not None and since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+
+    sessions = []
+    for session, _ in scan_metadata(get_session_base_dir(), agent_type):
+        if status and session.status != status:
+            continue
+        if project_path and session.project_path != project_path:
+            continue
+        if since is not None:
+            last_activity = session.last_activity
+            if last_activity.tzinfo is None:
+                last_activity = last_activity.replace(tzinfo=timezone.utc)
+            if last_activity < since:
+                continue
+        sessions.append(session)
+    return sessions
 
 
 def get_session_data(
@@ -585,6 +960,10 @@ def delete_session(
 
     try:
         shutil.rmtree(session_dir)
+        try:
+            get_index().remove(session_id, agent_type)
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to remove session from index: {e}")
         logger.info(f"Deleted session: {session_id}")
         return True
     except Exception as e:
@@ -617,4 +996,102 @@ def clean_old_sessions(
                 cleaned += 1
 
     logger.info(f"Cleaned {cleaned} expired sessions")
+    if cleaned:
+        sweep_unreferenced_blobs()
     return cleaned
+
+
+def sweep_unreferenced_blobs() -> Dict[str, int]:
+    """Remove blobs that no step of any remaining session refers to
+
+    Mark and sweep: collects the content_blob IDs of every session's steps
+    (plain or compacted), then removes the other blobs. Nothing is removed
+    if a session's steps cannot be read.
+
+    Returns:
+        Counts: blobs, bytes_reclaimed
+    """
+    report = {"blobs": 0, "bytes_reclaimed": 0}
+    referenced: Set[str] = set()
+    base_dir = get_session_base_dir()
+    try:
+        for steps_dir in base_dir.glob("*/*"):
+            for line in iter_step_lines(steps_dir / "steps.jsonl"):
+                match = _CONTENT_BLOB.search(line)
+                if match:
+                    referenced.add(match.group(1).decode("ascii"))
+    except (OSError, EOFError, zlib.error) as e:
+        logger.warning(f"Failed to collect blob references, skipping sweep: {e}")
+        return report
+
+    report["blobs"], report["bytes_reclaimed"] = sweep_blobs(referenced)
+    logger.info(
+        f"Swept {report['blobs']} unreferenced blobs, reclaimed {report['bytes_reclaimed']} bytes"
+    )
+    return report
+
+
+def compact_idle_sessions(
+    idle_days: int = 30,
+    agent_type: Optional[AgentType] = None,
+    dry_run: bool = False,
+) -> Dict[str, int]:
+    """Compact the steps of sessions idle for more than idle_days
+
+    Running sessions are skipped. Compacted steps stay readable through
+    iter_steps/read_steps/read_steps_paginated and are restored to a plain
+    steps.jsonl if the session is appended to again.
+
+    Args:
+        idle_days: Minimum days since last activity
+        agent_type: Filter by specific Agent type
+        dry_run: Only count the sessions and bytes that would be compacted
+
+    Returns:
+        Counts: sessions, bytes_before, bytes_after, bytes_reclaimed
+    """
+    from datetime import timedelta
+
+    cutoff = datetime.now(timezone.utc) - timedelta(days=idle_days)
+    # Sessions are sorted newest first: skip the ones active since the cutoff
+    offset = count_sessions(agent_type=agent_type, since=cutoff)
+
+    report = {"sessions": 0, "bytes_before": 0, "bytes_after": 0, "bytes_reclaimed": 0}
+    while True:
+        sessions = list_sessions(agent_type=agent_type, limit=500, offset=offset)
+        if not sessions:
+            break
+        offset += len(sessions)
+
+        for session in sessions:
+            if session.status == SessionStatus.RUNNING:
+                continue
+            steps_path = get_session_dir(session.session_id, session.agent_type) / "steps.jsonl"
+            if not steps_path.exists():
+                continue
+
+            index_path = _step_index_path(steps_path)
+            try:
+                before = steps_path.stat().st_size
+                if index_path.exists():
+                    before += index_path.stat().st_size
+                after = 0
+                if not dry_run:
+                    # Appends take the same lock: no step lands between read and unlink
+                    with file_lock(_steps_lock_path(steps_path)):
+                        _, after = compact_steps_file(steps_path)
+                        index_path.unlink(missing_ok=True)
+            except OSError as e:
+                logger.warning(f"Failed to compact session {session.session_id}: {e}")
+                continue
+
+            report["sessions"] += 1
+            report["bytes_before"] += before
+            report["bytes_after"] += after
+
+    if not dry_run:
+        report["bytes_reclaimed"] = report["bytes_before"] - report["bytes_after"]
+    logger.info(
+        f"Compacted {report['sessions']} idle sessions, reclaimed {report['bytes_reclaimed']} bytes"
+    )
+    return report
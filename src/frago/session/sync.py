@@ -5,29 +5,43 @@ Synchronizes session data from ~/.claude/projects/ to ~/.frago/sessions/claude/
 Supports idempotent operations, does not modify source files.
 """
 
-import json
 import logging
+import multiprocessing
 import os
+import threading
 import uuid as uuid_module
-from dataclasses import dataclass, field
+import zlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from frago.session.models import (
     AgentType,
     MonitoredSession,
+    SessionStats,
     SessionStatus,
     SessionStep,
     StepType,
+    ToolCallRecord,
+)
+from frago.session.parser import (
+    TAIL_RECORD_TYPES,
+    IncrementalParser,
+    SessionFileStats,
+    record_to_step,
 )
-from frago.session.parser import IncrementalParser, record_to_step
 from frago.session.storage import (
-    append_step,
+    append_steps,
+    clear_steps,
+    compute_session_stats,
     get_session_dir,
     read_metadata,
+    read_sync_checkpoint,
     write_metadata,
     write_summary,
+    write_sync_checkpoint,
 )
 
 logger = logging.getLogger(__name__)
@@ -38,6 +52,18 @@ CLAUDE_PROJECTS_DIR = Path.home() / ".claude" / "projects"
 # Inactivity timeout (used to determine if session has ended)
 INACTIVITY_TIMEOUT_MINUTES = 1
 
+# Steps buffered before they are appended to steps.jsonl
+STEP_BATCH_SIZE = 200
+
+# Batches smaller than this are synced in-process
+PARALLEL_MIN_FILES = 64
+
+# Most files handed to a sync worker at once
+SYNC_CHUNK_SIZE = 32
+
+# Per-session sync locks, picked by hash of the session ID
+_SESSION_LOCKS = [threading.Lock() for _ in range(64)]
+
 
 @dataclass
 class SyncResult:
@@ -48,6 +74,13 @@ class SyncResult:
     skipped: int = 0  # Number of skipped sessions (already exists with no changes)
     errors: List[str] = field(default_factory=list)  # Error messages
 
+    def merge(self, other: "SyncResult") -> None:
+        """Add another result's counts and errors to this one"""
+        self.synced += other.synced
+        self.updated += other.updated
+        self.skipped += other.skipped
+        self.errors.extend(other.errors)
+
 
 def encode_project_path(project_path: str) -> str:
     """Encode project path as Claude Code directory name
@@ -122,25 +155,23 @@ def is_main_session_file(filename: str) -> bool:
 
 
 def infer_session_status(
-    records: List[Dict[str, Any]], last_activity: datetime
+    record_types: List[str], last_activity: datetime
 ) -> SessionStatus:
     """Infer session status from records
 
     Args:
-        records: Raw record list
+        record_types: Types of the last records in the file (oldest first)
         last_activity: Last activity time
 
     Returns:
         Inferred session status
     """
-    if not records:
+    if not record_types:
         return SessionStatus.RUNNING
 
     # Check for termination markers (such as summary type)
-    for record in reversed(records[-10:]):  # Only check last few records
-        record_type = record.get("type")
-        if record_type == "summary":
-            return SessionStatus.COMPLETED
+    if "summary" in record_types[-TAIL_RECORD_TYPES:]:
+        return SessionStatus.COMPLETED
 
     # Check last activity time
     now = datetime.now(timezone.utc)
@@ -155,95 +186,65 @@ def infer_session_status(
     return SessionStatus.RUNNING
 
 
-def parse_session_file(jsonl_path: Path) -> Dict[str, Any]:
-    """Parse session JSONL file
+# ============================================================
+# Sync Checkpoints
+# ============================================================
+
+
+@dataclass
+class SyncCheckpoint(SessionFileStats):
+    """Sync position and running statistics of one Claude session file
+
+    Persisted after each sync so the next sync only parses bytes appended
+    since. A checkpoint is discarded (full re-parse) when the file was
+    replaced (different inode) or truncated below the synced offset.
+    """
+
+    inode: int = 0
+    size: int = 0  # File size when last synced
+    offset: int = 0  # Byte offset after the last complete line parsed
+    step_count: int = 0  # Parsed records so far (next step_id - 1)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        for key in ("first_timestamp", "last_timestamp"):
+            if data[key] is not None:
+                data[key] = data[key].isoformat()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SyncCheckpoint":
+        data = dict(data)
+        for key in ("first_timestamp", "last_timestamp"):
+            if data.get(key):
+                data[key] = datetime.fromisoformat(data[key])
+        return cls(**data)
+
+
+def load_checkpoint(jsonl_path: Path, stat: os.stat_result) -> Optional[SyncCheckpoint]:
+    """Load the checkpoint of a session file if it still describes the file
 
     Args:
         jsonl_path: JSONL file path
+        stat: Current stat of the file
 
     Returns:
-        Dictionary containing session_id, records, steps, metadata
+        Valid checkpoint, None if there is none or the file was replaced/truncated
     """
-    result = {
-        "session_id": None,
-        "records": [],
-        "first_timestamp": None,
-        "last_timestamp": None,
-        "step_count": 0,
-        "tool_call_count": 0,
-        "is_sidechain": False,
-        "first_user_message": None,
-    }
+    data = read_sync_checkpoint(str(jsonl_path))
+    if not data:
+        return None
 
     try:
-        with open(jsonl_path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-
-                try:
-                    record = json.loads(line)
-                    result["records"].append(record)
-
-                    # Extract session_id
-                    if not result["session_id"]:
-                        result["session_id"] = record.get("sessionId")
-
-                    # Check if this is a sidechain
-                    if record.get("isSidechain"):
-                        result["is_sidechain"] = True
-
-                    # Record timestamp
-                    timestamp_str = record.get("timestamp")
-                    if timestamp_str:
-                        try:
-                            ts = datetime.fromisoformat(
-                                timestamp_str.replace("Z", "+00:00")
-                            )
-                            if not result["first_timestamp"]:
-                                result["first_timestamp"] = ts
-                            result["last_timestamp"] = ts
-                        except ValueError:
-                            pass
-
-                    # Count tool calls
-                    message = record.get("message", {})
-                    if isinstance(message, dict):
-                        content = message.get("content", [])
-                        if isinstance(content, list):
-                            for block in content:
-                                if isinstance(block, dict):
-                                    if block.get("type") == "tool_use":
-                                        result["tool_call_count"] += 1
-
-                    # Extract first real user message for session name
-                    if result["first_user_message"] is None:
-                        if (
-                            record.get("type") == "user"
-                            and not record.get("isMeta")
-                        ):
-                            msg_content = message.get("content", "") if isinstance(message, dict) else ""
-                            # Handle array content (e.g., with images)
-                            if isinstance(msg_content, list):
-                                for block in msg_content:
-                                    if isinstance(block, dict) and block.get("type") == "text":
-                                        msg_content = block.get("text", "")
-                                        break
-                                else:
-                                    msg_content = ""
-                            # Skip command messages
-                            if isinstance(msg_content, str) and msg_content.strip():
-                                if not msg_content.strip().startswith("<"):
-                                    result["first_user_message"] = msg_content.strip()
-
-                except json.JSONDecodeError:
-                    continue
-
-    except Exception as e:
-        logger.warning(f"Failed to parse file {jsonl_path}: {e}")
+        checkpoint = SyncCheckpoint.from_dict(data)
+    except (TypeError, ValueError) as e:
+        logger.debug(f"Discarding unreadable checkpoint of {jsonl_path}: {e}")
+        return None
 
-    return result
+    if checkpoint.inode != stat.st_ino or stat.st_size < checkpoint.offset:
+        logger.debug(f"Session file replaced or truncated, re-parsing: {jsonl_path}")
+        return None
+    return checkpoint
 
 
 def sync_session(
@@ -253,6 +254,12 @@ def sync_session(
 ) -> Optional[str]:
     """Synchronize a single session file
 
+    Streams only the lines appended since the file's last sync checkpoint,
+    appending new steps as they are parsed, and rebuilds the metadata from
+    the checkpoint's running statistics. Memory use does not grow with the
+    size of the file. Concurrent calls for the same session (from sync
+    workers or the sync service) run one at a time.
+
     Args:
         jsonl_path: JSONL file path
         project_path: Project path
@@ -261,51 +268,129 @@ def sync_session(
     Returns:
         Synced session_id, None on failure
     """
+    with _session_lock(jsonl_path.stem):
+        return _sync_session(jsonl_path, project_path, force)
+
+
+def _session_lock(session_id: str) -> threading.Lock:
+    """Lock serializing the sync of one session (striped, fixed memory)"""
+    return _SESSION_LOCKS[zlib.crc32(session_id.encode("utf-8")) % len(_SESSION_LOCKS)]
+
+
+def _sync_session(jsonl_path: Path, project_path: str, force: bool) -> Optional[str]:
+    stat = jsonl_path.stat()
+
     # Skip empty files (e.g., placeholder files created by Claude CLI resume)
-    if jsonl_path.stat().st_size == 0:
+    if stat.st_size == 0:
         logger.debug(f"Skipping empty file: {jsonl_path}")
         return None
 
-    # Parse session file
-    parsed = parse_session_file(jsonl_path)
+    checkpoint = None if force else load_checkpoint(jsonl_path, stat)
+    existing = None
+    if checkpoint:
+        if checkpoint.is_sidechain:
+            return None
+        existing = read_metadata(checkpoint.session_id, AgentType.CLAUDE)
+        if existing is None:
+            # Session data was deleted, import the file again
+            checkpoint = None
+        elif stat.st_size == checkpoint.size and existing.status != SessionStatus.RUNNING:
+            logger.debug(f"Session already exists and no updates: {checkpoint.session_id}")
+            return None
+
+    resumed = checkpoint is not None
+    if checkpoint is None:
+        checkpoint = SyncCheckpoint(inode=stat.st_ino)
+    parser = IncrementalParser(str(jsonl_path), offset=checkpoint.offset, stats=checkpoint)
+
+    if not resumed:
+        head = parser.peek()
+        session_id = head.session_id
+        if not session_id:
+            logger.debug(f"File missing session_id: {jsonl_path}")
+            return None
+
+        # Skip sidechain sessions
+        if head.is_sidechain:
+            logger.debug(f"Skipping sidechain session: {session_id}")
+            checkpoint.session_id = session_id
+            checkpoint.is_sidechain = True
+            checkpoint.size = checkpoint.offset = stat.st_size
+            write_sync_checkpoint(str(jsonl_path), checkpoint.to_dict())
+            return None
+
+        # Check if already exists
+        existing = read_metadata(session_id, AgentType.CLAUDE)
+        if existing and not force:
+            # Check if source file has updates (supports resumed conversation scenario)
+            file_mtime = datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc)
+            existing_last_activity = existing.last_activity
+            if existing_last_activity.tzinfo is None:
+                existing_last_activity = existing_last_activity.replace(tzinfo=timezone.utc)
+
+            # If file modification time is earlier than recorded last activity time, skip
+            if file_mtime <= existing_last_activity:
+                if existing.status != SessionStatus.RUNNING:
+                    logger.debug(f"Session already exists and no updates: {session_id}")
+                    return None
+    else:
+        session_id = checkpoint.session_id
 
-    session_id = parsed["session_id"]
-    if not session_id:
-        logger.debug(f"File missing session_id: {jsonl_path}")
-        return None
+    # Get existing step count (steps already written before an interrupted sync are skipped)
+    existing_step_count = existing.step_count if existing else 0
+
+    # If forcing sync, clear existing steps file
+    if force and existing_step_count > 0:
+        clear_steps(session_id, AgentType.CLAUDE)
+        existing_step_count = 0
+
+    # Running counters continue from the metadata (counted once for older sessions)
+    if force or not existing:
+        stats = SessionStats()
+    elif existing.stats is not None:
+        stats = existing.stats
+    else:
+        stats = compute_session_stats(session_id, AgentType.CLAUDE)
+
+    # Stream new records into steps, numbering on from the checkpoint
+    step_id = checkpoint.step_count
+    new_steps = 0
+    batch: List[SessionStep] = []
+    batch_tool_calls: List[ToolCallRecord] = []
+    for record in parser.iter_new_records():
+        step_id += 1
+        # Skip already synced steps
+        if step_id <= existing_step_count:
+            continue
+        step, tool_calls = record_to_step(record, step_id)
+        if step:
+            step.session_id = session_id
+            stats.add_step(step, tool_calls)
+            batch.append(step)
+            batch_tool_calls.extend(tool_calls)
+            new_steps += 1
+            if len(batch) >= STEP_BATCH_SIZE:
+                append_steps(batch, AgentType.CLAUDE, project_path, batch_tool_calls)
+                batch = []
+                batch_tool_calls = []
+    append_steps(batch, AgentType.CLAUDE, project_path, batch_tool_calls)
+
+    checkpoint.step_count = step_id
+    checkpoint.offset = parser.offset
+    checkpoint.size = stat.st_size
 
     # Skip sessions with no valid records
-    if not parsed["records"]:
+    if not checkpoint.record_count:
         logger.debug(f"Skipping session with no records: {jsonl_path}")
         return None
 
-    # Skip sidechain sessions
-    if parsed["is_sidechain"]:
-        logger.debug(f"Skipping sidechain session: {session_id}")
-        return None
-
-    # Check if already exists
-    existing = read_metadata(session_id, AgentType.CLAUDE)
-    if existing and not force:
-        # Check if source file has updates (supports resumed conversation scenario)
-        file_mtime = datetime.fromtimestamp(jsonl_path.stat().st_mtime, tz=timezone.utc)
-        existing_last_activity = existing.last_activity
-        if existing_last_activity.tzinfo is None:
-            existing_last_activity = existing_last_activity.replace(tzinfo=timezone.utc)
-
-        # If file modification time is earlier than recorded last activity time, skip
-        if file_mtime <= existing_last_activity:
-            if existing.status != SessionStatus.RUNNING:
-                logger.debug(f"Session already exists and no updates: {session_id}")
-                return None
-
     # Infer status
-    last_activity = parsed["last_timestamp"] or datetime.now(timezone.utc)
-    status = infer_session_status(parsed["records"], last_activity)
+    last_activity = checkpoint.last_timestamp or datetime.now(timezone.utc)
+    status = infer_session_status(checkpoint.tail_types, last_activity)
 
     # Extract session name from first user message (truncate to 100 chars)
     session_name = None
-    first_msg = parsed.get("first_user_message")
+    first_msg = checkpoint.first_user_message
     if first_msg:
         # Take first line and truncate
         first_line = first_msg.split("\n")[0].strip()
@@ -328,71 +413,199 @@ def sync_session(
         project_path=project_path,
         name=session_name,
         source_file=str(jsonl_path),
-        started_at=parsed["first_timestamp"] or datetime.now(timezone.utc),
+        started_at=checkpoint.first_timestamp or datetime.now(timezone.utc),
         ended_at=last_activity if status != SessionStatus.RUNNING else None,
         status=status,
-        step_count=0,  # Updated later
-        tool_call_count=parsed["tool_call_count"],
+        step_count=step_id,
+        tool_call_count=checkpoint.tool_call_count,
         last_activity=last_activity,
+        stats=stats,
     )
 
-    # Get existing step count (for incremental sync)
-    existing_step_count = existing.step_count if existing else 0
-
-    # If forcing sync, clear existing steps file
-    if force and existing_step_count > 0:
-        from frago.session.storage import get_session_dir
-        steps_file = get_session_dir(session_id, AgentType.CLAUDE) / "steps.jsonl"
-        if steps_file.exists():
-            steps_file.unlink()
-        existing_step_count = 0
-
-    # Use incremental parser to parse steps
-    parser = IncrementalParser(str(jsonl_path))
-    records = parser.parse_new_records()
-
-    # Convert to steps (skip already synced)
-    step_id = 0
-    new_steps = 0
-    for record in records:
-        step_id += 1
-        # Skip already synced steps
-        if step_id <= existing_step_count:
-            continue
-        step, _ = record_to_step(record, step_id)
-        if step:
-            step.session_id = session_id
-            append_step(step, AgentType.CLAUDE)
-            new_steps += 1
-
-    session.step_count = step_id
-
-    # Write metadata
+    # Write metadata, then the checkpoint covering what it describes
     write_metadata(session)
+    write_sync_checkpoint(str(jsonl_path), checkpoint.to_dict())
 
     # If completed, generate summary
     if status == SessionStatus.COMPLETED:
         write_summary(session_id, AgentType.CLAUDE)
 
-    logger.info(f"Synced session: {session_id} (steps={step_id}, status={status.value})")
+    logger.info(
+        f"Synced session: {session_id} (steps={step_id}, new={new_steps}, status={status.value})"
+    )
     return session_id
 
 
-def sync_project_sessions(
-    project_path: str,
-    force: bool = False,
+def _sync_file(jsonl_file: Path, project_path: str, force: bool) -> SyncResult:
+    """Sync one session file, reporting the outcome as a SyncResult"""
+    result = SyncResult()
+    try:
+        # Check if already synced (for statistics only, actual check is done by sync_session)
+        session_id = jsonl_file.stem
+        existing = (get_session_dir(session_id, AgentType.CLAUDE) / "metadata.json").exists()
+
+        # Sync session (sync_session will check file modification time to decide if update is needed)
+        synced_id = sync_session(jsonl_file, project_path, force)
+        if synced_id:
+            if existing:
+                result.updated += 1
+            else:
+                result.synced += 1
+        else:
+            result.skipped += 1
+
+    except Exception as e:
+        error_msg = f"Sync failed {jsonl_file.name}: {e}"
+        logger.warning(error_msg)
+        result.errors.append(error_msg)
+    return result
+
+
+def default_sync_workers() -> int:
+    """Default number of sync worker processes
+
+    Can be set with the FRAGO_SYNC_WORKERS environment variable.
+
+    Returns:
+        Worker count
+    """
+    try:
+        return max(1, int(os.environ["FRAGO_SYNC_WORKERS"]))
+    except (KeyError, ValueError):
+        return min(8, os.cpu_count() or 1)
+
+
+def _sync_chunk(files: List[Tuple[Path, str]], force: bool) -> SyncResult:
+    """Sync a chunk of files in order (runs in a worker process)"""
+    result = SyncResult()
+    for jsonl_file, project_path in files:
+        result.merge(_sync_file(jsonl_file, project_path, force))
+    return result
+
+
+def _chunk_by_session(
+    files: List[Tuple[Path, str]], chunk_size: int
+) -> List[List[Tuple[Path, str]]]:
+    """Split files into chunks, keeping all files of a session in one chunk
+
+    Files are ordered largest first so a few big sessions do not finish last.
+    """
+    by_session: Dict[str, List[Tuple[Path, str]]] = {}
+    sizes: Dict[str, int] = {}
+    for item in files:
+        session_id = item[0].stem
+        by_session.setdefault(session_id, []).append(item)
+        sizes[session_id] = sizes.get(session_id, 0) + _file_size(item[0])
+
+    chunks: List[List[Tuple[Path, str]]] = []
+    chunk: List[Tuple[Path, str]] = []
+    for session_id in sorted(by_session, key=sizes.__getitem__, reverse=True):
+        chunk.extend(by_session[session_id])
+        if len(chunk) >= chunk_size:
+            chunks.append(chunk)
+            chunk = []
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def _file_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+def _sync_many(
+    files: List[Tuple[Path, str]],
+    force: bool,
+    workers: Optional[int],
+    progress: Optional[Callable[[int, int], None]],
 ) -> SyncResult:
-    """Synchronize Claude sessions for a specified project
+    """Sync (file, project path) pairs, with a process pool for large batches
+
+    Parsing is CPU-bound, so large batches are spread over worker
+    processes. Each session's files go to a single chunk, so no session is
+    written by two workers at once.
 
     Args:
-        project_path: Project absolute path
+        files: Session files and their project paths
         force: Whether to force re-synchronization
+        workers: Worker processes, None for default_sync_workers()
+        progress: Called with (done, total) as files finish
 
     Returns:
         Synchronization result
     """
     result = SyncResult()
+    total = len(files)
+    workers = min(workers or default_sync_workers(), total)
+
+    if workers <= 1 or total < PARALLEL_MIN_FILES:
+        for done, (jsonl_file, project_path) in enumerate(files, 1):
+            result.merge(_sync_file(jsonl_file, project_path, force))
+            if progress:
+                progress(done, total)
+        return result
 
+    chunk_size = max(1, min(SYNC_CHUNK_SIZE, total // (workers * 4)))
+    chunks = _chunk_by_session(files, chunk_size)
+
+    # Spawned (not forked) workers: callers such as the server are multi-threaded
+    done = 0
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        futures = {executor.submit(_sync_chunk, chunk, force): chunk for chunk in chunks}
+        for future in as_completed(futures):
+            chunk = futures[future]
+            try:
+                result.merge(future.result())
+            except Exception as e:
+                error_msg = f"Sync worker failed on {len(chunk)} files: {e}"
+                logger.warning(error_msg)
+                result.errors.append(error_msg)
+            done += len(chunk)
+            if progress:
+                progress(done, total)
+    return result
+
+
+def sync_files(
+    paths: Iterable[Path],
+    force: bool = False,
+    workers: Optional[int] = None,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> SyncResult:
+    """Synchronize specific Claude session files
+
+    Used for files reported by filesystem events. Paths that are not main
+    session files directly inside a project directory of
+    ~/.claude/projects/, or that no longer exist, are ignored.
+
+    Args:
+        paths: JSONL file paths
+        force: Whether to force re-synchronization
+        workers: Worker processes, None for default_sync_workers()
+        progress: Called with (done, total) as files finish
+
+    Returns:
+        Synchronization result
+    """
+    files = []
+    for jsonl_file in paths:
+        jsonl_file = Path(jsonl_file)
+        if jsonl_file.parent.parent != CLAUDE_PROJECTS_DIR:
+            continue
+        if not is_main_session_file(jsonl_file.name) or not jsonl_file.exists():
+            continue
+        project_path = os.path.abspath(decode_project_path(jsonl_file.parent.name))
+        files.append((jsonl_file, project_path))
+
+    return _sync_many(files, force, workers, progress)
+
+
+def _project_files(project_path: str) -> List[Tuple[Path, str]]:
+    """Main session files of a project with the project's absolute path"""
     # Encode project path
     project_path = os.path.abspath(project_path)
     encoded_path = encode_project_path(project_path)
@@ -400,32 +613,33 @@ def sync_project_sessions(
 
     if not claude_dir.exists():
         logger.debug(f"Claude session directory does not exist: {claude_dir}")
-        return result
+        return []
 
-    # Scan all JSONL files
-    for jsonl_file in claude_dir.glob("*.jsonl"):
-        if not is_main_session_file(jsonl_file.name):
-            continue
+    return [
+        (jsonl_file, project_path)
+        for jsonl_file in claude_dir.glob("*.jsonl")
+        if is_main_session_file(jsonl_file.name)
+    ]
 
-        try:
-            # Check if already synced (for statistics only, actual check is done by sync_session)
-            session_id = jsonl_file.stem
-            existing = read_metadata(session_id, AgentType.CLAUDE)
-
-            # Sync session (sync_session will check file modification time to decide if update is needed)
-            synced_id = sync_session(jsonl_file, project_path, force)
-            if synced_id:
-                if existing:
-                    result.updated += 1
-                else:
-                    result.synced += 1
-            else:
-                result.skipped += 1
 
-        except Exception as e:
-            error_msg = f"Sync failed {jsonl_file.name}: {e}"
-            logger.warning(error_msg)
-            result.errors.append(error_msg)
+def sync_project_sessions(
+    project_path: str,
+    force: bool = False,
+    workers: Optional[int] = None,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> SyncResult:
+    """Synchronize Claude sessions for a specified project
+
+    Args:
+        project_path: Project absolute path
+        force: Whether to force re-synchronization
+        workers: Worker processes, None for default_sync_workers()
+        progress: Called with (done, total) as files finish
+
+    Returns:
+        Synchronization result
+    """
+    result = _sync_many(_project_files(project_path), force, workers, progress)
 
     logger.info(
         f"Sync complete: synced={result.synced}, updated={result.updated}, "
@@ -434,35 +648,40 @@ def sync_project_sessions(
     return result
 
 
-def sync_all_projects(force: bool = False) -> SyncResult:
+def sync_all_projects(
+    force: bool = False,
+    workers: Optional[int] = None,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> SyncResult:
     """Synchronize Claude sessions for all projects
 
+    Files of all projects are synced by one worker pool.
+
     Args:
         force: Whether to force re-synchronization
+        workers: Worker processes, None for default_sync_workers()
+        progress: Called with (done, total) as files finish
 
     Returns:
         Synchronization result
     """
-    result = SyncResult()
-
     if not CLAUDE_PROJECTS_DIR.exists():
         # When installing Claude Code for the first time, directory not existing is normal, use debug level
         logger.debug(f"Claude project directory does not exist: {CLAUDE_PROJECTS_DIR}")
-        return result
+        return SyncResult()
 
+    files: List[Tuple[Path, str]] = []
     for project_dir in CLAUDE_PROJECTS_DIR.iterdir():
         if not project_dir.is_dir():
             continue
 
         # Decode project path (supports Windows and Unix)
-        project_path = decode_project_path(project_dir.name)
-
-        # Sync this project
-        project_result = sync_project_sessions(project_path, force)
+        files.extend(_project_files(decode_project_path(project_dir.name)))
 
-        result.synced += project_result.synced
-        result.updated += project_result.updated
-        result.skipped += project_result.skipped
-        result.errors.extend(project_result.errors)
+    result = _sync_many(files, force, workers, progress)
 
+    logger.info(
+        f"Sync complete: synced={result.synced}, updated={result.updated}, "
+        f"skipped={result.skipped}, errors={len(result.errors)}"
+    )
     return result
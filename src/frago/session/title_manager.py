@@ -159,18 +159,14 @@ class TitleManager:
     ) -> Optional[str]:
         """Extract first 5000 chars of session content."""
         try:
-            from frago.session.storage import read_steps
+            from frago.session.storage import iter_steps
 
-            steps = read_steps(session_id, agent_type)
-            if not steps:
-                return None
-
-            # Collect content from steps
+            # Collect content from steps, reading only as far as needed
             content_parts = []
             total_chars = 0
             max_chars = 5000
 
-            for step in steps:
+            for step in iter_steps(session_id, agent_type):
                 text = step.content_summary or ""
                 if total_chars + len(text) > max_chars:
                     remaining = max_chars - total_chars
@@ -179,6 +175,8 @@ class TitleManager:
                 content_parts.append(text)
                 total_chars += len(text)
 
+            if not content_parts:
+                return None
             return "\n".join(content_parts)
         except Exception as e:
             logger.warning(f"Failed to get session content: {e}")
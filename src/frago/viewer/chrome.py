@@ -114,7 +114,7 @@ class ChromeViewer:
         try:
             session.connect()
             # Create new tab with the URL
-            session.target.create_target(url)
+            session.target.create_target(url, owner="viewer", ttl=0, detached=True)
         finally:
             session.disconnect()
 